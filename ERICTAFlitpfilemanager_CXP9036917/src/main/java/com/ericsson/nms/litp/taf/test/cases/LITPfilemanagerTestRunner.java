@@ -1,13 +1,20 @@
 package com.ericsson.nms.litp.taf.test.cases;
 
+import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.TreeMap;
 import java.io.*;
 
 import org.apache.log4j.Logger;
 import org.testng.SkipException;
 import org.testng.annotations.Test;
 
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonParseException;
+import com.google.gson.JsonParser;
+
 import com.ericsson.cifwk.taf.*;
 import com.ericsson.cifwk.taf.annotations.*;
 import com.ericsson.cifwk.taf.tools.cli.TimeoutException;
@@ -23,6 +30,27 @@ public class LITPfilemanagerTestRunner extends TorTestCaseHelper {
     
     Logger logger = Logger.getLogger(LITPfilemanagerTestRunner.class);
 
+    /**
+     * Tab separated step timings written by the python tests, one
+     * "classname, name, summary" line per test. Only read if this property
+     * is set, to the absolute path the python tests are given in
+     * FILEMANAGER_STEP_TIMINGS.
+     */
+    private static final String STEP_TIMINGS_PROPERTY = "filemanager.step.timings";
+    private static Map<String, String> stepTimings;
+
+    /**
+     * One JSON record per test appended by the python tests as soon as the
+     * test finishes, followed while the tests run. Only followed if this
+     * property is set, to the absolute path the python tests are given in
+     * FILEMANAGER_RESULT_STREAM. The python tests write the file on the
+     * host they run on, usually the MS: only set the property when that
+     * path is also readable from the TAF host, e.g. a shared mount, else
+     * the stream stays empty and a warning is logged once the tests ran.
+     */
+    private static final String RESULT_STREAM_PROPERTY = "filemanager.result.stream";
+    private static final long RESULT_STREAM_POLL_MILLIS = 1000;
+
     @Inject
     private RPMUpgrade rpmUpgradeOperator;
     
@@ -56,10 +84,27 @@ public class LITPfilemanagerTestRunner extends TorTestCaseHelper {
     public void runERIClitpfilemanagerTests() {
 
     	pythonTestRunnerOperator.initialise();
+        deleteOutputFile(getOutputFile(STEP_TIMINGS_PROPERTY));
 
+        File resultStream = getOutputFile(RESULT_STREAM_PROPERTY);
+        if (resultStream == null) {
+            assertEquals(0, pythonTestRunnerOperator.execute());
+            return;
+        }
+        deleteOutputFile(resultStream);
+        ResultStreamFollower follower = new ResultStreamFollower(resultStream);
+        Thread followerThread = new Thread(follower, "filemanager-result-stream");
+        followerThread.setDaemon(true);
+        followerThread.start();
+        int exitCode;
+        try {
+            exitCode = pythonTestRunnerOperator.execute();
+        } finally {
+            follower.stop(followerThread);
+        }
+        logger.info("Python test results: " + follower.getOutcomeCounts());
 
-
-        assertEquals(0, pythonTestRunnerOperator.execute());
+        assertEquals(0, exitCode);
     }
 
     /**
@@ -80,7 +125,13 @@ public class LITPfilemanagerTestRunner extends TorTestCaseHelper {
         logger.debug("    classname:" + className);
         logger.debug("    name:" + name);
         setTestcase(className + ":" + name, "");
-        setTestInfo(name);
+        String timings = getStepTimings().get(className + ":" + name);
+        if (timings != null) {
+            logger.info("    step timings:" + timings);
+            setTestInfo(name + " | " + timings);
+        } else {
+            setTestInfo(name);
+        }
         for (Map<String, String> failure : failures) {
             fail(failure.get("type") + failure.get("message") + failure.get("text"));
         }
@@ -94,4 +145,206 @@ public class LITPfilemanagerTestRunner extends TorTestCaseHelper {
             }
         }
     }
-} 
+
+    /**
+     * Returns the file named by a system property, null if the property is
+     * not set or is not an absolute path, as the python tests run in
+     * another working directory
+     * @param property name of the system property
+     * @return file shared with the python tests
+     */
+    private static File getOutputFile(String property) {
+        String path = System.getProperty(property);
+        if (path == null || path.isEmpty()) {
+            return null;
+        }
+        File file = new File(path);
+        if (!file.isAbsolute()) {
+            Logger.getLogger(LITPfilemanagerTestRunner.class).warn(
+                    property + " must be an absolute path, ignoring " + path);
+            return null;
+        }
+        return file;
+    }
+
+    /**
+     * Deletes a file left by a previous run, so that the python tests of
+     * this run append to an empty one
+     * @param file file shared with the python tests, may be null
+     */
+    private static void deleteOutputFile(File file) {
+        if (file != null && file.isFile() && !file.delete()) {
+            Logger.getLogger(LITPfilemanagerTestRunner.class).warn("Could not delete " + file);
+        }
+    }
+
+    /**
+     * Reads the step timings of every test once, an empty map if the python
+     * tests did not write any
+     * @return step summary keyed by "classname:name"
+     */
+    private static synchronized Map<String, String> getStepTimings() {
+        if (stepTimings != null) {
+            return stepTimings;
+        }
+        stepTimings = new HashMap<String, String>();
+        File file = getOutputFile(STEP_TIMINGS_PROPERTY);
+        if (file == null || !file.isFile()) {
+            return stepTimings;
+        }
+        try (BufferedReader reader = new BufferedReader(new FileReader(file))) {
+            String line;
+            while ((line = reader.readLine()) != null) {
+                String[] fields = line.split("\t", 3);
+                if (fields.length == 3) {
+                    stepTimings.put(fields[0] + ":" + fields[1], fields[2]);
+                }
+            }
+        } catch (IOException e) {
+            Logger.getLogger(LITPfilemanagerTestRunner.class).warn("Could not read step timings from " + file, e);
+        }
+        return stepTimings;
+    }
+
+    /**
+     * Reports the result of each python test as soon as it is appended to
+     * the result stream. Only the records appended since it was created are
+     * read, a few bytes at a time, and only a count of each outcome is kept.
+     * Each record is decoded once its whole line has been read, so that a
+     * read never splits a multibyte character. A record that cannot be
+     * parsed is logged and skipped, so one bad line never stops the
+     * follower.
+     */
+    private static class ResultStreamFollower implements Runnable {
+
+        private final Logger logger = Logger.getLogger(ResultStreamFollower.class);
+        private final File file;
+        private final Map<String, Integer> outcomeCounts = new TreeMap<String, Integer>();
+        private final ByteArrayOutputStream pending = new ByteArrayOutputStream();
+        private final JsonParser parser = new JsonParser();
+        private long offset;
+        private boolean seen;
+        private volatile boolean running = true;
+
+        ResultStreamFollower(File file) {
+            this.file = file;
+            this.offset = file.length();
+        }
+
+        @Override
+        public void run() {
+            try {
+                while (running) {
+                    try {
+                        readNewRecords();
+                    } catch (RuntimeException e) {
+                        logger.warn("Could not follow test results in " + file, e);
+                    }
+                    Thread.sleep(RESULT_STREAM_POLL_MILLIS);
+                }
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+        }
+
+        /**
+         * Stops following once the tests finished, reading the last records
+         * @param thread thread following the stream
+         */
+        void stop(Thread thread) {
+            running = false;
+            thread.interrupt();
+            try {
+                thread.join();
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            readNewRecords();
+            if (!seen) {
+                logger.warn("No test results were written to " + file + " on this host. The python tests "
+                        + "write the result stream on the host they run on; unset " + RESULT_STREAM_PROPERTY
+                        + " unless that path is shared with the TAF host.");
+            }
+        }
+
+        synchronized Map<String, Integer> getOutcomeCounts() {
+            return new TreeMap<String, Integer>(outcomeCounts);
+        }
+
+        private synchronized void readNewRecords() {
+            if (!file.isFile()) {
+                return;
+            }
+            seen = true;
+            long length = file.length();
+            if (length < offset) {
+                offset = 0;
+                pending.reset();
+            }
+            if (length == offset) {
+                return;
+            }
+            try (RandomAccessFile stream = new RandomAccessFile(file, "r")) {
+                stream.seek(offset);
+                byte[] buffer = new byte[8192];
+                int read;
+                while ((read = stream.read(buffer)) > 0) {
+                    offset += read;
+                    for (int i = 0; i < read; i++) {
+                        if (buffer[i] != '\n') {
+                            pending.write(buffer[i]);
+                            continue;
+                        }
+                        report(pending.toString("UTF-8"));
+                        pending.reset();
+                    }
+                }
+            } catch (IOException e) {
+                logger.warn("Could not read test results from " + file, e);
+            }
+        }
+
+        private void report(String record) {
+            if (record.trim().isEmpty()) {
+                return;
+            }
+            JsonObject fields;
+            try {
+                JsonElement element = parser.parse(record);
+                if (!element.isJsonObject()) {
+                    logger.warn("Skipping test result that is not a JSON object: " + record);
+                    return;
+                }
+                fields = element.getAsJsonObject();
+            } catch (JsonParseException e) {
+                logger.warn("Skipping test result that is not valid JSON: " + record, e);
+                return;
+            }
+            String outcome = getString(fields, "outcome");
+            if (outcome == null) {
+                return;
+            }
+            Integer count = outcomeCounts.get(outcome);
+            outcomeCounts.put(outcome, count == null ? 1 : count + 1);
+            String test = getString(fields, "classname") + ":" + getString(fields, "name");
+            if ("failure".equals(outcome) || "error".equals(outcome)) {
+                logger.error("    " + outcome + ": " + test + ": " + getString(fields, "type") + " "
+                        + getString(fields, "message"));
+            } else {
+                logger.info("    " + outcome + ": " + test);
+            }
+        }
+
+        /**
+         * @return the string value of a field of a record, null if the
+         *         field is missing or not a string
+         */
+        private static String getString(JsonObject fields, String name) {
+            JsonElement value = fields.get(name);
+            if (value == null || !value.isJsonPrimitive() || !value.getAsJsonPrimitive().isString()) {
+                return null;
+            }
+            return value.getAsString();
+        }
+    }
+}
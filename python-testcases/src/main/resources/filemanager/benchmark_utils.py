@@ -0,0 +1,274 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Results of the filemanager benchmarks: sweep parameters, metric
+            collection, a JSON results file and comparison against the
+            results of a baseline run
+"""
+
+import json
+import math
+import os
+import time
+
+RESULTS_PATH_ENV = "FILEMANAGER_BENCH_RESULTS"
+BASELINE_PATH_ENV = "FILEMANAGER_BENCH_BASELINE"
+TOLERANCE_ENV = "FILEMANAGER_BENCH_TOLERANCE"
+DEFAULT_RESULTS_PATH = "/tmp/filemanager_benchmark_results.json"
+DEFAULT_TOLERANCE = 0.25
+# A metric only regresses if it also grew by more than this, so that noise
+# on small values does not fail the comparison
+MIN_REGRESSION = {"_secs": 1.0, "_kb": 10240, "_bytes": 10240,
+                  "_per_sec": 1.0}
+# Direction in which a metric improves, by suffix of its name. Metrics
+# matching no suffix, e.g. durations and sizes, are lower-is-better.
+HIGHER_IS_BETTER = 1
+LOWER_IS_BETTER = -1
+NOT_COMPARED = 0
+METRIC_DIRECTIONS = {"_per_sec": HIGHER_IS_BETTER,
+                     "reported_duplicates": NOT_COMPARED}
+# Processes on the ms whose memory is sampled while a plan runs
+MS_MEMORY_PROCESSES = ("litpd", "celery", "puppetserver", "puppet",
+                       "mcollectived")
+# Puppet manifests generated by LITP for each node
+PUPPET_MANIFESTS_DIR = "/opt/ericsson/nms/litp/etc/puppet/manifests/plugins"
+
+
+def get_sweep_from_env(name, default):
+    """
+        Returns the values of a sweep from a comma separated environment
+        variable, e.g. FILEMANAGER_BENCH_FILES=100,500,5000
+
+        Args:
+            name (str): Name of the environment variable
+            default (list): Values used when the variable is not set
+        Returns:
+            (list). Integer values of the sweep
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return list(default)
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def get_ms_memory_cmd():
+    """
+        Returns the command listing the resident memory and name of every
+        process on the ms
+    """
+    return "ps -eo rss=,comm="
+
+
+def parse_ms_memory(stdout, processes=MS_MEMORY_PROCESSES):
+    """
+        Sums the resident memory of the processes of interest
+
+        Args:
+            stdout (list): Output lines of the command from get_ms_memory_cmd
+            processes (tuple): Names of the processes to count
+        Returns:
+            (int). Resident memory in kB
+    """
+    total = 0
+    for line in stdout:
+        fields = line.split(None, 1)
+        if len(fields) == 2 and fields[0].isdigit() and \
+                fields[1].strip() in processes:
+            total += int(fields[0])
+    return total
+
+
+def get_manifest_size_cmd():
+    """
+        Returns the command printing the total size in bytes of the puppet
+        manifests generated by LITP
+    """
+    return "cat {0}/*.pp | wc -c".format(PUPPET_MANIFESTS_DIR)
+
+
+def get_task_metrics(task_timings):
+    """
+        Summarises the durations of the tasks of a plan
+
+        Args:
+            task_timings (dict): TaskTiming of each task, as returned by
+                PlanWaiter
+        Returns:
+            (dict). Number of tasks, mean and max task duration
+    """
+    durations = [timing.duration for timing in task_timings.itervalues()
+                 if timing.duration is not None]
+    metrics = {"task_count": len(task_timings),
+               "mean_task_secs": 0.0,
+               "max_task_secs": 0.0}
+    if durations:
+        metrics["mean_task_secs"] = sum(durations) / len(durations)
+        metrics["max_task_secs"] = max(durations)
+    return metrics
+
+
+class BenchmarkResult(object):
+    """
+        Metrics measured for one point of a benchmark sweep
+    """
+
+    def __init__(self, sweep, params, metrics=None):
+        """
+            Args:
+                sweep (str): Name of the sweep, e.g. "file_count"
+                params (dict): Parameters of the point, e.g. {"files": 500}
+                metrics (dict): Measured value of each metric
+        """
+        self.sweep = sweep
+        self.params = params
+        self.metrics = metrics if metrics is not None else {}
+
+    @property
+    def key(self):
+        """
+            Returns the name identifying the point across runs
+        """
+        return "{0} {1}".format(self.sweep, " ".join(
+            "{0}={1}".format(name, value)
+            for name, value in sorted(self.params.iteritems())))
+
+    def to_dict(self):
+        """
+            Returns the result as a dict that can be stored as JSON
+        """
+        return {"sweep": self.sweep, "params": self.params,
+                "metrics": self.metrics}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+            Builds a result from a dict returned by to_dict
+        """
+        return cls(data["sweep"], data["params"], data["metrics"])
+
+
+class BenchmarkResults(object):
+    """
+        Results of a benchmark run, keyed by BenchmarkResult.key
+    """
+
+    def __init__(self, results=None):
+        self.results = {}
+        for result in results or []:
+            self.add(result)
+
+    def add(self, result):
+        """
+            Adds a result, replacing any earlier result of the same point
+        """
+        self.results[result.key] = result
+
+    def get(self, key):
+        """
+            Returns the result of a point, None if it was not measured
+        """
+        return self.results.get(key)
+
+    def save(self, path):
+        """
+            Writes the results to a JSON file
+        """
+        with open(path, "w") as results_file:
+            json.dump({"time": time.time(),
+                       "results": [self.results[key].to_dict()
+                                   for key in sorted(self.results)]},
+                      results_file, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path):
+        """
+            Reads results written by save
+        """
+        with open(path) as results_file:
+            data = json.load(results_file)
+        return cls([BenchmarkResult.from_dict(result)
+                    for result in data["results"]])
+
+
+def get_scaling_exponent(points):
+    """
+        Fits duration = c * size ** k to the points by least squares on
+        their logarithms. k close to 1 is linear growth, 2 is quadratic.
+
+        Args:
+            points (list): (size, seconds) of each point
+        Returns:
+            (float). The exponent k, None with fewer than 2 distinct sizes
+    """
+    logs = [(math.log(size), math.log(secs)) for size, secs in points
+            if size > 0 and secs > 0]
+    if len(set(log_size for log_size, _ in logs)) < 2:
+        return None
+    mean_size = sum(log_size for log_size, _ in logs) / len(logs)
+    mean_secs = sum(log_secs for _, log_secs in logs) / len(logs)
+    return sum((log_size - mean_size) * (log_secs - mean_secs)
+               for log_size, log_secs in logs) / \
+        sum((log_size - mean_size) ** 2 for log_size, _ in logs)
+
+
+def get_metric_direction(metric):
+    """
+        Returns the direction in which a metric improves: HIGHER_IS_BETTER,
+        LOWER_IS_BETTER or NOT_COMPARED
+    """
+    for suffix, direction in METRIC_DIRECTIONS.iteritems():
+        if metric.endswith(suffix):
+            return direction
+    return LOWER_IS_BETTER
+
+
+def get_min_regression(metric):
+    """
+        Returns the smallest change of a metric for the worse counted as a
+        regression
+    """
+    for suffix, minimum in MIN_REGRESSION.iteritems():
+        if metric.endswith(suffix):
+            return minimum
+    return 0
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+        Compares results against the results of a baseline run. A metric
+        regresses when it got worse, in the direction given by
+        get_metric_direction, by more than tolerance and more than its
+        minimum regression: a duration that grew, a throughput that fell.
+
+        Args:
+            results (list): BenchmarkResult of each point to compare
+            baseline (BenchmarkResults): Results of the baseline run
+            tolerance (float): Allowed relative change for the worse,
+                0.25 is 25%
+        Returns:
+            (list). Description of each regression
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.key)
+        if base is None:
+            continue
+        for metric, value in sorted(result.metrics.iteritems()):
+            base_value = base.metrics.get(metric)
+            direction = get_metric_direction(metric)
+            if base_value is None or direction == NOT_COMPARED:
+                continue
+            # Change for the worse, positive when the metric got worse
+            worse = (base_value - value) * direction
+            if worse > abs(base_value) * tolerance and \
+                    worse > get_min_regression(metric):
+                regressions.append("{0} {1}: {2} against {3} in baseline"
+                                   .format(result.key, metric, value,
+                                           base_value))
+    return regressions
@@ -0,0 +1,252 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Mixins measuring the test cases of a GenericTest subclass: step
+            timings, the trace of the remote commands, the /proc profile of
+            the nodes while plans run and the stream of test results. Each
+            overrides GenericTest methods cooperatively, so they are listed
+            before GenericTest in the bases of the test class.
+"""
+
+import os
+import time
+
+from litp_backend import SIMULATED
+from command_trace import CommandTracer, get_trace_path
+from step_timer import StepTimer, parse_step_marker, get_command_bytes, \
+    write_step_timings, get_step_timings_path
+from benchmark_utils import compare_to_baseline, TOLERANCE_ENV, \
+    DEFAULT_TOLERANCE
+from proc_profiler import PlanProfiler, get_proc_sample_cmd, sample_local, \
+    write_profiles, get_profile_result, read_profile_results, \
+    PROFILE_PATH_ENV, PROFILE_BASELINE_ENV, PROFILE_INTERVAL_ENV, \
+    PROFILE_PROCESSES_ENV, DEFAULT_INTERVAL_SECS, DEFAULT_PROFILE_PROCESSES
+from result_stream import ResultStream, RecordingResult, \
+    get_result_stream_path
+
+
+def get_case_classname(case):
+    """
+        Returns the dotted name of the class of a test case
+    """
+    return "{0}.{1}".format(case.__class__.__module__,
+                            case.__class__.__name__)
+
+
+def close_class_resource(mixin, cls, resource):
+    """
+        Closes a resource shared by the tests of a class and runs the
+        tearDownClass of the classes after the mixin, if any
+    """
+    resource.close()
+    parent_teardown = getattr(super(mixin, cls), "tearDownClass", None)
+    if parent_teardown is not None:
+        parent_teardown()
+
+
+class StepTimingMixin(object):
+    """
+        Times each numbered step the test logs, with the remote commands
+        and bytes it used
+    """
+
+    def setUp(self):
+        """
+            Starts timing the set up of the test
+        """
+        self.step_timer = StepTimer()
+        self.step_timer.start_step("setUp")
+        super(StepTimingMixin, self).setUp()
+
+    def log(self, level, msg):
+        """
+            Logs a message, starting a new timed step if it is a step
+            marker such as "#3. Run plan"
+        """
+        step = parse_step_marker(msg) if level == "info" else None
+        if step is not None and getattr(self, "step_timer", None):
+            self.step_timer.start_step(*step)
+        super(StepTimingMixin, self).log(level, msg)
+
+    def record_step_command(self, num_bytes):
+        """
+            Counts a remote command against the current step
+        """
+        if getattr(self, "step_timer", None):
+            self.step_timer.record_command(num_bytes)
+
+    def report_step_timings(self):
+        """
+            Logs how long each step of the test took with the remote
+            commands and bytes it used, and appends the summary to the file
+            read by the TAF runner if FILEMANAGER_STEP_TIMINGS names it
+        """
+        self.step_timer.stop()
+        self.log("info", "Step timings:\n{0}".format(
+            self.step_timer.get_report()))
+        path = get_step_timings_path()
+        if path is not None:
+            write_step_timings(path, get_case_classname(self),
+                               self._testMethodName, self.step_timer)
+
+
+class CommandTraceMixin(object):
+    """
+        Traces every remote command of the test, and counts it against the
+        current step if the test also times its steps
+    """
+
+    # Records every remote command of the run if FILEMANAGER_TRACE is set
+    command_tracer = CommandTracer(get_trace_path())
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+            Closes the command trace
+        """
+        close_class_resource(CommandTraceMixin, cls, cls.command_tracer)
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+            Runs a command on a node, tracing it
+        """
+        start = time.time()
+        stdout, stderr, rc = super(CommandTraceMixin, self).run_command(
+            node, cmd, *args, **kwargs)
+        self.trace_command(node, cmd, start, stdout, stderr, rc)
+        return stdout, stderr, rc
+
+    def run_untraced_command(self, node, cmd, *args, **kwargs):
+        """
+            Runs a command on a node without tracing it, for commands that
+            measure the test rather than being part of it
+        """
+        return super(CommandTraceMixin, self).run_command(node, cmd, *args,
+                                                          **kwargs)
+
+    def trace_command(self, node, cmd, start, stdout, stderr, rc):
+        """
+            Records a remote command in the command trace and the current
+            step
+        """
+        num_bytes = get_command_bytes(cmd, stdout, stderr)
+        self.command_tracer.record(self.id(), node, cmd, start,
+                                   time.time() - start, rc, num_bytes)
+        record_step_command = getattr(self, "record_step_command", None)
+        if record_step_command is not None:
+            record_step_command(num_bytes)
+
+
+class PlanProfileMixin(object):
+    """
+        Profiles the ms and peer nodes from /proc while a plan runs, if
+        FILEMANAGER_PROFILE is set. The test class provides nodes_list and
+        run_pooled_command.
+    """
+
+    def sample_proc(self, node):
+        """
+            Returns the /proc sample of a node. The simulated nodes have no
+            processes, the test host itself is sampled instead. The sample
+            is taken by the profiler thread while the test thread runs the
+            plan, so it runs on a pooled SSH channel of its own rather than
+            the connection of run_command, and is not traced, so profiling
+            does not add to the commands of the step. It runs as the node
+            user: the I/O of processes of other users is left out.
+        """
+        cmd = get_proc_sample_cmd(self.get_profiled_processes())
+        if SIMULATED:
+            return sample_local(cmd)
+        stdout, _, _ = self.run_pooled_command(node, cmd, traced=False)
+        return stdout
+
+    @staticmethod
+    def get_profiled_processes():
+        """
+            Returns the names of the processes profiled during plans, set
+            by FILEMANAGER_PROFILE_PROCESSES, e.g. litpd,puppet
+        """
+        names = os.environ.get(PROFILE_PROCESSES_ENV, "")
+        return tuple(name.strip() for name in names.split(",")
+                     if name.strip()) or DEFAULT_PROFILE_PROCESSES
+
+    def start_plan_profiler(self):
+        """
+            Starts sampling /proc on the ms and peer nodes, None if plans
+            are not profiled
+        """
+        if not os.environ.get(PROFILE_PATH_ENV):
+            return None
+        return PlanProfiler(
+            self.sample_proc, ["localhost"] if SIMULATED else self.nodes_list,
+            self.get_profiled_processes(),
+            float(os.environ.get(PROFILE_INTERVAL_ENV,
+                                 DEFAULT_INTERVAL_SECS))).start()
+
+    def stop_plan_profiler(self, profiler):
+        """
+            Stops a profiler started by start_plan_profiler and appends its
+            profiles to the FILEMANAGER_PROFILE file
+
+            Returns:
+                (dict). ProcProfile of each node, empty if not profiled
+        """
+        if profiler is None:
+            return {}
+        profiles = profiler.stop()
+        self.assertEqual([], profiler.errors,
+                         "/proc samples failed: {0}".format(profiler.errors))
+        write_profiles(os.environ[PROFILE_PATH_ENV], self.id(), profiles)
+        return profiles
+
+    def check_plan_profile(self, profiles):
+        """
+            Asserts that the plan cost no node more than in the baseline
+            profile named by FILEMANAGER_PROFILE_BASELINE, if any
+
+            Args:
+                profiles (dict): ProcProfile of each node
+        """
+        baseline_path = os.environ.get(PROFILE_BASELINE_ENV)
+        if not profiles or not baseline_path:
+            return
+        regressions = compare_to_baseline(
+            [get_profile_result(self.id(), node, profile.get_metrics())
+             for node, profile in profiles.iteritems()],
+            read_profile_results(baseline_path),
+            float(os.environ.get(TOLERANCE_ENV, DEFAULT_TOLERANCE)))
+        self.assertEqual([], regressions,
+                         "Plan cost regressed against {0}:\n{1}".format(
+                             baseline_path, "\n".join(regressions)))
+
+
+class ResultStreamMixin(object):
+    """
+        Records the result of each test as soon as it finishes
+    """
+
+    # Records the results of the run if FILEMANAGER_RESULT_STREAM is set
+    result_stream = ResultStream(get_result_stream_path())
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+            Closes the result stream
+        """
+        close_class_resource(ResultStreamMixin, cls, cls.result_stream)
+
+    def run(self, result=None):
+        """
+            Runs the test, recording its outcome in the result stream
+        """
+        if result is not None and self.result_stream.path is not None:
+            result = RecordingResult(result, self.result_stream,
+                                     get_case_classname(self),
+                                     self._testMethodName)
+        return super(ResultStreamMixin, self).run(result)
@@ -0,0 +1,327 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Selects the tests covering the plugin features touched by a
+            change. Tests are mapped to features by their @attr tags and
+            tms_ids; an index of the tests of every testset, rebuilt only
+            for testsets that changed, is persisted between runs.
+
+            Usage:
+                python case_selection.py [--changed PATH ...]
+                    [--features FEATURE,...] [--attr all] [--index FILE]
+            Prints the nose test ids to run, or "." for a full run when a
+            change cannot be mapped to features. Exits with
+            NOTHING_SELECTED_RC, printing nothing, when no test covers the
+            features, and with 2 for an unknown feature.
+
+            Tests also select themselves when FILEMANAGER_CHANGED (comma
+            separated paths) or FILEMANAGER_FEATURES is set, so the runner
+            needs no change: the other tests are skipped.
+"""
+
+import ast
+import json
+import optparse
+import os
+import re
+import sys
+
+CHANGED_ENV = "FILEMANAGER_CHANGED"
+FEATURES_ENV = "FILEMANAGER_FEATURES"
+INDEX_PATH_ENV = "FILEMANAGER_SELECTION_INDEX"
+DEFAULT_INDEX_PATH = "/tmp/filemanager_case_index.json"
+INDEX_VERSION = 1
+TESTSET_REGEX = re.compile(r"^testset_.*\.py$")
+TMS_ID_REGEX = re.compile(r"@tms_id:(.*?)(?=@|\Z)", re.DOTALL)
+# Exit status of main when no test is selected, so that a runner cannot
+# mistake the empty selection for a full run
+NOTHING_SELECTED_RC = 3
+
+FEATURES = ("path_validation", "mode_handling", "inheritance_precedence",
+            "lists", "resume")
+# Features covered by each tms_id or @attr tag
+CASE_FEATURES = {
+    "torf_302742_tc03": ("mode_handling",),
+    "torf_302742_tc04": ("mode_handling", "path_validation"),
+    "torf_302742_tc05": ("mode_handling",),
+    "torf_302742_tc06": ("mode_handling",),
+    "torf_302742_tc09": ("mode_handling",),
+    "torf_302742_tc10": ("resume",),
+    "torf_302742_tc11": ("resume",),
+    "torf_302742_tc15": ("mode_handling",),
+    "torf_302742_tc16": ("inheritance_precedence",),
+    "torf_302742_tc17": ("path_validation",),
+    "torf_302742_tc18": ("lists", "inheritance_precedence"),
+    "filemanager_benchmark_files": ("mode_handling",),
+    "filemanager_benchmark_nodes": ("inheritance_precedence",),
+    "filemanager_benchmark_nesting": ("lists",),
+    "filemanager_benchmark_duplicates": ("path_validation",),
+    "filemanager_mode_oracle": ("mode_handling",),
+}
+# Features touched by a change to a plugin file, by pattern of its path.
+# A path matching none of them selects every test.
+CHANGE_AREAS = (
+    (re.compile(r"valid", re.I), ("path_validation",)),
+    (re.compile(r"mode|permission", re.I), ("mode_handling",)),
+    (re.compile(r"inherit|preceden|supersede|cluster|node", re.I),
+     ("inheritance_precedence",)),
+    (re.compile(r"list", re.I), ("lists",)),
+    (re.compile(r"resume|task|plan", re.I), ("resume",)),
+)
+
+
+def split_tags(values):
+    """
+        Returns the tags of @attr arguments, splitting the arguments that
+        hold several comma separated tags
+    """
+    tags = []
+    for value in values:
+        tags.extend(tag.strip() for tag in value.split(",") if tag.strip())
+    return tags
+
+
+def parse_tms_ids(docstring):
+    """
+        Returns the tms_ids listed in a test docstring
+    """
+    tms_ids = []
+    for match in TMS_ID_REGEX.findall(docstring or ""):
+        tms_ids.extend(split_tags(match.split()))
+    return tms_ids
+
+
+def get_case_features(tags):
+    """
+        Returns the features covered by a test with the given @attr tags
+        and tms_ids
+    """
+    features = set()
+    for tag in tags:
+        features.update(CASE_FEATURES.get(tag, ()))
+    return features
+
+
+def get_changed_features(changed_paths):
+    """
+        Returns the features touched by changed plugin files, None if any
+        of them cannot be mapped and every test must run
+    """
+    features = set()
+    for path in changed_paths:
+        matched = [area_features for regex, area_features in CHANGE_AREAS
+                   if regex.search(os.path.basename(path))]
+        if not matched:
+            return None
+        for area_features in matched:
+            features.update(area_features)
+    return features
+
+
+def parse_features(value):
+    """
+        Returns the features of a comma separated list
+
+        Args:
+            value (str): Comma separated features, e.g. "mode_handling,lists"
+        Returns:
+            (set). Features listed
+        Raises:
+            ValueError: If the list holds no feature or one not in FEATURES
+    """
+    features = set(split_tags([value]))
+    unknown = sorted(features - set(FEATURES))
+    if unknown:
+        raise ValueError("Unknown feature {0}, expected any of {1}".format(
+            ", ".join(unknown), ", ".join(FEATURES)))
+    if not features:
+        raise ValueError("No feature in {0!r}".format(value))
+    return features
+
+
+def get_selected_features(environ=None):
+    """
+        Returns the features selected by FILEMANAGER_FEATURES or
+        FILEMANAGER_CHANGED, None when every test must run
+
+        Raises:
+            ValueError: If FILEMANAGER_FEATURES names an unknown feature
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get(FEATURES_ENV):
+        return parse_features(environ[FEATURES_ENV])
+    if environ.get(CHANGED_ENV):
+        return get_changed_features(split_tags([environ[CHANGED_ENV]]))
+    return None
+
+
+def get_decorator_tags(function):
+    """
+        Returns the arguments of the @attr decorators of a function node
+    """
+    values = []
+    for decorator in function.decorator_list:
+        if isinstance(decorator, ast.Call) and \
+                getattr(decorator.func, "id", None) == "attr":
+            values.extend(arg.s for arg in decorator.args
+                          if isinstance(arg, ast.Str))
+    return split_tags(values)
+
+
+def index_testset(path):
+    """
+        Lists the tests of a testset without importing it
+
+        Args:
+            path (str): Path of a testset_*.py file
+        Returns:
+            (list). id, @attr tags and tms_ids of each test method
+    """
+    with open(path) as testset_file:
+        tree = ast.parse(testset_file.read(), path)
+    cases = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for function in node.body:
+            if isinstance(function, ast.FunctionDef) and \
+                    function.name.startswith("test"):
+                cases.append({
+                    "id": "{0}:{1}.{2}".format(os.path.basename(path),
+                                               node.name, function.name),
+                    "attrs": get_decorator_tags(function),
+                    "tms_ids": parse_tms_ids(ast.get_docstring(function))})
+    return cases
+
+
+class CaseIndex(object):
+    """
+        Tests of every testset of a directory, persisted in a JSON file and
+        refreshed only for testsets whose size or mtime changed
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+
+    def load(self):
+        """
+            Reads the persisted index, starting empty if it is missing or
+            from another version
+        """
+        try:
+            with open(self.path) as index_file:
+                data = json.load(index_file)
+        except (IOError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.files = data["files"]
+
+    def save(self):
+        """
+            Writes the index
+        """
+        with open(self.path, "w") as index_file:
+            json.dump({"version": INDEX_VERSION, "files": self.files},
+                      index_file, sort_keys=True)
+
+    def refresh(self, directory):
+        """
+            Re-indexes the testsets of a directory that changed since they
+            were last indexed
+
+            Returns:
+                (int). Number of testsets indexed again
+        """
+        present = set()
+        refreshed = 0
+        for name in sorted(os.listdir(directory)):
+            if not TESTSET_REGEX.match(name):
+                continue
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            present.add(name)
+            entry = self.files.get(name)
+            if entry is not None and entry["mtime"] == stat.st_mtime and \
+                    entry["size"] == stat.st_size:
+                continue
+            self.files[name] = {"mtime": stat.st_mtime, "size": stat.st_size,
+                                "cases": index_testset(path)}
+            refreshed += 1
+        for name in set(self.files) - present:
+            del self.files[name]
+        return refreshed
+
+    def iter_cases(self):
+        """
+            Yields every indexed test
+        """
+        for name in sorted(self.files):
+            for case in self.files[name]["cases"]:
+                yield case
+
+    def select(self, features, required_attr=None):
+        """
+            Returns the ids of the tests covering any of the features
+
+            Args:
+                features (set): Selected features
+                required_attr (str): Only select tests with this @attr tag
+        """
+        return [case["id"] for case in self.iter_cases()
+                if (required_attr is None or
+                    required_attr in case["attrs"]) and
+                get_case_features(case["attrs"] + case["tms_ids"]) &
+                features]
+
+
+def main(args):
+    """
+        Prints the nose test ids covering the changed features
+    """
+    parser = optparse.OptionParser(usage=__doc__)
+    parser.add_option("--changed", action="append", default=[],
+                      help="Changed plugin file, may be repeated")
+    parser.add_option("--features", default="",
+                      help="Comma separated features, one of {0}".format(
+                          ", ".join(FEATURES)))
+    parser.add_option("--attr", default="all",
+                      help="Only select tests with this @attr tag")
+    parser.add_option("--index", default=os.environ.get(
+        INDEX_PATH_ENV, DEFAULT_INDEX_PATH))
+    parser.add_option("--directory",
+                      default=os.path.dirname(os.path.abspath(__file__)))
+    options, _ = parser.parse_args(args)
+
+    if options.features:
+        try:
+            features = parse_features(options.features)
+        except ValueError as err:
+            parser.error(str(err))
+    else:
+        features = get_changed_features(options.changed)
+    if features is None or not (options.features or options.changed):
+        sys.stdout.write(".\n")
+        return 0
+
+    index = CaseIndex(options.index)
+    index.load()
+    if index.refresh(options.directory):
+        index.save()
+    selected = index.select(features, options.attr)
+    if not selected:
+        sys.stderr.write("No test covers {0}\n".format(
+            ", ".join(sorted(features))))
+        return NOTHING_SELECTED_RC
+    sys.stdout.write(" ".join(selected) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
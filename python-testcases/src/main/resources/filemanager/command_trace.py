@@ -0,0 +1,250 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Trace of every remote command ran by the tests, written as one
+            JSON record per line, with latency histograms per command class
+            and a diff of the round trips made by two runs. The tests only
+            trace their commands if FILEMANAGER_TRACE names the trace file.
+
+            Usage:
+                python command_trace.py report <trace.jsonl>
+                python command_trace.py diff <old.jsonl> <new.jsonl>
+            diff exits with 1 if any test makes more remote calls of a
+            class than in the old run.
+"""
+
+import json
+import os
+import sys
+import threading
+
+from model_batch import BATCH_MARKER
+
+TRACE_PATH_ENV = "FILEMANAGER_TRACE"
+# Upper bound in seconds of each histogram bucket, the last one is open
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 30, 60)
+HISTOGRAM_WIDTH = 40
+# Command classes recognised by a marker in the command, checked in order
+COMMAND_MARKERS = ((BATCH_MARKER, "litp batch"),
+                   ("| tee -- ", "bulk create files"))
+
+
+def get_command_class(cmd):
+    """
+        Returns the class of a remote command: "litp <action>" for litp
+        commands, a fixed name for the bulk scripts of the testware and the
+        program name otherwise
+
+        Args:
+            cmd (str): Command ran on the node
+        Returns:
+            (str). Class of the command, e.g. "litp create" or "stat"
+    """
+    for marker, command_class in COMMAND_MARKERS:
+        if marker in cmd:
+            return command_class
+    words = cmd.split()
+    while words and (words[0] == "sudo" or "=" in words[0]):
+        words = words[1:]
+    if not words:
+        return "empty"
+    program = os.path.basename(words[0])
+    if program == "litp" and len(words) > 1:
+        return "litp {0}".format(words[1])
+    return program
+
+
+class CommandTracer(object):
+    """
+        Appends one JSON record per remote command to a trace file. The
+        file is opened on the first record and written to from any thread;
+        each record is flushed so that workers can share the file. Without
+        a path nothing is recorded.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._trace_file = None
+        self._lock = threading.Lock()
+
+    def record(self, case, node, cmd, start, secs, rc, num_bytes):
+        """
+            Writes the record of a remote command
+
+            Args:
+                case (str): Id of the test which ran the command
+                node (str): node the command ran on
+                cmd (str): Command ran
+                start (float): Time the command started
+                secs (float): Seconds the command took
+                rc (int): Return code of the command
+                num_bytes (int): Bytes sent and received
+        """
+        if self.path is None:
+            return
+        line = json.dumps({"case": case, "node": node,
+                           "class": get_command_class(cmd),
+                           "start": round(start, 3), "secs": round(secs, 4),
+                           "rc": rc, "bytes": num_bytes}, sort_keys=True)
+        with self._lock:
+            if self._trace_file is None:
+                self._trace_file = open(self.path, "a")
+            self._trace_file.write(line + "\n")
+            self._trace_file.flush()
+
+    def close(self):
+        """
+            Closes the trace file
+        """
+        with self._lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+
+
+def get_trace_path(environ=None):
+    """
+        Returns the absolute path of the trace file named by
+        FILEMANAGER_TRACE, None if commands are not traced
+    """
+    path = (os.environ if environ is None else environ).get(TRACE_PATH_ENV)
+    return os.path.abspath(path) if path else None
+
+
+def read_trace(path):
+    """
+        Returns the records of a trace file, skipping lines that cannot be
+        parsed such as one cut short by an aborted run
+    """
+    records = []
+    with open(path) as trace_file:
+        for line in trace_file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def get_percentile(sorted_values, percent):
+    """
+        Returns the value below which percent of the sorted values fall
+    """
+    if not sorted_values:
+        return None
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def get_histogram(durations):
+    """
+        Counts the durations falling into each bucket
+
+        Returns:
+            (list). (label, count) of each bucket
+    """
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    for secs in durations:
+        index = 0
+        while index < len(HISTOGRAM_BUCKETS) and \
+                secs > HISTOGRAM_BUCKETS[index]:
+            index += 1
+        counts[index] += 1
+    labels = ["<={0}s".format(bound) for bound in HISTOGRAM_BUCKETS] + \
+        [">{0}s".format(HISTOGRAM_BUCKETS[-1])]
+    return zip(labels, counts)
+
+
+def get_report(records):
+    """
+        Returns the latency histogram of each command class with its
+        count, failures, total, p50, p90 and max duration
+    """
+    durations_by_class = {}
+    failures_by_class = {}
+    for record in records:
+        durations_by_class.setdefault(record["class"], []).append(
+            record["secs"])
+        if record["rc"] != 0:
+            failures_by_class[record["class"]] = \
+                failures_by_class.get(record["class"], 0) + 1
+
+    lines = []
+    for command_class, durations in sorted(durations_by_class.iteritems()):
+        durations.sort()
+        lines.append("{0}: {1} calls, {2} rc!=0, total {3:.1f}s, "
+                     "p50 {4:.3f}s, p90 {5:.3f}s, max {6:.3f}s".format(
+                         command_class, len(durations),
+                         failures_by_class.get(command_class, 0),
+                         sum(durations), get_percentile(durations, 50),
+                         get_percentile(durations, 90), durations[-1]))
+        histogram = get_histogram(durations)
+        largest = max(count for _, count in histogram)
+        for label, count in histogram:
+            if count:
+                lines.append("    {0:>8} {1:>6} {2}".format(
+                    label, count, "#" * max(1, count * HISTOGRAM_WIDTH /
+                                            largest)))
+    return "\n".join(lines)
+
+
+def count_calls(records):
+    """
+        Returns the number of calls of each command class made by each test
+    """
+    counts = {}
+    for record in records:
+        key = (record["case"], record["class"])
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def diff_traces(old_records, new_records):
+    """
+        Compares the remote calls made by each test in two runs
+
+        Returns:
+            (tuple). Lines describing each change and True if any test
+            makes more calls of a class than before
+    """
+    old_counts = count_calls(old_records)
+    new_counts = count_calls(new_records)
+    lines = []
+    increased = False
+    for key in sorted(set(old_counts) | set(new_counts)):
+        old_count = old_counts.get(key, 0)
+        new_count = new_counts.get(key, 0)
+        if old_count == new_count:
+            continue
+        if new_count > old_count:
+            increased = True
+        lines.append("{0} {1}: {2} -> {3} ({4:+d})".format(
+            key[0], key[1], old_count, new_count, new_count - old_count))
+    return lines, increased
+
+
+def main(args):
+    """
+        Runs the report or diff command, returns the exit code
+    """
+    if len(args) == 2 and args[0] == "report":
+        sys.stdout.write(get_report(read_trace(args[1])) + "\n")
+        return 0
+    if len(args) == 3 and args[0] == "diff":
+        lines, increased = diff_traces(read_trace(args[1]),
+                                       read_trace(args[2]))
+        sys.stdout.write("\n".join(lines or ["No change in remote calls"]) +
+                         "\n")
+        return 1 if increased else 0
+    sys.stdout.write(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,191 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Builds and parses shell commands which act on many files on a
+            node in a single remote call
+"""
+
+import pipes
+
+CREATED = "CREATED"
+NOT_CREATED = "NOT_CREATED"
+# Largest command sent in one remote call. The remote shell gets the command
+# as a single argument, which Linux limits to MAX_ARG_STRLEN (128 KiB), and
+# run_command may quote it again for su.
+MAX_CMD_BYTES = 64 * 1024
+CMD_SEPARATOR = "; "
+
+
+def join_cmds(cmds, max_bytes=MAX_CMD_BYTES):
+    """
+        Joins shell commands into as few scripts as possible, none of them
+        longer than max_bytes. A command longer than max_bytes on its own
+        is returned as a script of its own.
+
+        Args:
+            cmds (list): Shell commands, ran in order
+            max_bytes (int): Largest script length
+        Returns:
+            (list). Scripts running the commands, in order
+    """
+    scripts = []
+    current = []
+    length = 0
+    for cmd in cmds:
+        added = len(cmd) + (len(CMD_SEPARATOR) if current else 0)
+        if current and length + added > max_bytes:
+            scripts.append(CMD_SEPARATOR.join(current))
+            current = []
+            added = len(cmd)
+        current.append(cmd)
+        length = added if len(current) == 1 else length + added
+    if current:
+        scripts.append(CMD_SEPARATOR.join(current))
+    return scripts
+
+
+def split_words(words, max_bytes):
+    """
+        Splits words into groups which, joined by spaces, are at most
+        max_bytes long, at least one word per group
+    """
+    groups = []
+    current = []
+    length = 0
+    for word in words:
+        if current and length + 1 + len(word) > max_bytes:
+            groups.append(current)
+            current = []
+        length = len(word) if not current else length + 1 + len(word)
+        current.append(word)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def get_bulk_create_files_cmds(files, max_bytes=MAX_CMD_BYTES):
+    """
+        Returns the shell commands which (re)create all files: as few as
+        possible, none of them longer than max_bytes as long as the content
+        of a file fits in it. Files sharing the same content are written by
+        one printf piped to tee. The commands print one "CREATED <path>" or
+        "NOT_CREATED <path>" line per file.
+
+        Args:
+            files (dict): List of content lines for each file path
+            max_bytes (int): Largest command length
+        Returns:
+            (list). Shell commands to run on the node, in order
+    """
+    paths_by_content = {}
+    for file_path in sorted(files):
+        paths_by_content.setdefault(tuple(files[file_path]),
+                                    []).append(pipes.quote(file_path))
+
+    cmds = []
+    for content, quoted_paths in sorted(paths_by_content.iteritems()):
+        if content:
+            printf_args = "'%s\\n' {0}".format(
+                " ".join(pipes.quote(line) for line in content))
+        else:
+            printf_args = "''"
+        # The paths appear three times in the commands of a group
+        paths_bytes = (max_bytes - len(printf_args) - 200) // 3
+        for group in split_words(quoted_paths, max(paths_bytes, 1)):
+            paths = " ".join(group)
+            cmds.append(CMD_SEPARATOR.join([
+                "rm -f -- {0}".format(paths),
+                "printf {0} | tee -- {1} > /dev/null".format(printf_args,
+                                                             paths),
+                'for f in {0}; do if [ -f "$f" ]; then echo "{1} $f"; '
+                'else echo "{2} $f"; fi; done'.format(paths, CREATED,
+                                                      NOT_CREATED)]))
+    return join_cmds(cmds, max_bytes)
+
+
+def parse_bulk_create_files_output(stdout, file_paths):
+    """
+        Parses the output of the command built by get_bulk_create_files_cmds
+
+        Args:
+            stdout (list): Output lines of the command
+            file_paths (list): Paths of the files that were requested
+        Returns:
+            (dict). True for each path that was created, False otherwise
+    """
+    created = dict((file_path, False) for file_path in file_paths)
+    for line in stdout:
+        status, _, file_path = line.partition(" ")
+        if file_path in created:
+            created[file_path] = status == CREATED
+    return created
+
+
+def get_remove_files_cmds(file_paths, max_bytes=MAX_CMD_BYTES):
+    """
+        Returns the shell commands which remove all files, ignoring the
+        ones that do not exist; a single command unless it would be longer
+        than max_bytes
+    """
+    return ["rm -f -- {0}".format(" ".join(group)) for group in split_words(
+        [pipes.quote(file_path) for file_path in sorted(file_paths)],
+        max_bytes - len("rm -f -- "))]
+
+
+def get_file_modes_cmds(file_paths, max_bytes=MAX_CMD_BYTES):
+    """
+        Returns the stat commands printing "<mode> <path>" for each of the
+        files; a single command unless it would be longer than max_bytes
+    """
+    prefix = 'stat -c "%a %n" '
+    return [prefix + " ".join(group) for group in split_words(
+        [pipes.quote(file_path) for file_path in file_paths],
+        max_bytes - len(prefix))]
+
+
+def parse_file_modes_output(stdout, modes):
+    """
+        Sets the mode of each file of modes found in the output of a
+        command from get_file_modes_cmds
+
+        Args:
+            stdout (list): Output lines of the command
+            modes (dict): Mode of each file path, updated in place
+    """
+    for line in stdout:
+        mode, _, file_path = line.partition(" ")
+        if file_path in modes:
+            modes[file_path] = mode
+
+
+def modes_equal(mode1, mode2):
+    """
+        Returns True if two modes are the same octal number, so that "0755"
+        matches "755"
+    """
+    return int(mode1, 8) == int(mode2, 8)
+
+
+def get_mode_diff(expected_modes, actual_modes):
+    """
+        Compares expected and actual file modes
+
+        Args:
+            expected_modes (dict): Expected mode of each file path
+            actual_modes (dict): Mode of each file path found on the node,
+                None for missing files
+        Returns:
+            (dict). (expected, actual) for each path whose mode differs
+    """
+    diff = {}
+    for file_path, expected in expected_modes.iteritems():
+        actual = actual_modes.get(file_path)
+        if actual is None or not modes_equal(expected, actual):
+            diff[file_path] = (expected, actual)
+    return diff
@@ -0,0 +1,29 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Selects what the tests run against: the LITP deployment of
+            host.properties, or the in-process simulated deployment of
+            simulated_litp when FILEMANAGER_BACKEND=simulated, which needs
+            neither a management server nor the LITP test libraries
+"""
+
+import os
+
+BACKEND_ENV = "FILEMANAGER_BACKEND"
+SIMULATED = os.environ.get(BACKEND_ENV, "") == "simulated"
+
+# pylint: disable=unused-import,invalid-name
+if SIMULATED:
+    from nose.plugins.attrib import attr
+    from simulated_litp import SimulatedGenericTest as GenericTest, \
+        SimulatedCLIUtils as CLIUtils, SimulatedConstants as test_constants
+else:
+    from litp_generic_test import GenericTest, attr
+    from litp_cli_utils import CLIUtils
+    import test_constants
@@ -0,0 +1,334 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Indexes managed-files from litp show output, resolves which
+            managed-file applies to each file on each node, from the model
+            or from the model changes of a test, and reconciles the model
+            against the modes in the deployment
+"""
+
+import re
+
+from file_utils import modes_equal
+
+# Precedence of the levels a managed-file can be inherited to, highest wins
+MS_LEVEL = 0
+CLUSTER_LEVEL = 1
+NODE_LEVEL = 2
+
+NODE_URL_REGEX = re.compile(
+    r"^(/deployments/[^/]+/clusters/[^/]+/nodes/[^/]+)/")
+CLUSTER_URL_REGEX = re.compile(r"^(/deployments/[^/]+/clusters/[^/]+)/")
+
+MANAGED_FILE_TYPES = ("managed-file", "reference-to-managed-file")
+MANAGED_FILE_LIST_TYPE = "managed-file-list"
+# Collection of the managed-files and managed-file-lists of a list
+LIST_CHILD_COLLECTION = "managed_file_list"
+OVERWRITTEN_MARKER = " [*]"
+DUPLICATE_ERROR_REGEX = re.compile(
+    r'Managed-file "(?P<path>[^"]+)" is duplicated on "(?P<node>[^"]+)" '
+    r'in locations: (?P<locations>.+)$')
+
+
+def iter_show_items(lines):
+    """
+        Parses the output lines of litp show -r into the items they show
+
+        Args:
+            lines (iterable): Output lines of litp show -r
+        Returns:
+            (generator). (url, item type, properties dict) of each item
+    """
+    url = item_type = None
+    props = {}
+    props_indent = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if stripped.startswith("/") and ": " not in stripped:
+            if url is not None:
+                yield url, item_type, props
+            url, item_type, props, props_indent = stripped, None, {}, None
+            continue
+        if props_indent is not None and indent > props_indent:
+            name, _, value = stripped.partition(": ")
+            if value.endswith(OVERWRITTEN_MARKER):
+                value = value[:-len(OVERWRITTEN_MARKER)]
+            props[name.rstrip(":")] = value
+            continue
+        props_indent = None
+        if stripped == "properties:":
+            props_indent = indent
+        elif stripped.startswith("type: "):
+            item_type = stripped[len("type: "):]
+    if url is not None:
+        yield url, item_type, props
+
+
+def index_managed_files(lines):
+    """
+        Builds an index of the managed-files in litp show -r output
+
+        Args:
+            lines (iterable): Output lines of litp show -r
+        Returns:
+            (dict). (path, mode) of each managed-file keyed by model path
+    """
+    index = {}
+    for url, item_type, props in iter_show_items(lines):
+        if item_type in MANAGED_FILE_TYPES:
+            index[url] = (props.get("path"), props.get("mode"))
+    return index
+
+
+def get_item_level(url):
+    """
+        Returns the level a managed-file applies at and the url of the ms,
+        cluster or node owning it
+
+        Args:
+            url (str): Model path of a managed-file
+        Returns:
+            (tuple). (level, owner url), or None for items which do not
+            apply to any node such as those under /infrastructure
+    """
+    if url.startswith("/ms/"):
+        return MS_LEVEL, "/ms"
+    match = NODE_URL_REGEX.match(url)
+    if match:
+        return NODE_LEVEL, match.group(1)
+    match = CLUSTER_URL_REGEX.match(url)
+    if match:
+        return CLUSTER_LEVEL, match.group(1)
+    return None
+
+
+def parse_duplicate_errors(lines):
+    """
+        Parses the duplicated managed-file errors reported by create_plan
+
+        Args:
+            lines (list): Error lines of litp create_plan
+        Returns:
+            (dict). Model paths of the duplicated items keyed by (node, path)
+    """
+    duplicates = {}
+    for line in lines:
+        match = DUPLICATE_ERROR_REGEX.search(line.strip())
+        if match:
+            duplicates[(match.group("node"), match.group("path"))] = [
+                location.strip() for location in
+                match.group("locations").split(",")]
+    return duplicates
+
+
+class EffectiveManagedFiles(object):
+    """
+        Index of the managed-file that applies to each (node, path).
+
+        A node level item supersedes a cluster level one for the same path.
+        Two items for the same path at the same level are recorded as
+        conflicts, which the plugin rejects at create_plan.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.conflicts = []
+
+    @classmethod
+    def build(cls, items, owner_nodes):
+        """
+            Builds the index in a single pass over the items
+
+            Args:
+                items (iterable): (url, path, mode) of each managed-file
+                owner_nodes (dict): Nodes of each owner url, e.g. "/ms",
+                    cluster urls and node urls
+            Returns:
+                (EffectiveManagedFiles). Effective managed-files
+        """
+        index = cls()
+        for url, path, mode in items:
+            level_owner = get_item_level(url)
+            if level_owner is None:
+                continue
+            level, owner = level_owner
+            for node in owner_nodes.get(owner, ()):
+                index.add(node, path, level, mode, url)
+        return index
+
+    def add(self, node, path, level, mode, url):
+        """
+            Records a managed-file for a node unless one at a higher level
+            already applies to the same path
+        """
+        key = (node, path)
+        current = self.files.get(key)
+        if current is None or level > current[0]:
+            self.files[key] = (level, mode, url)
+        elif level == current[0] and url != current[2]:
+            self.conflicts.append((node, path, current[2], url))
+
+    def get_mode(self, node, path):
+        """
+            Returns the mode expected for a path on a node, None if the path
+            is not managed on the node
+        """
+        effective = self.files.get((node, path))
+        return effective[1] if effective else None
+
+    def get_paths_by_node(self):
+        """
+            Returns the managed paths of each node
+        """
+        paths_by_node = {}
+        for node, path in self.files:
+            paths_by_node.setdefault(node, []).append(path)
+        return paths_by_node
+
+    def get_modes(self, paths):
+        """
+            Returns the mode expected for each of the given paths on each
+            node it is managed on
+
+            Args:
+                paths (iterable): File paths
+            Returns:
+                (dict). Mode keyed by (node, path)
+        """
+        paths = set(paths)
+        return dict((key, mode) for key, (_, mode, _) in
+                    self.files.iteritems() if key[1] in paths)
+
+
+class ManagedFileResolver(object):
+    """
+        Works out the effective managed-files from the model changes of a
+        test rather than from the model: the managed-files and
+        managed-file-lists it creates and the collections it inherits them
+        to. The managed-files of each inherited item, nested lists included,
+        are expanded once however many times it is inherited, so resolving
+        is linear in the number of (node, managed-file) pairs.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.list_children = {}
+        self.inherits = []
+        self._expanded = {}
+
+    def add_item(self, url, item_type, props=None):
+        """
+            Records a created managed-file or managed-file-list
+
+            Args:
+                url (str): Model path of the item
+                item_type (str): managed-file or managed-file-list
+                props (dict): path and mode of a managed-file
+        """
+        parent, collection, _ = url.rsplit("/", 2)
+        if collection == LIST_CHILD_COLLECTION:
+            self.list_children.setdefault(parent, []).append(url)
+        if item_type == MANAGED_FILE_LIST_TYPE:
+            self.list_children.setdefault(url, [])
+        else:
+            self.files[url] = (props["path"], props["mode"])
+        self._expanded = {}
+
+    def add_inherit(self, url, source_path):
+        """
+            Records an item inherited to the ms, a cluster or a node
+
+            Args:
+                url (str): Model path of the reference
+                source_path (str): Model path of the inherited item
+        """
+        self.inherits.append((url, source_path))
+
+    def expand(self, url):
+        """
+            Returns the managed-files of an item: itself for a managed-file,
+            those of every item of a list for a managed-file-list
+
+            Returns:
+                (list). (path relative to the item, file path, mode)
+        """
+        expanded = self._expanded.get(url)
+        if expanded is not None:
+            return expanded
+        if url in self.files:
+            expanded = [("",) + self.files[url]]
+        else:
+            expanded = []
+            for child in self.list_children.get(url, ()):
+                prefix = child[len(url):]
+                expanded.extend((prefix + suffix, path, mode)
+                                for suffix, path, mode in self.expand(child))
+        self._expanded[url] = expanded
+        return expanded
+
+    def resolve(self, owner_nodes):
+        """
+            Returns the effective managed-files of the inherited items
+
+            Args:
+                owner_nodes (dict): Nodes of each owner url, e.g. "/ms",
+                    cluster urls and node urls
+            Returns:
+                (EffectiveManagedFiles). Effective managed-files, keyed by
+                the model paths the references get in the model
+        """
+        return EffectiveManagedFiles.build(
+            ((url + suffix, path, mode) for url, source_path in self.inherits
+             for suffix, path, mode in self.expand(source_path)),
+            owner_nodes)
+
+
+class ReconcileReport(object):
+    """
+        Differences between the effective managed-files and the deployment
+    """
+
+    def __init__(self):
+        self.checked = 0
+        self.mismatches = []
+
+    def __nonzero__(self):
+        return not self.mismatches
+
+    def __str__(self):
+        lines = ["{0} managed files checked, {1} differ from the model".format(
+            self.checked, len(self.mismatches))]
+        for node, path, expected, actual, url in sorted(self.mismatches):
+            lines.append("{0}:{1} model {2} ({3}) deployment {4}".format(
+                node, path, expected, url,
+                "missing" if actual is None else actual))
+        return "\n".join(lines)
+
+
+def reconcile(effective, actual_modes):
+    """
+        Compares the effective managed-files with the modes found in the
+        deployment in a single pass keyed on (node, path)
+
+        Args:
+            effective (EffectiveManagedFiles): Expected state from the model
+            actual_modes (dict): {path: mode} found on each node
+        Returns:
+            (ReconcileReport). Every (node, path) whose mode differs
+    """
+    report = ReconcileReport()
+    for (node, path), (_, mode, url) in effective.files.iteritems():
+        actual = actual_modes.get(node, {}).get(path)
+        report.checked += 1
+        if actual is None or not modes_equal(mode, actual):
+            report.mismatches.append((node, path, mode, actual, url))
+    return report
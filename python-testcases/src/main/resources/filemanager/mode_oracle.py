@@ -0,0 +1,284 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In-process oracle of how the file plugin validates and applies
+            the mode of a managed-file. The valid-mode rule is not written
+            here: it is the regex of the property type the plugin registers
+            for the mode property, read from the LITP extensions installed
+            on the ms. A generator of valid and invalid modes checks the
+            requirements of the mode property against that rule over
+            thousands of values in seconds; only a sample of them needs to
+            be confirmed on a deployment.
+"""
+
+import json
+import os
+import pipes
+import random
+import re
+import stat
+import subprocess
+import sys
+
+OCTAL_DIGITS = "01234567"
+# Largest mode chmod applies: permission, setuid, setgid and sticky bits
+MAX_MODE = 07777
+MODE_ITEM_TYPE = "managed-file"
+MODE_PROPERTY = "mode"
+LITP_ROOT_ENV = "FILEMANAGER_LITP_ROOT"
+DEFAULT_LITP_ROOT = "/opt/ericsson/nms/litp"
+# Property type of the mode as the filemanager extension defines it, for
+# hosts without the extension installed
+FILE_MODE_PROPERTY_TYPE = "file_mode"
+FILE_MODE_REGEX = r"^[0-7]{3,4}$"
+# Number and seed of the generated modes the oracle checks
+MODE_SAMPLES_ENV = "FILEMANAGER_MODE_SAMPLES"
+MODE_SEED_ENV = "FILEMANAGER_MODE_SEED"
+DEFAULT_MODE_SAMPLES = 5000
+MAX_REPORTED_VIOLATIONS = 20
+# Values that look like modes but are not all octal digits
+INVALID_MODE_SAMPLES = ("", "7", "75", "75555", "00755", "758", "799",
+                        "abc", "0o755", "0x1ed", "u+x", "rwxr-xr-x", "-755",
+                        "+755", " 755", "755 ", "7 55", "75.5")
+# Modes confirmed on a deployment, each valid or not as the rule says
+DEPLOYMENT_SAMPLE_MODES = ("640", "0640", "755", "0755", "4755", "2750",
+                           "1777", "0000", "758", "75", "75555", "abc",
+                           "u+x")
+# Ran by the python of the ms: loads every LITP extension registered in
+# etc/extensions as litpd does and prints the property type of the mode of
+# a managed-file as JSON
+MODE_RULE_SCRIPT = """
+import ConfigParser, glob, json, os, sys
+root = os.environ.get("{env}", "{root}")
+sys.path.insert(0, os.path.join(root, "lib"))
+try:
+    item_types = {{}}
+    property_types = {{}}
+    for conf in sorted(glob.glob(os.path.join(root, "etc", "extensions",
+                                              "*.conf"))):
+        parser = ConfigParser.RawConfigParser()
+        parser.read(conf)
+        for section in parser.sections():
+            if not parser.has_option(section, "class"):
+                continue
+            module_name, _, class_name = \\
+                parser.get(section, "class").rpartition(".")
+            module = __import__(module_name, fromlist=[class_name])
+            extension = getattr(module, class_name)()
+            for property_type in extension.define_property_types():
+                property_types[property_type.property_type_id] = \\
+                    property_type
+            for item_type in extension.define_item_types():
+                item_types[item_type.item_type_id] = item_type
+    item_type = item_types["{item_type}"]
+    while "{prop}" not in item_type.structure:
+        item_type = item_types[item_type.extend_item]
+    prop = item_type.structure["{prop}"]
+    property_type = property_types[prop.prop_type_id]
+    print(json.dumps({{
+        "property_type": property_type.property_type_id,
+        "regex": property_type.regex,
+        "regex_error_desc": getattr(property_type, "regex_error_desc", None),
+        "validators": [type(validator).__name__ for validator in
+                       getattr(property_type, "validators", None) or []]}}))
+except Exception as error:
+    print(json.dumps({{"error": "{{0}}: {{1}}".format(
+        type(error).__name__, error)}}))
+""".format(env=LITP_ROOT_ENV, root=DEFAULT_LITP_ROOT,
+           item_type=MODE_ITEM_TYPE, prop=MODE_PROPERTY)
+
+
+class ModeRule(object):
+    """
+        Valid-mode rule of the property type of the mode property
+    """
+
+    def __init__(self, property_type, regex, regex_error_desc=None,
+                 validators=()):
+        """
+            Args:
+                property_type (str): Id of the LITP property type
+                regex (str): Regex a valid value matches
+                regex_error_desc (str): Description the property type adds
+                    to the error of a value not matching the regex
+                validators (list): Class names of the further validators of
+                    the property type, which the oracle does not model
+        """
+        self.property_type = property_type
+        self.regex = regex
+        self.regex_error_desc = regex_error_desc
+        self.validators = list(validators)
+        self._pattern = re.compile(regex)
+
+    def accepts(self, mode):
+        """
+            Returns True if the property type accepts a value, as LITP
+            matches it against the regex
+        """
+        return self._pattern.match(mode) is not None
+
+    def get_error_parts(self, mode):
+        """
+            Returns the text the error of a rejected value must contain: the
+            property, the value and the description of the property type
+        """
+        parts = ['"{0}"'.format(MODE_PROPERTY), "'{0}'".format(mode)]
+        if self.regex_error_desc:
+            parts.append(self.regex_error_desc)
+        return parts
+
+    def __repr__(self):
+        return "ModeRule({0}, {1!r})".format(self.property_type, self.regex)
+
+
+def get_mode_rule_cmd():
+    """
+        Returns the shell command printing the property type of the mode
+        of a managed-file on the ms
+    """
+    return "python -c {0}".format(pipes.quote(MODE_RULE_SCRIPT))
+
+
+def parse_mode_rule(stdout):
+    """
+        Parses the output of the command from get_mode_rule_cmd
+
+        Returns:
+            (ModeRule). Rule of the plugin's property type
+        Raises:
+            ValueError: if the property type could not be read
+    """
+    for line in stdout:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if "error" in record:
+            raise ValueError("Cannot read the property type of {0} {1}: "
+                             "{2}".format(MODE_ITEM_TYPE, MODE_PROPERTY,
+                                          record["error"]))
+        return ModeRule(record["property_type"], record["regex"],
+                        record.get("regex_error_desc"),
+                        record.get("validators") or [])
+    raise ValueError("No property type of {0} {1} in: {2}".format(
+        MODE_ITEM_TYPE, MODE_PROPERTY, " ".join(stdout)))
+
+
+def load_local_mode_rule():
+    """
+        Returns the ModeRule of the LITP extensions installed on this host,
+        None if LITP is not installed here
+    """
+    root = os.environ.get(LITP_ROOT_ENV, DEFAULT_LITP_ROOT)
+    if not os.path.isdir(os.path.join(root, "etc", "extensions")):
+        return None
+    process = subprocess.Popen([sys.executable, "-c", MODE_RULE_SCRIPT],
+                               stdout=subprocess.PIPE)
+    stdout, _ = process.communicate()
+    return parse_mode_rule(stdout.splitlines())
+
+
+def get_local_mode_rule():
+    """
+        Returns the ModeRule of the LITP extensions installed on this host,
+        or the one of the filemanager extension if LITP is not installed
+        here
+    """
+    return load_local_mode_rule() or ModeRule(FILE_MODE_PROPERTY_TYPE,
+                                              FILE_MODE_REGEX)
+
+
+def normalise_mode(mode):
+    """
+        Returns a valid mode as stat -c %a prints it once the plugin applied
+        it, e.g. "0755" becomes "755" and "0006" becomes "6"
+    """
+    return "{0:o}".format(int(mode, 8))
+
+
+def get_applied_mode(file_path, mode):
+    """
+        Applies a mode to a file with chmod and returns it as stat -c %a
+        prints it
+    """
+    os.chmod(file_path, int(mode, 8))
+    return "{0:o}".format(stat.S_IMODE(os.stat(file_path).st_mode))
+
+
+def is_octal_mode(mode):
+    """
+        Returns True if chmod can apply a value: octal digits making a mode
+        of at most 07777
+    """
+    return mode != "" and all(char in OCTAL_DIGITS for char in mode) and \
+        int(mode, 8) <= MAX_MODE
+
+
+def generate_modes(count, seed=None):
+    """
+        Generates mode values: valid 3 and 4 digit modes with and without
+        a leading 0 and special bits, and invalid values made by changing
+        the length, adding characters that are not octal digits or padding
+        valid modes
+
+        Args:
+            count (int): Number of values to generate
+            seed (int): Seed of the generator, for a reproducible run
+        Returns:
+            (list). Generated values
+    """
+    rand = random.Random(seed)
+    modes = list(INVALID_MODE_SAMPLES)
+    while len(modes) < count:
+        kind = rand.randint(0, 5)
+        digits = "".join(rand.choice(OCTAL_DIGITS) for _ in xrange(3))
+        if kind == 0:
+            modes.append(digits)
+        elif kind == 1:
+            modes.append("0" + digits)
+        elif kind == 2:
+            modes.append(rand.choice(OCTAL_DIGITS[1:]) + digits)
+        elif kind == 3:
+            length = rand.choice((0, 1, 2, 5, 6))
+            modes.append("".join(rand.choice(OCTAL_DIGITS)
+                                 for _ in xrange(length)))
+        elif kind == 4:
+            position = rand.randint(0, 3)
+            modes.append(digits[:position] + rand.choice("89 .-+xo") +
+                         digits[position:])
+        else:
+            modes.append(rand.choice(("0", " ", "00")) + digits +
+                         rand.choice(("", " ", "0")))
+    return modes[:count]
+
+
+def check_mode_properties(mode, rule):
+    """
+        Checks the requirements of the mode property for a value against
+        the rule of the plugin's property type: 3 digit modes and 4 digit
+        ones with a leading 0 are accepted, and nothing chmod cannot apply
+        is, as the plan would then fail on the nodes
+
+        Args:
+            mode (str): Value of the mode property
+            rule (ModeRule): Rule of the plugin's property type
+        Returns:
+            (list). Description of each requirement that does not hold
+    """
+    violations = []
+    accepted = rule.accepts(mode)
+    octal = is_octal_mode(mode)
+    if octal and len(mode) == 3 and not accepted:
+        violations.append("3 digit mode {0!r} rejected".format(mode))
+    if octal and len(mode) == 4 and mode[0] == "0" and not accepted:
+        violations.append("4 digit mode {0!r} rejected".format(mode))
+    if accepted and not octal:
+        violations.append("{0!r} accepted, chmod cannot apply it".format(
+            mode))
+    return violations
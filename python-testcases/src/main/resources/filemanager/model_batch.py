@@ -0,0 +1,148 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Queues LITP model create/inherit/update/remove commands and
+            runs them on the ms in a single remote call, or in as few as
+            the length of a command allows
+"""
+
+from file_utils import join_cmds, MAX_CMD_BYTES
+
+BATCH_MARKER = "##MODEL_BATCH_ITEM##"
+
+
+class ModelBatchItem(object):
+    """
+        A queued LITP model command and, once flushed, its outcome
+    """
+
+    def __init__(self, action, url, cmd):
+        self.action = action
+        self.url = url
+        self.cmd = cmd
+        self.rc = None
+        self.output = []
+
+    @property
+    def succeeded(self):
+        """
+            Returns True if the command ran and returned 0
+        """
+        return self.rc == 0
+
+    def __repr__(self):
+        return "ModelBatchItem({0}, {1}, rc={2})".format(self.action,
+                                                         self.url, self.rc)
+
+
+class ModelBatch(object):
+    """
+        Builds shell scripts out of queued litp commands, a single one
+        unless it would be longer than a remote command may be.
+
+        Every command runs even if an earlier one failed, its stdout and
+        stderr are captured together and attributed to the item by the
+        marker line echoed after it.
+    """
+
+    def __init__(self, cli):
+        self.cli = cli
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def _queue(self, action, url, cmd):
+        """
+            Adds a command to the batch and returns its ModelBatchItem
+        """
+        item = ModelBatchItem(action, url, cmd)
+        self.items.append(item)
+        return item
+
+    def create(self, url, class_type, props=''):
+        """
+            Queues a litp create command
+        """
+        return self._queue("create", url,
+                           self.cli.get_create_cmd(url, class_type, props))
+
+    def inherit(self, url, source_path, props=''):
+        """
+            Queues a litp inherit command
+        """
+        return self._queue("inherit", url,
+                           self.cli.get_inherit_cmd(url, source_path, props))
+
+    def update(self, url, props):
+        """
+            Queues a litp update command
+        """
+        return self._queue("update", url, self.cli.get_update_cmd(url, props))
+
+    def remove(self, url):
+        """
+            Queues a litp remove command
+        """
+        return self._queue("remove", url, self.cli.get_remove_cmd(url))
+
+    def get_cmds(self, max_bytes=MAX_CMD_BYTES):
+        """
+            Returns the shell scripts running every queued command in order,
+            none of them longer than max_bytes
+
+            Args:
+                max_bytes (int): Largest script length
+            Returns:
+                (list). Scripts to run one after the other
+        """
+        return join_cmds(['{0} 2>&1; echo "{1} {2} $?"'.format(
+            item.cmd, BATCH_MARKER, index)
+                          for index, item in enumerate(self.items)],
+                         max_bytes)
+
+    def parse_output(self, stdout):
+        """
+            Sets the return code and output of each item from the output
+            of a script built by get_cmds
+
+            Args:
+                stdout (list): Output lines of the script
+        """
+        output = []
+        for line in stdout:
+            if line.startswith(BATCH_MARKER):
+                index, rc = line[len(BATCH_MARKER):].split()
+                item = self.items[int(index)]
+                item.rc = int(rc)
+                item.output = output
+                output = []
+            else:
+                output.append(line)
+
+    def flush(self, run_command, node, max_bytes=MAX_CMD_BYTES):
+        """
+            Runs every queued command on the node in one remote call, or one
+            per script of get_cmds, and empties the batch
+
+            Args:
+                run_command (callable): Called as run_command(node, cmd) and
+                    returns (stdout, stderr, rc)
+                node (str): node the litp commands are ran on, the ms
+                max_bytes (int): Largest script sent in one remote call
+            Returns:
+                (list). The ModelBatchItem of every command, in queue order.
+                Items whose command never ran keep rc None.
+        """
+        items = self.items
+        for cmd in self.get_cmds(max_bytes):
+            stdout, _, _ = run_command(node, cmd)
+            self.parse_output(stdout)
+        self.items = []
+        return items
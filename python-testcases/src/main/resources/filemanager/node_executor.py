@@ -0,0 +1,138 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runs the same operation against the ms and peer nodes at the
+            same time so that per-node work does not grow linearly with
+            the size of the cluster
+"""
+
+import sys
+import threading
+import traceback
+from multiprocessing.pool import ThreadPool
+
+DEFAULT_MAX_WORKERS = 8
+# Upper bound on a single node operation. A timeout on get() also keeps the
+# main thread responsive to KeyboardInterrupt on python 2
+NODE_OPERATION_TIMEOUT = 60 * 60
+
+
+class NodeResults(object):
+    """
+        Results and errors of an operation ran on several nodes
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.errors = {}
+
+    def __getitem__(self, node):
+        return self.results[node]
+
+    @property
+    def failed_nodes(self):
+        """
+            Returns the nodes on which the operation raised, in node order
+        """
+        return sorted(self.errors)
+
+    def get_error_summary(self):
+        """
+            Returns a message describing every error raised, one per node
+        """
+        return "\n".join("{0}: {1}".format(node, self.errors[node][1])
+                         for node in self.failed_nodes)
+
+
+class SerialCommandMixin(object):
+    """
+        Lets one thread at a time into the run_command of the classes after
+        it, GenericTest's, whose connection state is shared by every thread
+        of the test. Listed before GenericTest in the bases of a test class
+        whose operations NodeExecutor runs on threads.
+    """
+
+    # Shared by every test of the process, as the connections are
+    command_lock = threading.RLock()
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+            Runs a command on a node once no other thread is running one
+        """
+        with self.command_lock:
+            return super(SerialCommandMixin, self).run_command(
+                node, cmd, *args, **kwargs)
+
+
+class NodeExecutor(object):
+    """
+        Fans a callable out across nodes on a bounded thread pool.
+
+        The callable is invoked as func(node, *args, **kwargs). Any exception
+        it raises is caught and recorded against the node rather than
+        aborting the other nodes. The callable must be safe to run on
+        several threads: its remote commands use a connection of their own,
+        e.g. a channel of an SSHConnectionPool, or a run_command serialised
+        by SerialCommandMixin.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _call(func, node, args, kwargs):
+        """
+            Runs func on a single node and returns (result, error)
+        """
+        try:
+            return func(node, *args, **kwargs), None
+        except Exception:  # pylint: disable=broad-except
+            exc_type, exc_value, exc_tb = sys.exc_info()
+            return None, (exc_value, "".join(
+                traceback.format_exception_only(exc_type, exc_value)).strip(),
+                          "".join(traceback.format_tb(exc_tb)))
+
+    def run(self, func, nodes, *args, **kwargs):
+        """
+            Runs func on every node, at most max_workers at a time
+
+            Args:
+                func (callable): Operation taking the node as first argument
+                nodes (list): Nodes to run the operation on
+            Returns:
+                (NodeResults). Value returned by func for each node that
+                succeeded and (exception, message, traceback) for each node
+                that raised
+        """
+        node_results = NodeResults()
+        nodes = list(nodes)
+        workers = min(self.max_workers, len(nodes))
+        if workers <= 1:
+            outcomes = [self._call(func, node, args, kwargs)
+                        for node in nodes]
+        else:
+            pool = ThreadPool(workers)
+            try:
+                pending = [pool.apply_async(self._call,
+                                            (func, node, args, kwargs))
+                           for node in nodes]
+                outcomes = [result.get(NODE_OPERATION_TIMEOUT)
+                            for result in pending]
+            finally:
+                pool.close()
+                pool.join()
+
+        for node, (result, error) in zip(nodes, outcomes):
+            if error is None:
+                node_results.results[node] = result
+            else:
+                node_results.errors[node] = error
+        return node_results
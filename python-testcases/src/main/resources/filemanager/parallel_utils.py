@@ -0,0 +1,103 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Isolation between test workers ran in parallel by the nose
+            multiprocess plugin (nosetests --processes=N): a name prefix per
+            worker and a lock serialising model changes and plans
+"""
+
+import fcntl
+import multiprocessing
+import os
+import time
+
+PLAN_LOCK_PATH = "/tmp/filemanager_testware_plan.lock"
+
+
+def in_worker_process():
+    """
+        Returns True when running in a nose multiprocess worker
+    """
+    return multiprocessing.current_process().name != "MainProcess"
+
+
+def get_worker_suffix():
+    """
+        Returns a suffix unique to this worker for names of model items and
+        files, empty when the tests are not ran in parallel
+    """
+    if in_worker_process():
+        return "_w{0}".format(os.getpid())
+    return ""
+
+
+class PlanLock(object):
+    """
+        Exclusive lock shared by all workers on the host.
+
+        The LITP model is shared by every worker and create_plan picks up
+        every pending change, so a worker holds the lock from a model change
+        until the plan applying it has finished. The lock is counted: it is
+        only released once released as many times as it was acquired. It
+        can be held with a with statement.
+    """
+
+    def __init__(self, path=PLAN_LOCK_PATH):
+        self.path = path
+        self.held_secs = 0.0
+        self._lock_file = None
+        self._depth = 0
+        self._acquired_at = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    @property
+    def held(self):
+        """
+            Returns True if this process holds the lock
+        """
+        return self._lock_file is not None
+
+    def acquire(self):
+        """
+            Blocks until the lock is held by this process
+        """
+        if self.held:
+            self._depth += 1
+            return
+        lock_file = open(self.path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._lock_file = lock_file
+            self._depth = 1
+            self._acquired_at = time.time()
+        finally:
+            if self._lock_file is None:
+                lock_file.close()
+
+    def release(self):
+        """
+            Releases the lock once released as many times as acquired
+        """
+        if not self.held:
+            return
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        self.held_secs += time.time() - self._acquired_at
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
@@ -0,0 +1,219 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Waits for a LITP plan to reach a terminal state, polling with an
+            adaptive interval and recording how long each task took, or
+            only until the first task fails when the plan can then no
+            longer succeed
+"""
+
+import time
+
+PLAN_STATUS_PREFIX = "Plan Status:"
+TERMINAL_PLAN_STATUSES = ("Successful", "Failed", "Stopped", "Invalid")
+TASK_STATES = ("Initial", "Running", "Success", "Failed", "Stopped")
+FINISHED_TASK_STATES = ("Success", "Failed", "Stopped")
+PUPPET_LOG_PATH = "/var/log/messages"
+PUPPET_LOG_TAIL_LINES = 40
+
+
+def parse_show_plan(stdout):
+    """
+        Parses the output of litp show_plan
+
+        Args:
+            stdout (list): Output lines of litp show_plan
+        Returns:
+            (tuple). Plan status, e.g. "Running", or None if not found and a
+            dict of task state keyed by (item url, task description)
+    """
+    status = None
+    tasks = []
+    task = None
+    for line in stdout:
+        stripped = line.strip()
+        if stripped.startswith(PLAN_STATUS_PREFIX):
+            status = stripped[len(PLAN_STATUS_PREFIX):].strip()
+            task = None
+            continue
+        fields = stripped.split(None, 1)
+        if len(fields) == 2 and fields[0] in TASK_STATES \
+                and fields[1].startswith("/"):
+            task = (fields[0], fields[1], [])
+            tasks.append(task)
+        elif task is not None and stripped and line[:1].isspace():
+            task[2].append(stripped)
+        else:
+            task = None
+
+    task_states = {}
+    for state, url, description in tasks:
+        task_states[(url, " ".join(description))] = state
+    return status, task_states
+
+
+def get_puppet_log_tail_cmd(num_lines=PUPPET_LOG_TAIL_LINES):
+    """
+        Returns a command printing the last puppet lines of the system log
+        of a node
+    """
+    return "grep -F puppet {0} | tail -n {1}".format(PUPPET_LOG_PATH,
+                                                     num_lines)
+
+
+class TaskTiming(object):
+    """
+        Observed start, end and final state of a plan task
+    """
+
+    def __init__(self, url, description):
+        self.url = url
+        self.description = description
+        self.state = None
+        self.start = None
+        self.end = None
+
+    @property
+    def duration(self):
+        """
+            Returns the seconds between the task being seen to start and to
+            finish, None while it has not finished
+        """
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+
+class PlanWaitResult(object):
+    """
+        Outcome of PlanWaiter.wait
+    """
+
+    def __init__(self, status, elapsed, polls, task_timings, aborted=False):
+        self.status = status
+        self.elapsed = elapsed
+        self.polls = polls
+        self.task_timings = task_timings
+        self.aborted = aborted
+
+    @property
+    def timed_out(self):
+        """
+            Returns True if the plan had not finished when the wait ended
+        """
+        return not self.aborted and \
+            self.status not in TERMINAL_PLAN_STATUSES
+
+    def get_failed_tasks(self):
+        """
+            Returns the TaskTiming of the tasks that failed, in the order
+            they were seen to fail
+        """
+        return sorted((timing for timing in self.task_timings.itervalues()
+                       if timing.state == "Failed"),
+                      key=lambda timing: (timing.end, timing.url))
+
+    def get_timing_report(self):
+        """
+            Returns one line per task with its final state and duration
+        """
+        lines = []
+        for timing in sorted(self.task_timings.itervalues(),
+                             key=lambda timing: (timing.start is None,
+                                                 timing.start)):
+            duration = timing.duration
+            lines.append("{0:>8} {1:<8} {2} {3}".format(
+                "-" if duration is None else "{0:.1f}s".format(duration),
+                timing.state, timing.url, timing.description))
+        return "\n".join(lines)
+
+
+class PlanWaiter(object):
+    """
+        Polls the plan until it reaches a terminal status.
+
+        The poll interval starts small and grows by backoff up to
+        max_interval while nothing changes; it drops back to the initial
+        interval whenever a task changes state, as the plan is then likely
+        to finish soon.
+    """
+
+    def __init__(self, poll, initial_interval=1.0, max_interval=10.0,
+                 backoff=1.5, clock=time.time, sleep=time.sleep):
+        """
+            Args:
+                poll (callable): Returns (plan status, task states) as
+                    returned by parse_show_plan
+        """
+        self.poll = poll
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.clock = clock
+        self.sleep = sleep
+
+    def _record(self, task_timings, task_states, poll_time, last_poll_time):
+        """
+            Updates the task timings from the task states of one poll and
+            returns True if any task changed state
+        """
+        changed = False
+        for (url, description), state in task_states.iteritems():
+            timing = task_timings.get((url, description))
+            if timing is None:
+                timing = TaskTiming(url, description)
+                task_timings[(url, description)] = timing
+            if state == timing.state:
+                continue
+            changed = True
+            if timing.start is None and state != "Initial":
+                # Started at the latest at this poll, at the earliest just
+                # after the previous one if it was never seen running
+                timing.start = poll_time if state == "Running" \
+                    else last_poll_time
+            if state in FINISHED_TASK_STATES:
+                timing.end = poll_time
+            timing.state = state
+        return changed
+
+    def wait(self, timeout_secs, fail_fast=False):
+        """
+            Waits for the plan to reach a terminal status
+
+            Args:
+                timeout_secs (int): Seconds to wait before giving up
+                fail_fast (bool): Also stop waiting as soon as a task is
+                    seen to fail, as the plan can then no longer succeed
+            Returns:
+                (PlanWaitResult). Last plan status seen, time waited, number
+                of polls and the TaskTiming of each task
+        """
+        start = self.clock()
+        deadline = start + timeout_secs
+        interval = self.initial_interval
+        task_timings = {}
+        polls = 0
+        last_poll_time = start
+        while True:
+            status, task_states = self.poll()
+            polls += 1
+            now = self.clock()
+            if self._record(task_timings, task_states, now, last_poll_time):
+                interval = self.initial_interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+            last_poll_time = now
+            if fail_fast and status not in TERMINAL_PLAN_STATUSES and \
+                    "Failed" in task_states.itervalues():
+                return PlanWaitResult(status, now - start, polls,
+                                      task_timings, aborted=True)
+            if status in TERMINAL_PLAN_STATUSES or now >= deadline:
+                return PlanWaitResult(status, now - start, polls,
+                                      task_timings)
+            self.sleep(max(0, min(interval, deadline - now)))
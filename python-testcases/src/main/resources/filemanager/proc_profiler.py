@@ -0,0 +1,389 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Profiles what a plan costs the ms and peer nodes: a sidecar
+            thread samples /proc on each node while the plan runs, giving a
+            compact time series of host CPU and of the CPU, resident memory
+            and I/O of the litpd and puppet processes, summarised into
+            metrics compared against a baseline run.
+
+            Usage:
+                python proc_profiler.py local <secs> [<processes>]
+                python proc_profiler.py report <profile.jsonl>
+                python proc_profiler.py compare <profile.jsonl> <baseline>
+            local samples the processes of this host matching the comma
+            separated names, e.g. python,sshd, and prints their profile.
+            compare exits with 1 if any metric regressed.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmark_utils import BenchmarkResult, BenchmarkResults, \
+    compare_to_baseline, DEFAULT_TOLERANCE
+
+PROFILE_PATH_ENV = "FILEMANAGER_PROFILE"
+PROFILE_BASELINE_ENV = "FILEMANAGER_PROFILE_BASELINE"
+PROFILE_INTERVAL_ENV = "FILEMANAGER_PROFILE_INTERVAL"
+PROFILE_PROCESSES_ENV = "FILEMANAGER_PROFILE_PROCESSES"
+DEFAULT_INTERVAL_SECS = 2.0
+# Processes profiled on each node, matched against their command line
+DEFAULT_PROFILE_PROCESSES = ("litpd", "puppet", "mcollectived")
+PROFILE_SWEEP = "plan_profile"
+
+
+def get_proc_sample_cmd(processes=DEFAULT_PROFILE_PROCESSES):
+    """
+        Returns a shell command printing the clock ticks per second of the
+        CPU times, the CPU times of the host and, for each process whose
+        command line contains one of the names, one line
+        "<name> <utime> <stime> : <rss kB> : <read bytes> <write bytes>".
+        The first letter of the name is bracketed so that pgrep does not
+        match the command itself. The I/O of a process is only readable by
+        its owner and root, it is left empty for the others.
+    """
+    cmd = ["echo \"clk_tck $(getconf CLK_TCK)\"", "head -n 1 /proc/stat"]
+    for name in processes:
+        cmd.append(
+            "for pid in $(pgrep -f '[{0}]{1}'); do echo \"{2} "
+            "$(cut -d' ' -f14,15 /proc/$pid/stat 2>/dev/null) : "
+            "$(awk '/^VmRSS:/{{print $2}}' /proc/$pid/status 2>/dev/null) : "
+            "$(awk '/^(read|write)_bytes:/{{printf \"%s \", $2}}' "
+            "/proc/$pid/io 2>/dev/null)\"; done".format(
+                name[0], name[1:], name))
+    return "; ".join(cmd)
+
+
+def parse_proc_sample(stdout):
+    """
+        Parses the output of the command from get_proc_sample_cmd
+
+        Returns:
+            (dict). "clk_tck": clock ticks per second, "cpu": (busy, total)
+            ticks of the host and, for each process name, [cpu ticks,
+            rss kB, I/O bytes, processes]. The I/O bytes are None if the
+            I/O of any of the processes was not readable, as the command
+            did not run as root.
+        Raises:
+            ValueError: if the clock ticks are missing
+    """
+    sample = {}
+    for line in stdout:
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == "clk_tck":
+            if len(fields) != 2 or not fields[1].isdigit():
+                raise ValueError("No clock ticks per second: {0}".format(
+                    line))
+            sample["clk_tck"] = int(fields[1])
+            continue
+        if fields[0] == "cpu":
+            ticks = [int(field) for field in fields[1:]]
+            # idle and iowait are the 4th and 5th columns
+            idle = sum(ticks[3:5])
+            sample["cpu"] = (sum(ticks) - idle, sum(ticks))
+            continue
+        cpu, rss, io = [[int(field) for field in group.split()
+                         if field.isdigit()]
+                        for group in line.split(":")]
+        # A process that exited while it was sampled has no CPU times
+        if len(cpu) < 2:
+            continue
+        totals = sample.setdefault(fields[0], [0, 0, 0, 0])
+        totals[0] += sum(cpu[:2])
+        # Zombies and kernel threads have no resident set
+        totals[1] += sum(rss[:1])
+        if len(io) < 2 or totals[2] is None:
+            totals[2] = None
+        else:
+            totals[2] += sum(io[:2])
+        totals[3] += 1
+    if "cpu" in sample and "clk_tck" not in sample:
+        raise ValueError("No clock ticks per second in the sample")
+    return sample
+
+
+def sample_local(cmd):
+    """
+        Runs a sample command on this host
+
+        Returns:
+            (list). Output lines of the command
+    """
+    process = subprocess.Popen(["/bin/sh", "-c", cmd],
+                               stdout=subprocess.PIPE)
+    stdout, _ = process.communicate()
+    return stdout.splitlines()
+
+
+class ProcProfile(object):
+    """
+        Samples of one node taken while a plan ran
+    """
+
+    def __init__(self, node, processes):
+        self.node = node
+        self.processes = processes
+        self.samples = []
+
+    def get_clock_ticks(self):
+        """
+            Returns the clock ticks per second of the CPU times of the node
+        """
+        return self.samples[0][1]["clk_tck"]
+
+    def add(self, sample_time, sample):
+        """
+            Records a sample parsed by parse_proc_sample
+        """
+        if "cpu" in sample:
+            self.samples.append((sample_time, sample))
+
+    def get_columns(self):
+        """
+            Returns the names of the columns of the time series
+        """
+        columns = ["secs", "host_cpu_pct"]
+        for name in self.processes:
+            columns.extend(["{0}_cpu_pct".format(name),
+                            "{0}_rss_kb".format(name),
+                            "{0}_io_bytes".format(name)])
+        return columns
+
+    def get_rows(self):
+        """
+            Returns one row per interval between two samples: its end in
+            seconds from the first sample, the CPU used in it in percent of
+            one CPU for processes and of all CPUs for the host, the resident
+            memory at its end and the I/O done in it, None if the I/O of
+            the processes was not readable
+        """
+        rows = []
+        start = self.samples[0][0] if self.samples else 0
+        for (before_time, before), (after_time, after) in zip(
+                self.samples, self.samples[1:]):
+            secs = max(after_time - before_time, 1e-6)
+            busy = after["cpu"][0] - before["cpu"][0]
+            total = after["cpu"][1] - before["cpu"][1]
+            row = [round(after_time - start, 2),
+                   round(100.0 * busy / total, 1) if total else 0.0]
+            for name in self.processes:
+                previous = before.get(name, [0, 0, 0, 0])
+                current = after.get(name, [0, 0, 0, 0])
+                io_bytes = None
+                if previous[2] is not None and current[2] is not None:
+                    io_bytes = max(current[2] - previous[2], 0)
+                row.extend([
+                    round(100.0 * max(current[0] - previous[0], 0) /
+                          self.get_clock_ticks() / secs, 1),
+                    current[1], io_bytes])
+            rows.append(row)
+        return rows
+
+    def get_metrics(self):
+        """
+            Returns the metrics compared against the baseline: CPU seconds
+            used by the host and each process, peak resident memory and
+            total I/O of each process. The I/O of a process is left out if
+            it was not readable in every sample.
+        """
+        if len(self.samples) < 2:
+            return {}
+        first, last = self.samples[0][1], self.samples[-1][1]
+        clock_ticks = self.get_clock_ticks()
+        metrics = {"host_cpu_busy_secs": round(
+            float(last["cpu"][0] - first["cpu"][0]) / clock_ticks, 2)}
+        rows = self.get_rows()
+        for index, name in enumerate(self.processes):
+            column = 2 + 3 * index
+            metrics["{0}_cpu_secs".format(name)] = round(float(sum(
+                max(after.get(name, [0])[0] - before.get(name, [0])[0], 0)
+                for (_, before), (_, after) in zip(
+                    self.samples, self.samples[1:]))) / clock_ticks, 2)
+            metrics["{0}_rss_peak_kb".format(name)] = max(
+                sample.get(name, [0, 0])[1] for _, sample in self.samples)
+            io_bytes = [row[column + 2] for row in rows]
+            if None not in io_bytes:
+                metrics["{0}_io_bytes".format(name)] = sum(io_bytes)
+        return metrics
+
+    def to_dict(self, case):
+        """
+            Returns the profile as a compact record: the columns once and
+            one row per interval
+        """
+        return {"case": case, "node": self.node,
+                "start": round(self.samples[0][0], 3) if self.samples
+                else None,
+                "columns": self.get_columns(), "rows": self.get_rows(),
+                "metrics": self.get_metrics()}
+
+
+class PlanProfiler(object):
+    """
+        Sidecar thread sampling every node at a fixed interval until it is
+        stopped. A failed sample is skipped and its error kept in errors,
+        for the test to report once the plan finished.
+    """
+
+    def __init__(self, sample, nodes, processes, interval):
+        """
+            Args:
+                sample (callable): Called as sample(node), returns the
+                    output lines of the command from get_proc_sample_cmd
+                nodes (list): Nodes to sample
+                processes (tuple): Process names sampled
+                interval (float): Seconds between two samples of a node
+        """
+        self.sample = sample
+        self.interval = interval
+        self.profiles = dict((node, ProcProfile(node, processes))
+                             for node in nodes)
+        self.errors = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run,
+                                        name="plan-profiler")
+        self._thread.daemon = True
+
+    def _sample_all(self):
+        """
+            Takes one sample of every node
+        """
+        for node, profile in sorted(self.profiles.iteritems()):
+            try:
+                profile.add(time.time(), parse_proc_sample(self.sample(node)))
+            except Exception as err:  # pylint: disable=broad-except
+                self.errors.append("{0}: {1}".format(node, err))
+
+    def _run(self):
+        """
+            Samples every interval until stopped
+        """
+        while True:
+            self._stop.wait(self.interval)
+            if self._stop.is_set():
+                return
+            self._sample_all()
+
+    def start(self):
+        """
+            Takes a first sample of every node and starts sampling
+        """
+        self._sample_all()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+            Stops sampling after a last sample of every node
+
+            Returns:
+                (dict). ProcProfile of each node
+        """
+        self._stop.set()
+        self._thread.join()
+        self._sample_all()
+        return self.profiles
+
+
+def write_profiles(path, case, profiles):
+    """
+        Appends the profile of each node to a JSON lines file
+    """
+    with open(path, "a") as profile_file:
+        for node in sorted(profiles):
+            profile_file.write(json.dumps(profiles[node].to_dict(case),
+                                          sort_keys=True) + "\n")
+
+
+def get_profile_result(case, node, metrics):
+    """
+        Returns the metrics of a node profiled during a test as a
+        BenchmarkResult, so that they compare against a baseline like
+        the benchmarks do
+    """
+    return BenchmarkResult(PROFILE_SWEEP, {"case": case, "node": node},
+                           metrics)
+
+
+def read_profile_results(path):
+    """
+        Reads the metrics of every profile of a file; a test profiled
+        several times keeps its last profile
+
+        Returns:
+            (BenchmarkResults). Metrics of each test and node
+    """
+    results = BenchmarkResults()
+    with open(path) as profile_file:
+        for line in profile_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            results.add(get_profile_result(record["case"], record["node"],
+                                           record["metrics"]))
+    return results
+
+
+def get_report(profiles):
+    """
+        Returns the time series of each profile as text
+    """
+    lines = []
+    for node in sorted(profiles):
+        profile = profiles[node]
+        lines.append("{0}: {1}".format(node, " ".join(
+            "{0}={1}".format(name, value) for name, value in
+            sorted(profile.get_metrics().iteritems()))))
+        lines.append("    " + " ".join(profile.get_columns()))
+        lines.extend("    " + " ".join(str(value) for value in row)
+                     for row in profile.get_rows())
+    return "\n".join(lines)
+
+
+def main(args):
+    """
+        Runs the local, report or compare command, returns the exit code
+    """
+    if args and args[0] == "local" and len(args) in (2, 3):
+        processes = tuple(args[2].split(",")) if len(args) == 3 \
+            else DEFAULT_PROFILE_PROCESSES
+        cmd = get_proc_sample_cmd(processes)
+        profiler = PlanProfiler(lambda node: sample_local(cmd), ["localhost"],
+                                processes, float(os.environ.get(
+                                    PROFILE_INTERVAL_ENV,
+                                    DEFAULT_INTERVAL_SECS))).start()
+        time.sleep(float(args[1]))
+        sys.stdout.write(get_report(profiler.stop()) + "\n")
+        return 0
+    if len(args) == 2 and args[0] == "report":
+        results = read_profile_results(args[1])
+        for key in sorted(results.results):
+            sys.stdout.write("{0}: {1}\n".format(key, json.dumps(
+                results.get(key).metrics, sort_keys=True)))
+        return 0
+    if len(args) == 3 and args[0] == "compare":
+        results = read_profile_results(args[1])
+        regressions = compare_to_baseline(
+            results.results.values(), read_profile_results(args[2]),
+            DEFAULT_TOLERANCE)
+        sys.stdout.write("\n".join(regressions or ["No regression"]) + "\n")
+        return 1 if regressions else 0
+    sys.stdout.write(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
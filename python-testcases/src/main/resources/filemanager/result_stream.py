@@ -0,0 +1,134 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Stream of test results: one JSON record per test, appended as
+            soon as the test finishes, so that the TAF runner can report
+            each result while the run goes on rather than once the
+            nosetests XML is complete. Results are only streamed if
+            FILEMANAGER_RESULT_STREAM names the file, the same absolute path
+            as the filemanager.result.stream property of the TAF runner. The
+            runner reads it locally, so the path must be shared between the
+            host the tests run on and the TAF host.
+"""
+
+import json
+import os
+import threading
+import time
+import traceback
+
+RESULT_STREAM_ENV = "FILEMANAGER_RESULT_STREAM"
+# Outcome recorded for each unittest result method
+OUTCOMES = {"addSuccess": "success", "addFailure": "failure",
+            "addError": "error", "addSkip": "skipped",
+            "addExpectedFailure": "success",
+            "addUnexpectedSuccess": "failure"}
+
+
+class ResultStream(object):
+    """
+        Appends one JSON record per test to a file. The file is opened on
+        the first record and each record is flushed, so that workers can
+        share the file and a reader sees every finished test. Without a
+        path nothing is recorded.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._stream_file = None
+        self._lock = threading.Lock()
+
+    def record(self, classname, name, outcome, secs, detail=None):
+        """
+            Writes the result of a test
+
+            Args:
+                classname (str): module.Class of the test
+                name (str): Name of the test method
+                outcome (str): success, failure, error or skipped
+                secs (float): Seconds the test took
+                detail (dict): type, message and text of a failure, error
+                    or skip
+        """
+        if self.path is None:
+            return
+        record = {"classname": classname, "name": name, "outcome": outcome,
+                  "time": round(secs, 3)}
+        record.update(detail or {})
+        line = json.dumps(record, sort_keys=True)
+        with self._lock:
+            if self._stream_file is None:
+                self._stream_file = open(self.path, "a")
+            self._stream_file.write(line + "\n")
+            self._stream_file.flush()
+
+    def close(self):
+        """
+            Closes the stream file
+        """
+        with self._lock:
+            if self._stream_file is not None:
+                self._stream_file.close()
+                self._stream_file = None
+
+
+def get_result_stream_path(environ=None):
+    """
+        Returns the absolute path of the file named by
+        FILEMANAGER_RESULT_STREAM, None if results are not streamed
+    """
+    path = (os.environ if environ is None else environ).get(
+        RESULT_STREAM_ENV)
+    return os.path.abspath(path) if path else None
+
+
+def get_detail(args):
+    """
+        Returns the type, message and traceback text of the exc_info tuple
+        or skip reason passed to a unittest result method
+    """
+    if not args:
+        return {}
+    if isinstance(args[0], tuple) and len(args[0]) == 3:
+        exc_type, exc_value, exc_tb = args[0]
+        return {"type": getattr(exc_type, "__name__", str(exc_type)),
+                "message": str(exc_value),
+                "text": "".join(traceback.format_exception(
+                    exc_type, exc_value, exc_tb))}
+    return {"type": "skip", "message": str(args[0]), "text": ""}
+
+
+class RecordingResult(object):
+    """
+        Test result passed to TestCase.run in place of the runner's one: it
+        forwards every call and records the outcome of the test in a
+        ResultStream. Result methods the runner's result does not have are
+        not provided either, so unittest falls back as it would without it.
+    """
+
+    def __init__(self, result, stream, classname, name):
+        self._result = result
+        self._stream = stream
+        self._classname = classname
+        self._name = name
+        self._start = time.time()
+
+    def __getattr__(self, attr):
+        target = getattr(self._result, attr)
+        if attr not in OUTCOMES:
+            return target
+
+        def record_outcome(test, *args):
+            """
+                Records the outcome and forwards it to the runner's result
+            """
+            self._stream.record(self._classname, self._name, OUTCOMES[attr],
+                                time.time() - self._start, get_detail(args))
+            return target(test, *args)
+        return record_outcome
@@ -0,0 +1,133 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Snapshot of the model items a test may change, used to revert
+            the model after the test with a single batch of litp commands
+"""
+
+from managed_file_model import iter_show_items
+
+REFERENCE_TYPE_PREFIX = "reference-to-"
+
+
+def get_parent_url(url):
+    """
+        Returns the model path of the parent of an item
+    """
+    return url.rsplit("/", 1)[0]
+
+
+def get_item_name(url):
+    """
+        Returns the last part of the model path of an item
+    """
+    return url.rsplit("/", 1)[1]
+
+
+class ModelSnapshot(object):
+    """
+        Items and properties of model subtrees at a point in time
+    """
+
+    def __init__(self, items):
+        """
+            Args:
+                items (dict): (item type, properties dict) of each item keyed
+                    by model path
+        """
+        self.items = items
+
+    @classmethod
+    def from_show_output(cls, lines):
+        """
+            Builds a snapshot from the output of litp show -r
+        """
+        return cls(dict((url, (item_type, props))
+                        for url, item_type, props in iter_show_items(lines)))
+
+    def get_new_items(self, current, name_prefix):
+        """
+            Returns the items created since the snapshot by the test owning
+            name_prefix. Only the top most new items are returned as their
+            descendants are removed with them. References under /ms and
+            /deployments come before their /infrastructure sources.
+
+            Args:
+                current (ModelSnapshot): State of the model now
+                name_prefix (str): Names of the items created by the test
+                    start with it, items of other tests are left alone
+            Returns:
+                (list). Model paths of the items to remove, in removal order
+        """
+        new_items = set(url for url in current.items
+                        if url not in self.items)
+        top_items = [url for url in new_items
+                     if get_parent_url(url) not in new_items and
+                     get_item_name(url).startswith(name_prefix)]
+        return sorted(top_items,
+                      key=lambda url: (url.startswith("/infrastructure"),
+                                       url))
+
+    def get_changed_properties(self, current, name_prefix):
+        """
+            Returns the properties changed since the snapshot on items of
+            the test which existed when it was taken. References are skipped
+            as their properties follow the source item unless overwritten.
+
+            Args:
+                current (ModelSnapshot): State of the model now
+                name_prefix (str): Prefix of the names of the test's items
+            Returns:
+                (dict). Snapshot value of each changed property keyed by
+                model path of the item
+        """
+        changed = {}
+        for url, (item_type, props) in self.items.iteritems():
+            if url not in current.items or \
+                    not get_item_name(url).startswith(name_prefix) or \
+                    (item_type or "").startswith(REFERENCE_TYPE_PREFIX):
+                continue
+            current_props = current.items[url][1]
+            old_props = dict((name, value)
+                             for name, value in props.iteritems()
+                             if current_props.get(name) != value)
+            if old_props:
+                changed[url] = old_props
+        return changed
+
+    def get_removed_items(self, current, name_prefix):
+        """
+            Returns the items of the test which existed at the snapshot and
+            have since been removed, which a batch of commands cannot
+            recreate
+        """
+        return sorted(url for url in self.items
+                      if url not in current.items and
+                      get_item_name(url).startswith(name_prefix))
+
+    def queue_revert(self, current, name_prefix, batch):
+        """
+            Queues the litp commands reverting the model to the snapshot
+
+            Args:
+                current (ModelSnapshot): State of the model now
+                name_prefix (str): Prefix of the names of the test's items
+                batch (ModelBatch): Batch the commands are queued in
+            Returns:
+                (list). Items removed since the snapshot that could not be
+                reverted
+        """
+        for url in self.get_new_items(current, name_prefix):
+            batch.remove(url)
+        for url, props in sorted(self.get_changed_properties(
+                current, name_prefix).iteritems()):
+            batch.update(url, " ".join("{0}={1}".format(name, value)
+                                       for name, value in
+                                       sorted(props.iteritems())))
+        return self.get_removed_items(current, name_prefix)
@@ -0,0 +1,864 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In-process simulation of a LITP deployment running the file
+            plugin: a model tree with inheritance, create_plan validation,
+            a plan engine applying file modes, and a file system per node.
+            It answers the litp and shell commands built by this testware,
+            so the tests run in seconds without a management server.
+"""
+
+import json
+import logging
+import re
+import shlex
+import unittest
+
+from model_batch import BATCH_MARKER
+from managed_file_model import EffectiveManagedFiles, MANAGED_FILE_TYPES
+from mode_oracle import get_mode_rule_cmd, get_local_mode_rule, \
+    normalise_mode
+
+MS_HOSTNAME = "ms1"
+RHEL_VERSION = "6.6"
+DEFAULT_FILE_MODE = "644"
+# Rule of the mode of a managed-file, read from the LITP extensions as on
+# the ms
+MODE_RULE = get_local_mode_rule()
+# Bytes of puppet manifest generated for each managed-file on a node
+MANIFEST_BYTES_PER_FILE = 120
+# Child collections created with each item type
+CHILD_COLLECTIONS = {
+    "managed-file-list": (("managed_file_list",
+                           "collection-of-managed-file-base"),)}
+# Item types each collection type accepts
+COLLECTION_CHILD_TYPES = {
+    "collection-of-managed-file-base": ("managed-file", "managed-file-list")}
+REQUIRED_PROPERTIES = {"managed-file": ("path", "mode")}
+# Properties each item type takes, references take those of their source
+ITEM_PROPERTIES = {"managed-file": ("path", "mode"),
+                   "managed-file-list": ()}
+BATCH_ITEM_REGEX = re.compile(r'(.*?) 2>&1; echo "{0} (\d+) \$\?"(?:; )?'
+                              .format(BATCH_MARKER))
+TEE_REGEX = re.compile(r"\| tee -- (.*?) > /dev/null")
+# Longest single argument execve accepts on Linux; the remote shell gets the
+# whole command as one argument
+MAX_ARG_STRLEN = 128 * 1024
+
+
+class SimulatedConstants(object):
+    """
+        Plan states of test_constants used by the tests
+    """
+    PLAN_COMPLETE = 1
+    PLAN_FAILED = 2
+    PLAN_IN_PROGRESS = 3
+
+
+def get_reference_type(item_type):
+    """
+        Returns the type of an item inherited from an item of item_type
+    """
+    if item_type.startswith("collection-of-"):
+        return "ref-" + item_type
+    return "reference-to-" + item_type
+
+
+def get_source_type(item_type):
+    """
+        Returns the type of the item an item of item_type was inherited
+        from, item_type itself if it is not a reference
+    """
+    if item_type.startswith("ref-collection-of-"):
+        return item_type[len("ref-"):]
+    if item_type.startswith("reference-to-"):
+        return item_type[len("reference-to-"):]
+    return item_type
+
+
+def parse_props(words):
+    """
+        Returns the properties given as name=value words
+    """
+    return dict(word.split("=", 1) for word in words if "=" in word)
+
+
+class SimulatedItem(object):
+    """
+        Item of the simulated model. A reference keeps its source and only
+        the properties overwritten on it.
+    """
+
+    def __init__(self, url, item_type, props=None, source=None):
+        self.url = url
+        self.type = item_type
+        self.props = props if props is not None else {}
+        self.source = source
+        self.state = "Initial"
+        self.children = []
+
+
+class SimulatedModel(object):
+    """
+        Model tree of a deployment with one cluster of peer nodes
+    """
+
+    def __init__(self, node_count=2):
+        self.items = {}
+        self.references = {}
+        self.node_hostnames = {}
+        self._add("/infrastructure", "infrastructure")
+        self._add("/infrastructure/managed_files",
+                  "collection-of-managed-file-base")
+        self._add("/ms", "ms", {"hostname": MS_HOSTNAME})
+        self._add("/ms/managed_files", "ref-collection-of-managed-file-base")
+        self.node_hostnames["/ms"] = MS_HOSTNAME
+        self._add("/deployments", "collection-of-deployment")
+        self._add("/deployments/d1", "deployment")
+        self._add("/deployments/d1/clusters", "collection-of-cluster-base")
+        self.cluster_url = "/deployments/d1/clusters/c1"
+        self._add(self.cluster_url, "cluster")
+        self._add(self.cluster_url + "/managed_files",
+                  "ref-collection-of-managed-file-base")
+        self._add(self.cluster_url + "/nodes", "collection-of-node")
+        for index in xrange(1, node_count + 1):
+            node_url = "{0}/nodes/n{1}".format(self.cluster_url, index)
+            hostname = "node{0}".format(index)
+            self._add(node_url, "node", {"hostname": hostname})
+            self._add(node_url + "/managed_files",
+                      "ref-collection-of-managed-file-base")
+            self.node_hostnames[node_url] = hostname
+        for item in self.items.itervalues():
+            item.state = "Applied"
+
+    def _add(self, url, item_type, props=None, source=None):
+        """
+            Adds an item and its child collections under an existing parent
+        """
+        item = SimulatedItem(url, item_type, props, source)
+        self.items[url] = item
+        parent = self.items.get(url.rsplit("/", 1)[0] or "/")
+        if parent is not None:
+            parent.children.append(url)
+        if source is None:
+            for name, child_type in CHILD_COLLECTIONS.get(item_type, ()):
+                self._add("{0}/{1}".format(url, name), child_type)
+        return item
+
+    def get_props(self, item):
+        """
+            Returns the properties of an item, following references, and
+            the names of those overwritten on the reference
+        """
+        if item.source is None:
+            return dict(item.props), set()
+        props = self.get_props(self.items[item.source])[0]
+        props.update(item.props)
+        return props, set(item.props)
+
+    def iter_subtree(self, url):
+        """
+            Yields an item and its descendants, parents first
+        """
+        item = self.items[url]
+        yield item
+        for child in list(item.children):
+            for descendant in self.iter_subtree(child):
+                yield descendant
+
+    def validate_props(self, item_type, props):
+        """
+            Returns the errors of the given properties of an item type: a
+            property the type does not take, or an invalid mode
+        """
+        allowed = ITEM_PROPERTIES.get(get_source_type(item_type), ())
+        errors = ["PropertyNotAllowedError in property: \"{0}\"    \"{0}\" "
+                  "is not an allowed property of {1}".format(name, item_type)
+                  for name in sorted(props) if name not in allowed]
+        mode = props.get("mode")
+        if "mode" in allowed and mode is not None and \
+                not MODE_RULE.accepts(mode):
+            errors.append('ValidationError in property: "mode"    Invalid '
+                          'value \'{0}\'.'.format(mode))
+        return errors
+
+    def create(self, url, item_type, props):
+        """
+            Creates an item and inherits it to every reference of its parent
+        """
+        parent_url = url.rsplit("/", 1)[0]
+        parent = self.items.get(parent_url)
+        if url in self.items:
+            return ["ItemExistsError    Item already exists"]
+        if parent is None:
+            return ["InvalidLocationError    Path not found"]
+        if item_type not in COLLECTION_CHILD_TYPES.get(parent.type, ()):
+            return ["InvalidChildTypeError    '{0}' is not an allowed type "
+                    "for collection item".format(item_type)]
+        errors = ["MissingRequiredPropertyError in property: \"{0}\"    "
+                  "ItemType \"{1}\" is required to have a property with "
+                  "name \"{0}\"".format(name, item_type)
+                  for name in REQUIRED_PROPERTIES.get(item_type, ())
+                  if name not in props]
+        errors.extend(self.validate_props(item_type, props))
+        if errors:
+            return errors
+        self._add(url, item_type, props)
+        for reference in list(self.references.get(parent_url, ())):
+            self._inherit("{0}/{1}".format(reference, url.rsplit("/", 1)[1]),
+                          url, {})
+        return []
+
+    def _inherit(self, url, source_url, props):
+        """
+            Creates a reference to source_url and to each of its children
+        """
+        source = self.items[source_url]
+        self._add(url, get_reference_type(source.type), props, source_url)
+        self.references.setdefault(source_url, []).append(url)
+        for child in source.children:
+            self._inherit("{0}/{1}".format(url, child.rsplit("/", 1)[1]),
+                          child, {})
+
+    def inherit(self, url, source_url, props):
+        """
+            Inherits an item of /infrastructure to a reference collection
+        """
+        parent = self.items.get(url.rsplit("/", 1)[0])
+        source = self.items.get(source_url)
+        if url in self.items:
+            return ["ItemExistsError    Item already exists"]
+        if parent is None or source is None:
+            return ["InvalidLocationError    Not found"]
+        if not parent.type.startswith("ref-collection-of-"):
+            return ["InvalidChildTypeError    Item cannot be inherited "
+                    "to {0}".format(parent.url)]
+        errors = self.validate_props(source.type, props)
+        if errors:
+            return errors
+        self._inherit(url, source_url, props)
+        return []
+
+    def update(self, url, props):
+        """
+            Updates properties of an item, marking it and its references
+            Updated if they were applied
+        """
+        item = self.items.get(url)
+        if item is None:
+            return ["InvalidLocationError    Not found"]
+        errors = self.validate_props(item.type, props)
+        if errors:
+            return errors
+        item.props.update(props)
+        for updated in [item] + [self.items[reference] for reference in
+                                 self.get_all_references(url)]:
+            if updated.state == "Applied":
+                updated.state = "Updated"
+        return []
+
+    def get_all_references(self, url):
+        """
+            Returns the references to an item and to references of it
+        """
+        references = []
+        for reference in self.references.get(url, ()):
+            references.append(reference)
+            references.extend(self.get_all_references(reference))
+        return references
+
+    def remove(self, url):
+        """
+            Removes an item, its descendants and their references. Items
+            never applied are deleted, the others are marked ForRemoval.
+        """
+        if url not in self.items:
+            return ["InvalidLocationError    Not found"]
+        urls = []
+        for item in self.iter_subtree(url):
+            urls.append(item.url)
+            urls.extend(self.get_all_references(item.url))
+        for removed in urls:
+            item = self.items.get(removed)
+            if item is None:
+                continue
+            if item.state == "Initial":
+                self.delete(removed)
+            else:
+                for descendant in self.iter_subtree(removed):
+                    descendant.state = "ForRemoval"
+        return []
+
+    def delete(self, url):
+        """
+            Deletes an item and its descendants from the model
+        """
+        for item in list(self.iter_subtree(url)):
+            del self.items[item.url]
+            if item.source is not None:
+                self.references[item.source].remove(item.url)
+        parent = self.items.get(url.rsplit("/", 1)[0])
+        if parent is not None:
+            parent.children.remove(url)
+
+    def is_dirty(self, item):
+        """
+            Returns True if an item or the source it follows has changes
+            not yet applied
+        """
+        while item is not None:
+            if item.state in ("Initial", "Updated"):
+                return True
+            item = self.items.get(item.source) if item.source else None
+        return False
+
+    def find(self, path, item_type):
+        """
+            Returns the model paths of the items of a type under a path
+        """
+        if path not in self.items:
+            return []
+        return sorted(item.url for item in self.iter_subtree(path)
+                      if item.type == item_type)
+
+    def get_owner_nodes(self):
+        """
+            Returns the hostnames each ms, cluster and node url applies to
+        """
+        owner_nodes = {}
+        for url, hostname in self.node_hostnames.iteritems():
+            owner_nodes[url] = [hostname]
+            if url != "/ms":
+                owner_nodes.setdefault(self.cluster_url, []).append(hostname)
+        return owner_nodes
+
+    def get_managed_files(self, include_removed=False):
+        """
+            Returns (url, path, mode) of every managed-file applying to the
+            ms and peer nodes
+        """
+        managed_files = []
+        for item in self.items.itervalues():
+            if item.type not in MANAGED_FILE_TYPES or \
+                    item.url.startswith("/infrastructure") or \
+                    (item.state == "ForRemoval" and not include_removed):
+                continue
+            props = self.get_props(item)[0]
+            managed_files.append((item.url, props["path"], props["mode"]))
+        return sorted(managed_files)
+
+    def get_effective(self):
+        """
+            Returns the EffectiveManagedFiles of the model
+        """
+        return EffectiveManagedFiles.build(self.get_managed_files(),
+                                           self.get_owner_nodes())
+
+    def show(self, url, recursive):
+        """
+            Returns the output lines of litp show of an item
+        """
+        lines = []
+        items = self.iter_subtree(url) if recursive else [self.items[url]]
+        for item in items:
+            lines.append(item.url)
+            if item.source is not None:
+                lines.append("    inherited from: {0}".format(item.source))
+            lines.append("    type: {0}".format(item.type))
+            lines.append("    state: {0}".format(item.state))
+            props, overwritten = self.get_props(item)
+            if props:
+                lines.append("    properties:")
+                for name, value in sorted(props.iteritems()):
+                    lines.append("        {0}: {1}{2}".format(
+                        name, value, " [*]" if name in overwritten else ""))
+            if not recursive and item.children:
+                lines.append("    children:")
+                lines.extend("        {0}".format(child.rsplit("/", 1)[1])
+                             for child in item.children)
+            lines.append("")
+        return lines
+
+
+class SimulatedTask(object):
+    """
+        Task of a simulated plan, setting the mode of a file on a node or
+        removing a managed-file from the model
+    """
+
+    def __init__(self, url, node, path, mode):
+        self.url = url
+        self.node = node
+        self.path = path
+        self.mode = mode
+        self.state = "Initial"
+
+    @property
+    def description(self):
+        """
+            Returns the description shown by litp show_plan
+        """
+        if self.mode is None:
+            return 'Remove managed-file "{0}" on node "{1}"'.format(
+                self.path, self.node)
+        return 'Set mode "{0}" on file "{1}" on node "{2}"'.format(
+            self.mode, self.path, self.node)
+
+
+class SimulatedDeployment(object):
+    """
+        Management server and peer nodes answering the commands of the
+        testware: litp commands on the ms and shell commands on any node
+    """
+
+    def __init__(self, node_count=2):
+        self.model = SimulatedModel(node_count)
+        self.filesystems = dict((hostname, {}) for hostname in
+                                self.model.node_hostnames.itervalues())
+        self.tasks = None
+        self.plan_status = None
+        self.system_logs = dict((hostname, []) for hostname in
+                                self.filesystems)
+
+    def create_plan(self):
+        """
+            Validates the model and creates a plan of the changes to apply
+        """
+        effective = self.model.get_effective()
+        errors = ['ValidationError    Create plan failed: Managed-file "{0}" '
+                  'is duplicated on "{1}" in locations: {2}, {3}'.format(
+                      path, node, first, second)
+                  for node, path, first, second in effective.conflicts]
+        if errors:
+            return errors
+        tasks = []
+        for (node, path), (_, mode, url) in sorted(
+                effective.files.iteritems()):
+            if self.model.is_dirty(self.model.items[url]):
+                tasks.append(SimulatedTask(url, node, path, mode))
+        for url, path, _ in self.model.get_managed_files(True):
+            if self.model.items[url].state == "ForRemoval":
+                tasks.append(SimulatedTask(url, None, path, None))
+        if not tasks:
+            return ["DoNothingPlanError    Create plan failed: no tasks "
+                    "were generated"]
+        self.tasks = tasks
+        self.plan_status = "Initial"
+        return []
+
+    def run_plan(self, resume=False):
+        """
+            Runs the plan to completion. A task fails if its file does not
+            exist on the node; a resumed plan reruns the tasks not done.
+        """
+        if self.tasks is None:
+            return ["InvalidRequestError    Plan does not exist"]
+        if resume != (self.plan_status == "Failed"):
+            return ["InvalidRequestError    Plan cannot be "
+                    "{0}".format("resumed" if resume else "run")]
+        for task in self.tasks:
+            if task.state == "Success":
+                continue
+            filesystem = self.filesystems.get(task.node)
+            if task.mode is None:
+                task.state = "Success"
+            elif filesystem is not None and task.path in filesystem:
+                filesystem[task.path] = normalise_mode(task.mode)
+                task.state = "Success"
+            else:
+                task.state = "Failed"
+                self.system_logs[task.node].append(
+                    "{0} puppet-agent[{1}]: (/Stage[main]/File[{2}]) Could "
+                    "not set 'file' on ensure: No such file or "
+                    "directory".format(task.node, 1000 + len(
+                        self.system_logs[task.node]), task.path))
+        if any(task.state == "Failed" for task in self.tasks):
+            self.plan_status = "Failed"
+            return []
+        self.plan_status = "Successful"
+        for url in sorted(self.model.items, reverse=True):
+            item = self.model.items.get(url)
+            if item is None:
+                continue
+            if item.state == "ForRemoval":
+                self.model.delete(url)
+            else:
+                item.state = "Applied"
+        return []
+
+    def show_plan(self):
+        """
+            Returns the output lines of litp show_plan
+        """
+        if self.tasks is None:
+            return [], ["InvalidLocationError    Plan does not exist"], 1
+        lines = ["Phase 1", "-" * 31, "Task status", "-" * 11]
+        for task in self.tasks:
+            lines.append("{0:<15}{1}".format(task.state, task.url))
+            lines.append("{0:<15}{1}".format("", task.description))
+        lines.append("")
+        lines.append("Plan Status: {0}".format(self.plan_status))
+        return lines, [], 0
+
+    def puppet_run(self, node):
+        """
+            Restores the mode of every applied managed-file of a node
+        """
+        filesystem = self.filesystems[node]
+        for (hostname, path), (_, mode, url) in \
+                self.model.get_effective().files.iteritems():
+            if hostname == node and path in filesystem and \
+                    not self.model.is_dirty(self.model.items[url]):
+                filesystem[path] = normalise_mode(mode)
+
+    def run_litp(self, words):
+        """
+            Runs a litp command on the ms
+
+            Returns:
+                (tuple). stdout lines, stderr lines and return code
+        """
+        action = words[1] if len(words) > 1 else ""
+        opts = {}
+        props = []
+        index = 2
+        while index < len(words):
+            word = words[index]
+            if word in ("-p", "--path", "-t", "--type", "-s",
+                        "--source-path") and index + 1 < len(words):
+                opts[word.lstrip("-")[0]] = words[index + 1]
+                index += 2
+            elif word in ("-o", "--options"):
+                index += 1
+                while index < len(words) and not words[index].startswith("-"):
+                    props.append(words[index])
+                    index += 1
+            else:
+                opts[word] = True
+                index += 1
+
+        url = opts.get("p")
+        if action == "show":
+            if url not in self.model.items:
+                return [], [url, "InvalidLocationError    Not found"], 1
+            return self.model.show(url, "-r" in opts), [], 0
+        if action == "show_plan":
+            return self.show_plan()
+        if action == "create":
+            errors = self.model.create(url, opts.get("t"), parse_props(props))
+        elif action == "inherit":
+            errors = self.model.inherit(url, opts.get("s"), parse_props(props))
+        elif action == "update":
+            errors = self.model.update(url, parse_props(props))
+        elif action == "remove":
+            errors = self.model.remove(url)
+        elif action == "create_plan":
+            errors = self.create_plan()
+        elif action == "run_plan":
+            errors = self.run_plan("--resume" in opts)
+        elif action == "stop_plan":
+            errors = ["InvalidRequestError    Plan not currently running"]
+        else:
+            errors = ["Unknown action {0}".format(action)]
+        return [], errors, 1 if errors else 0
+
+    def run_shell(self, node, words, su_root=False):
+        """
+            Runs one of the shell commands used by the testware on a node,
+            as root if su_root is set. The system log is only readable by
+            root.
+
+            Returns:
+                (tuple). stdout lines, stderr lines and return code
+        """
+        filesystem = self.filesystems[node]
+        program = words[0] if words else ""
+        if program == "rm":
+            for path in words[1:]:
+                if not path.startswith("-"):
+                    filesystem.pop(path, None)
+            return [], [], 0
+        if program == "stat":
+            stdout = []
+            stderr = []
+            for path in words[3:]:
+                if path in filesystem:
+                    stdout.append("{0} {1}".format(filesystem[path], path))
+                else:
+                    stderr.append("stat: cannot stat `{0}': No such file or "
+                                  "directory".format(path))
+            return stdout, stderr, 1 if stderr else 0
+        if program == "chmod" and len(words) == 3:
+            if words[2] not in filesystem:
+                return [], ["chmod: cannot access `{0}'".format(words[2])], 1
+            filesystem[words[2]] = normalise_mode(words[1])
+            return [], [], 0
+        if program == "ps":
+            return ["   {0} litpd".format(100000 + 10 * len(
+                self.model.items))], [], 0
+        if program == "grep" and "tail" in words:
+            if not su_root:
+                return [], ["grep: {0}: Permission denied".format(
+                    words[3])], 0
+            num_lines = int(words[-1])
+            return [line for line in self.system_logs[node]
+                    if words[2] in line][-num_lines:], [], 0
+        if program == "cat" and "wc" in words:
+            return [str(MANIFEST_BYTES_PER_FILE *
+                        len(self.model.get_effective().files))], [], 0
+        return [], ["simulated: unsupported command: {0}".format(
+            " ".join(words))], 127
+
+    def create_files(self, node, cmd):
+        """
+            Runs a command built by get_bulk_create_files_cmds
+        """
+        filesystem = self.filesystems[node]
+        stdout = []
+        for paths in TEE_REGEX.findall(cmd):
+            for path in shlex.split(paths):
+                filesystem[path] = DEFAULT_FILE_MODE
+                stdout.append("CREATED {0}".format(path))
+        return stdout, [], 0
+
+    def run_command(self, node, cmd, su_root=False):
+        """
+            Runs a command on a node
+
+            Args:
+                node (str): Hostname of the node
+                cmd (str): Command built by the testware
+                su_root (bool): Run the command as root
+            Returns:
+                (tuple). stdout lines, stderr lines and return code
+        """
+        if cmd == get_mode_rule_cmd():
+            return [json.dumps({"property_type": MODE_RULE.property_type,
+                                "regex": MODE_RULE.regex,
+                                "regex_error_desc":
+                                MODE_RULE.regex_error_desc,
+                                "validators": MODE_RULE.validators})], [], 0
+        if BATCH_MARKER in cmd:
+            stdout = []
+            for item_cmd, index in BATCH_ITEM_REGEX.findall(cmd):
+                item_out, item_err, item_rc = self.run_command(node, item_cmd)
+                stdout.extend(item_out + item_err)
+                stdout.append("{0} {1} {2}".format(BATCH_MARKER, index,
+                                                   item_rc))
+            return stdout, [], 0
+        if TEE_REGEX.search(cmd):
+            return self.create_files(node, cmd)
+        stdout, stderr, rc = [], [], 0
+        for segment in cmd.split("; "):
+            words = shlex.split(segment)
+            if words and words[0] == "litp":
+                result = self.run_litp(words)
+            else:
+                result = self.run_shell(node, words, su_root)
+            stdout.extend(result[0])
+            stderr.extend(result[1])
+            rc = result[2]
+        return stdout, stderr, rc
+
+
+class SimulatedCLIUtils(object):
+    """
+        Builds litp commands like litp_cli_utils.CLIUtils
+    """
+
+    @staticmethod
+    def get_create_cmd(url, class_type, props=''):
+        """
+            Returns a litp create command
+        """
+        cmd = "litp create -p {0} -t {1}".format(url, class_type)
+        return cmd + " -o {0}".format(props) if props else cmd
+
+    @staticmethod
+    def get_inherit_cmd(url, source_path, props=''):
+        """
+            Returns a litp inherit command
+        """
+        cmd = "litp inherit -p {0} -s {1}".format(url, source_path)
+        return cmd + " -o {0}".format(props) if props else cmd
+
+    @staticmethod
+    def get_update_cmd(url, props):
+        """
+            Returns a litp update command
+        """
+        return "litp update -p {0} -o {1}".format(url, props)
+
+    @staticmethod
+    def get_remove_cmd(url):
+        """
+            Returns a litp remove command
+        """
+        return "litp remove -p {0}".format(url)
+
+    @staticmethod
+    def get_show_cmd(url, args=''):
+        """
+            Returns a litp show command
+        """
+        return "litp show -p {0} {1}".format(url, args).strip()
+
+    @staticmethod
+    def get_show_plan_cmd():
+        """
+            Returns a litp show_plan command
+        """
+        return "litp show_plan"
+
+    @staticmethod
+    def get_create_plan_cmd():
+        """
+            Returns a litp create_plan command
+        """
+        return "litp create_plan"
+
+    @staticmethod
+    def get_run_plan_cmd(args=''):
+        """
+            Returns a litp run_plan command
+        """
+        return "litp run_plan {0}".format(args).strip()
+
+    @staticmethod
+    def get_stop_plan_cmd():
+        """
+            Returns a litp stop_plan command
+        """
+        return "litp stop_plan"
+
+
+class SimulatedGenericTest(unittest.TestCase):
+    """
+        The part of litp_generic_test.GenericTest used by this testware,
+        backed by a SimulatedDeployment shared by every test of the process
+    """
+
+    deployment = None
+    node_count = 2
+
+    def setUp(self):
+        """
+            Creates the simulated deployment on first use
+        """
+        if SimulatedGenericTest.deployment is None:
+            SimulatedGenericTest.deployment = SimulatedDeployment(
+                self.node_count)
+        self.logger = logging.getLogger("simulated_litp")
+
+    def tearDown(self):
+        """
+            Nothing to clean up, the tests revert their own changes
+        """
+        pass
+
+    def log(self, level, msg):
+        """
+            Logs a message at the given level name
+        """
+        self.logger.log(getattr(logging, level.upper(), logging.INFO), msg)
+
+    def get_management_node_filename(self):
+        """
+            Returns the hostname of the ms
+        """
+        return MS_HOSTNAME
+
+    def get_management_node_filenames(self):
+        """
+            Returns the hostnames of the management servers
+        """
+        return [MS_HOSTNAME]
+
+    def get_managed_node_filenames(self):
+        """
+            Returns the hostnames of the peer nodes
+        """
+        return sorted(hostname for url, hostname in
+                      self.deployment.model.node_hostnames.iteritems()
+                      if url != "/ms")
+
+    def get_node_att(self, node, attribute):
+        """
+            Simulated nodes have no connection details
+        """
+        raise ValueError("Simulated node {0} has no {1}".format(node,
+                                                                attribute))
+
+    def get_node_filename_from_url(self, node, url):
+        """
+            Returns the hostname of the node at a model path
+        """
+        return self.deployment.model.node_hostnames.get(url)
+
+    def find(self, node, path, resource, *args, **kwargs):
+        """
+            Returns the model paths of the items of a type under a path
+        """
+        return self.deployment.model.find(path, resource)
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+            Runs a command on a simulated node. A command longer than a
+            remote shell accepts fails as it does on a real node.
+        """
+        if len(cmd) >= MAX_ARG_STRLEN:
+            return [], ["/bin/sh: Argument list too long"], 126
+        return self.deployment.run_command(node, cmd,
+                                           kwargs.get("su_root", False))
+
+    def _execute_cli(self, node, cmd, expect_positive):
+        """
+            Runs a litp command, asserting it succeeded if expected to
+        """
+        stdout, stderr, rc = self.run_command(node, cmd)
+        if expect_positive:
+            self.assertEqual(0, rc, "{0} failed: {1}".format(cmd, stderr))
+        return stdout, stderr, rc
+
+    def execute_cli_show_cmd(self, node, url, args='',
+                             expect_positive=True):
+        """
+            Runs litp show
+        """
+        return self._execute_cli(node, SimulatedCLIUtils.get_show_cmd(
+            url, args), expect_positive)
+
+    def execute_cli_createplan_cmd(self, node, expect_positive=True):
+        """
+            Runs litp create_plan
+        """
+        return self._execute_cli(node,
+                                 SimulatedCLIUtils.get_create_plan_cmd(),
+                                 expect_positive)
+
+    def execute_cli_runplan_cmd(self, node, args='', expect_positive=True):
+        """
+            Runs litp run_plan
+        """
+        return self._execute_cli(node,
+                                 SimulatedCLIUtils.get_run_plan_cmd(args),
+                                 expect_positive)
+
+    def start_new_puppet_run(self, node):
+        """
+            Applies the catalog of every node, as a puppet run would
+        """
+        for hostname in self.deployment.filesystems:
+            self.deployment.puppet_run(hostname)
+
+    def execute_cli_get_rhelver_from_node(self, node):
+        """
+            Returns the RHEL version of a node
+        """
+        return RHEL_VERSION
@@ -0,0 +1,199 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Keeps one persistent SSH transport per node and runs commands
+            on new channels of it, so that short commands do not pay for a
+            new SSH handshake each time
+"""
+
+import os
+import threading
+import time
+
+DEFAULT_KEEPALIVE_SECS = 30
+SSH_PORT = 22
+# Host keys a node must present, as read by ssh
+DEFAULT_KNOWN_HOSTS = ("/etc/ssh/ssh_known_hosts", "~/.ssh/known_hosts")
+# Most bytes read from a channel at a time
+RECV_BYTES = 32768
+# Seconds waited for output when a channel has none ready
+POLL_SECS = 0.01
+
+
+class SSHConnectionPool(object):
+    """
+        Per node pool of persistent SSH transports.
+
+        The transport of a node is opened on first use and reused for every
+        later command while it is still active. Each command runs on its own
+        channel so several threads can share a transport at the same time.
+    """
+
+    def __init__(self, connect):
+        """
+            Args:
+                connect (callable): Called as connect(node) and returns an
+                    authenticated transport, e.g. a paramiko.Transport
+        """
+        self.connect = connect
+        self.transports = {}
+        self.opened = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._node_locks = {}
+
+    def _get_node_lock(self, node):
+        """
+            Returns the lock serialising connections to a node, so that
+            connecting to one node does not hold up the others
+        """
+        with self._lock:
+            return self._node_locks.setdefault(node, threading.Lock())
+
+    def get_transport(self, node):
+        """
+            Returns an active transport to the node, opening a new one if
+            there is none or the previous one was dropped
+        """
+        with self._get_node_lock(node):
+            transport = self.transports.get(node)
+            if transport is not None and transport.is_active():
+                with self._lock:
+                    self.reused += 1
+                return transport
+            transport = self.connect(node)
+            with self._lock:
+                self.transports[node] = transport
+                self.opened += 1
+            return transport
+
+    def run_command(self, node, cmd):
+        """
+            Runs a command on a new channel of the node's transport.
+            stdout and stderr are read as their data arrives, so a command
+            filling the window of one of them while the other is read does
+            not hang.
+
+            Args:
+                node (str): node to run the command on
+                cmd (str): Command to run
+            Returns:
+                (tuple). stdout lines, stderr lines and return code
+        """
+        channel = self.get_transport(node).open_session()
+        try:
+            channel.exec_command(cmd)
+            stdout, stderr = [], []
+            while True:
+                received = False
+                if channel.recv_ready():
+                    stdout.append(channel.recv(RECV_BYTES))
+                    received = True
+                if channel.recv_stderr_ready():
+                    stderr.append(channel.recv_stderr(RECV_BYTES))
+                    received = True
+                if received:
+                    continue
+                if channel.exit_status_ready() and \
+                        not channel.recv_ready() and \
+                        not channel.recv_stderr_ready():
+                    break
+                time.sleep(POLL_SECS)
+            rc = channel.recv_exit_status()
+        finally:
+            channel.close()
+        return ("".join(stdout).splitlines(), "".join(stderr).splitlines(),
+                rc)
+
+    def get_stats(self):
+        """
+            Returns the number of transports opened and reused
+        """
+        return {"opened": self.opened, "reused": self.reused}
+
+    def close(self):
+        """
+            Closes every transport in the pool
+        """
+        with self._lock:
+            for transport in self.transports.itervalues():
+                transport.close()
+            self.transports = {}
+
+
+def get_known_host_key(host_keys, ip_address, port=SSH_PORT):
+    """
+        Returns the key a host must present, as known_hosts names it
+
+        Args:
+            host_keys (paramiko.HostKeys): Keys loaded from known_hosts
+            ip_address (str): Address of the host
+            port (int): SSH port of the host
+        Returns:
+            (paramiko.PKey). First key known for the host, None if the host
+            is unknown
+    """
+    name = ip_address if int(port) == SSH_PORT else \
+        "[{0}]:{1}".format(ip_address, port)
+    keys = host_keys.lookup(name)
+    if not keys:
+        return None
+    return keys[sorted(keys.keys())[0]]
+
+
+def get_paramiko_connector(get_host, keepalive_secs=DEFAULT_KEEPALIVE_SECS,
+                           known_hosts=DEFAULT_KNOWN_HOSTS):
+    """
+        Returns a connect callable for SSHConnectionPool which opens
+        paramiko transports with keep-alive enabled, to nodes presenting
+        the host key known_hosts holds for them
+
+        Args:
+            get_host (callable): Returns (ip, port, username, password) of a
+                node
+            keepalive_secs (int): Seconds between keep-alive packets
+            known_hosts (tuple): known_hosts files the host keys are read
+                from, the ones that do not exist are skipped
+        Returns:
+            (callable). connect(node) returning a paramiko.Transport
+    """
+    # paramiko is only needed on the host running the tests
+    import paramiko
+
+    host_keys = paramiko.HostKeys()
+    for path in known_hosts:
+        path = os.path.expanduser(path)
+        if os.path.isfile(path):
+            host_keys.load(path)
+
+    def connect(node):
+        """
+            Opens an authenticated transport to the node
+
+            Raises:
+                paramiko.SSHException: if the node is not in known_hosts or
+                    presents another key, before any credential is sent
+        """
+        ip_address, port, username, password = get_host(node)
+        host_key = get_known_host_key(host_keys, ip_address, port)
+        if host_key is None:
+            raise paramiko.SSHException(
+                "No known host key for {0} ({1}:{2})".format(
+                    node, ip_address, port))
+        transport = paramiko.Transport((ip_address, int(port)))
+        try:
+            transport.connect(hostkey=host_key, username=username,
+                              password=password)
+        except Exception:
+            transport.close()
+            raise
+        transport.set_keepalive(keepalive_secs)
+        return transport
+
+    return connect
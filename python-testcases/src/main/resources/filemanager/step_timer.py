@@ -0,0 +1,157 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Times the numbered steps a test logs, e.g. "#3. Run plan", and
+            counts the remote commands and bytes transferred in each of them
+"""
+
+import os
+import re
+import threading
+import time
+
+STEP_REGEX = re.compile(r"^(#\d+)\.\s*(.*)$")
+# Step timings are written only if this names their file, the same absolute
+# path as the filemanager.step.timings property of the TAF runner
+STEP_TIMINGS_PATH_ENV = "FILEMANAGER_STEP_TIMINGS"
+
+
+def parse_step_marker(message):
+    """
+        Returns (label, title) of a step marker such as "#3. Run plan", None
+        for any other message
+    """
+    match = STEP_REGEX.match(message.strip())
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+class StepTiming(object):
+    """
+        Wall time, remote commands and bytes transferred of one step
+    """
+
+    def __init__(self, label, title, start):
+        self.label = label
+        self.title = title
+        self.start = start
+        self.end = None
+        self.commands = 0
+        self.bytes = 0
+
+    @property
+    def duration(self):
+        """
+            Returns the seconds the step took, None while it is running
+        """
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+
+class StepTimer(object):
+    """
+        Splits a test into consecutive steps. Starting a step ends the
+        previous one; commands are counted against the step running when
+        they complete, from any thread.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.steps = []
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """
+            Returns the running StepTiming, None if no step is running
+        """
+        if self.steps and self.steps[-1].end is None:
+            return self.steps[-1]
+        return None
+
+    def start_step(self, label, title=""):
+        """
+            Ends the running step and starts a new one
+        """
+        with self._lock:
+            now = self.clock()
+            if self.current is not None:
+                self.current.end = now
+            self.steps.append(StepTiming(label, title, now))
+
+    def stop(self):
+        """
+            Ends the running step
+        """
+        with self._lock:
+            if self.current is not None:
+                self.current.end = self.clock()
+
+    def record_command(self, num_bytes):
+        """
+            Counts a remote command and the bytes it sent and received
+            against the running step
+        """
+        with self._lock:
+            if self.current is not None:
+                self.current.commands += 1
+                self.current.bytes += num_bytes
+
+    def get_report(self):
+        """
+            Returns one line per step with its duration, commands, bytes
+            and title
+        """
+        return "\n".join(
+            "{0:>8} {1:>5} cmds {2:>9} B  {3} {4}".format(
+                "-" if step.duration is None
+                else "{0:.1f}s".format(step.duration),
+                step.commands, step.bytes, step.label, step.title)
+            for step in self.steps)
+
+    def get_summary(self):
+        """
+            Returns the steps on a single line, e.g.
+            "setUp 2.1s 4cmd 1.2kB; #1 0.4s 3cmd 0.3kB"
+        """
+        return "; ".join(
+            "{0} {1:.1f}s {2}cmd {3:.1f}kB".format(
+                step.label, step.duration or 0.0, step.commands,
+                step.bytes / 1024.0)
+            for step in self.steps)
+
+
+def get_command_bytes(cmd, stdout, stderr):
+    """
+        Returns the bytes sent and received by a remote command
+    """
+    return len(cmd) + sum(len(line) + 1 for line in stdout) + \
+        sum(len(line) + 1 for line in stderr)
+
+
+def get_step_timings_path(environ=None):
+    """
+        Returns the absolute path of the file named by
+        FILEMANAGER_STEP_TIMINGS, None if step timings are not written
+    """
+    path = (os.environ if environ is None else environ).get(
+        STEP_TIMINGS_PATH_ENV)
+    return os.path.abspath(path) if path else None
+
+
+def write_step_timings(path, classname, name, timer):
+    """
+        Appends the step summary of a test to a tab separated file read by
+        the TAF runner, one "classname<TAB>name<TAB>summary" line per test
+    """
+    with open(path, "a") as timings_file:
+        timings_file.write("{0}\t{1}\t{2}\n".format(
+            classname, name, timer.get_summary()))
@@ -0,0 +1,999 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   TORF-302742
+            Helpers shared by the test sets of the file plugin story, which
+            set up managed-files in the model and deployment and verify them
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from nose.plugins.skip import SkipTest
+from litp_backend import GenericTest, CLIUtils, test_constants, SIMULATED
+from node_executor import NodeExecutor, SerialCommandMixin
+from file_utils import get_bulk_create_files_cmds, \
+    parse_bulk_create_files_output, get_mode_diff, get_remove_files_cmds, \
+    get_file_modes_cmds, parse_file_modes_output
+from model_batch import ModelBatch
+from plan_waiter import PlanWaiter, parse_show_plan, \
+    get_puppet_log_tail_cmd
+from managed_file_model import EffectiveManagedFiles, reconcile, \
+    index_managed_files, get_item_level, ManagedFileResolver
+from ssh_pool import SSHConnectionPool, get_paramiko_connector
+from parallel_utils import PlanLock, get_worker_suffix
+from revert_snapshot import ModelSnapshot
+from case_selection import get_selected_features, get_case_features, \
+    parse_tms_ids
+from mode_oracle import normalise_mode
+from case_instrumentation import ResultStreamMixin, CommandTraceMixin, \
+    StepTimingMixin, PlanProfileMixin
+
+# Model changes and expected modes of the positive tests, which can be
+# validated by a plan of their own or by a plan shared with other tests
+MULTIPLE_FILES_COUNT = 12
+MULTIPLE_FILES_MODE = "666"
+THREE_AND_FOUR_DIGIT_MODES = {0: ["A", "755"], 1: ["B", "0755"]}
+CLUSTER_AND_NODE_MODES = {0: "755", 1: "666"}
+LIST_FILE_MODES = {0: "755", 1: "666", 2: "644"}
+
+
+class Story302742Base(ResultStreamMixin, CommandTraceMixin,
+                      StepTimingMixin, PlanProfileMixin, SerialCommandMixin,
+                      GenericTest):
+    """
+        Base class of the TORF-302742 test sets
+    """
+
+    # Serialises model changes and plans between workers, held by
+    # plan_session
+    plan_lock = PlanLock()
+    # Model paths returned by find(), shared by every test in the class as
+    # the collections they point to are never removed by these tests
+    model_path_cache = {}
+    # Status shown by litp show_plan for each plan state
+    plan_statuses = {test_constants.PLAN_COMPLETE: "Successful",
+                     test_constants.PLAN_FAILED: "Failed"}
+    # Persistent SSH transports shared by every test in the class. Disabled
+    # for the rest of the run if they cannot be used, run_command is then
+    # used instead. Simulated nodes are only reached by run_command.
+    ssh_pool = None
+    ssh_pool_enabled = not SIMULATED
+    # Guards the creation of the pool by the first of several threads
+    ssh_pool_lock = threading.Lock()
+    # Revert the model and files changed by each test to a snapshot taken
+    # before it, rather than undoing each change one by one
+    revert_after_test = True
+
+    def setUp(self):
+        """
+            Runs before every single test
+        """
+        if not self.is_cleanup_instance():
+            self.skip_unless_selected()
+        super(Story302742Base, self).setUp()
+        self.cli = CLIUtils()
+        self.ms_node = self.get_management_node_filename()
+        self.mn_nodes = self.get_managed_node_filenames()
+        self.nodes_list = [self.ms_node] + self.mn_nodes
+        self.name_suffix = get_worker_suffix()
+        self.managed_file_type = "managed-file"
+        self.set_namespace("")
+        self.infra_managed_file_path = self.find_cached(
+            "/infrastructure", "collection-of-managed-file-base")
+        self.ms_managed_file_path = self.find_cached(
+            "/ms", "ref-collection-of-managed-file-base")
+        self.nodes_managed_file_path = self.find_cached(
+            "/deployments", "ref-collection-of-managed-file-base")
+        self.duplicate_error = 'ValidationError    Create plan failed: ' \
+                               'Managed-file "{0}" is duplicated on "{1}" in' \
+                               ' locations: {2}, {3}'
+        self.invalid_location_error = "InvalidLocationError    Not found"
+        self.node_executor = NodeExecutor()
+        self.provisioned_files = {}
+        self.expected_model = ManagedFileResolver()
+        self.model_snapshot = None
+        # True from a model change until a plan applied it
+        self.model_pending = False
+        self.plan_lock_secs = self.plan_lock.held_secs
+        if self.revert_after_test:
+            self.model_snapshot = self.take_model_snapshot()
+
+    def tearDown(self):
+        """
+            Runs after every single test
+        """
+        self.step_timer.start_step("tearDown")
+        try:
+            if self.revert_after_test:
+                self.revert_to_snapshot()
+            if self.ssh_pool is not None:
+                self.log("info", "SSH connections: {0}".format(
+                    self.ssh_pool.get_stats()))
+            super(Story302742Base, self).tearDown()
+        finally:
+            self.log("info", "Plan lock held {0:.1f}s".format(
+                self.plan_lock.held_secs - self.plan_lock_secs))
+            self.report_step_timings()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+            Runs after the last test of the class
+        """
+        with Story302742Base.ssh_pool_lock:
+            if Story302742Base.ssh_pool is not None:
+                Story302742Base.ssh_pool.close()
+                Story302742Base.ssh_pool = None
+        parent_teardown = getattr(super(Story302742Base, cls),
+                                  "tearDownClass", None)
+        if parent_teardown is not None:
+            parent_teardown()
+
+    def is_cleanup_instance(self):
+        """
+            Returns True for an instance made to run cleanup in
+            tearDownClass, which is set up like a test without being one
+        """
+        return not self._testMethodName.startswith("test")
+
+    def skip_unless_selected(self):
+        """
+            Skips the test if FILEMANAGER_FEATURES or FILEMANAGER_CHANGED
+            selects features it does not cover
+        """
+        features = get_selected_features()
+        if features is not None and \
+                not get_case_features(self.get_case_tags()) & features:
+            raise SkipTest("Covers none of the changed features: {0}".format(
+                ", ".join(sorted(features))))
+
+    def get_case_tags(self):
+        """
+            Returns the @attr tags and tms_ids of the running test
+        """
+        method = getattr(self, self._testMethodName)
+        function = getattr(method, "__func__", method)
+        return [name for name, value in vars(function).iteritems()
+                if value is True] + parse_tms_ids(function.__doc__)
+
+    def set_namespace(self, namespace):
+        """
+            Sets the names of the test files, managed-files and
+            managed-file-list so that tests sharing a model and deployment
+            do not use the same ones
+
+            Args:
+                namespace (str): Appended to the names, e.g. "_tc03". The
+                    names of a test ran on its own have no namespace.
+        """
+        prefix = self.get_name_prefix() + namespace
+        self.file_path = "/tmp/" + prefix + "_testfile_{0}.txt"
+        self.managed_file_name = prefix + "_file{0}"
+        self.managed_list_name = prefix + "_managed_file_list"
+
+    def get_name_prefix(self):
+        """
+            Returns the prefix of the names of every file and model item
+            created by the tests of this worker
+        """
+        return "story302742{0}".format(self.name_suffix)
+
+    def get_node_connection_details(self, node):
+        """
+            Returns (ip, port, username, password) used to connect to a node
+        """
+        return (self.get_node_att(node, "ipv4"), 22,
+                self.get_node_att(node, "username"),
+                self.get_node_att(node, "password"))
+
+    def run_pooled_command(self, node, cmd, traced=True):
+        """
+            Runs a command over the persistent SSH transport of the node, on
+            a channel of its own so that NodeExecutor threads can run
+            commands at the same time. Falls back to run_command, serialised
+            between threads, if the pool cannot be used; the command may
+            then run twice so it must be idempotent.
+
+            Args:
+                node (str): node cmd will be ran on
+                cmd (str): Command to run
+                traced (bool): Record the command in the command trace
+            Returns:
+                (tuple). stdout lines, stderr lines and return code
+        """
+        if self.ssh_pool_enabled:
+            try:
+                start = time.time()
+                stdout, stderr, rc = self.get_ssh_pool().run_command(node,
+                                                                     cmd)
+                if traced:
+                    self.trace_command(node, cmd, start, stdout, stderr, rc)
+                return stdout, stderr, rc
+            except Exception as err:  # pylint: disable=broad-except
+                self.log("info", "SSH connection pool disabled: {0}".format(
+                    err))
+                Story302742Base.ssh_pool_enabled = False
+        if traced:
+            return self.run_command(node, cmd, add_to_cleanup=False)
+        return self.run_untraced_command(node, cmd, add_to_cleanup=False)
+
+    def get_ssh_pool(self):
+        """
+            Returns the SSH connection pool shared by the tests, created by
+            the first thread needing it
+        """
+        with Story302742Base.ssh_pool_lock:
+            if Story302742Base.ssh_pool is None:
+                Story302742Base.ssh_pool = SSHConnectionPool(
+                    get_paramiko_connector(self.get_node_connection_details))
+            return Story302742Base.ssh_pool
+
+    def run_batch_cmd(self, node, cmd):
+        """
+            Runs a model batch script. Items are reverted by
+            revert_to_snapshot rather than by the generic cleanup.
+        """
+        return self.run_command(node, cmd, add_to_cleanup=False)
+
+    def flush_model_batch(self, batch):
+        """
+            Runs every command queued in a ModelBatch on the ms in a single
+            remote call and asserts they all succeeded. Must be called in a
+            plan_session.
+
+            Args:
+                batch (ModelBatch): Queued litp commands
+            Returns:
+                (list). ModelBatchItem of each command
+        """
+        self.assertTrue(self.plan_lock.held,
+                        "Model changed outside of a plan_session")
+        self.model_pending = True
+        items = batch.flush(self.run_batch_cmd, self.ms_node)
+        failed = [item for item in items if not item.succeeded]
+        self.assertEqual([], failed, "Model commands failed:\n{0}".format(
+            "\n".join("{0}: {1}".format(item.cmd, " ".join(item.output))
+                      for item in failed)))
+        return items
+
+    def show_model(self, *urls):
+        """
+            Returns the output of litp show -r of the given model paths,
+            fetched with a single remote call
+        """
+        cmd = "; ".join(self.cli.get_show_cmd(url, "-r") for url in urls)
+        stdout, _, _ = self.run_pooled_command(self.ms_node, cmd)
+        return stdout
+
+    def take_model_snapshot(self):
+        """
+            Returns a ModelSnapshot of the managed-file collections of the
+            infrastructure, the ms and the deployments
+        """
+        return ModelSnapshot.from_show_output(self.show_model(
+            *(self.infra_managed_file_path + self.ms_managed_file_path +
+              self.nodes_managed_file_path)))
+
+    def remove_files_on_node(self, node):
+        """
+            Removes the files provisioned on a node, in a single remote call
+            unless there are too many of them for one command
+        """
+        for cmd in get_remove_files_cmds(self.provisioned_files[node]):
+            self.run_pooled_command(node, cmd)
+
+    @contextmanager
+    def plan_session(self):
+        """
+            Holds the plan lock while the test changes the model and runs
+            the plans applying the changes, so that the plans of other
+            workers do not pick them up. Changes no plan applied when the
+            session ends, e.g. after a failed plan or a rejected model, are
+            reverted before the lock is released.
+        """
+        self.plan_lock.acquire()
+        try:
+            yield
+        finally:
+            try:
+                if self.model_pending and self.model_snapshot is not None:
+                    self.log("info", "Reverting the model changes no plan "
+                                     "applied")
+                    self.apply_model_revert(self.queue_model_revert())
+            finally:
+                self.plan_lock.release()
+
+    def queue_model_revert(self):
+        """
+            Returns a ModelBatch undoing the model changes of the test since
+            the snapshot taken in setUp
+        """
+        batch = ModelBatch(self.cli)
+        removed = self.model_snapshot.queue_revert(
+            self.take_model_snapshot(), self.get_name_prefix(), batch)
+        if removed:
+            self.log("info", "Items removed by the test cannot be reverted: "
+                             "{0}".format(", ".join(removed)))
+        return batch
+
+    def apply_model_revert(self, batch):
+        """
+            Runs a batch from queue_model_revert and at most one plan
+            applying it, holding the plan lock
+
+            Returns:
+                (list). ModelBatchItem of each revert command
+        """
+        with self.plan_lock:
+            items = batch.flush(self.run_batch_cmd, self.ms_node)
+            if items:
+                _, _, create_plan_rc = self.execute_cli_createplan_cmd(
+                    self.ms_node, expect_positive=False)
+                if create_plan_rc == 0:
+                    self.execute_cli_runplan_cmd(self.ms_node)
+                    self.wait_for_plan(test_constants.PLAN_COMPLETE)
+            self.model_pending = False
+        return items
+
+    def revert_to_snapshot(self):
+        """
+            Reverts the model items and files of the test to the snapshot
+            taken in setUp: the model changes are undone by one batch of
+            litp commands and at most one plan, the plan lock only being
+            taken if there is any, the files are removed by one command per
+            node ran on all nodes in parallel. Fails once the files are
+            removed if any model change could not be undone.
+        """
+        start = time.time()
+        batch = self.queue_model_revert()
+        items = self.apply_model_revert(batch) if len(batch) else []
+        failed = [item for item in items if not item.succeeded]
+
+        if self.provisioned_files:
+            self.run_on_nodes(self.remove_files_on_node,
+                              self.provisioned_files.keys())
+        self.log("info", "Reverted {0} model items and {1} files in "
+                         "{2:.1f}s".format(
+                             len(items),
+                             sum(len(file_paths) for file_paths in
+                                 self.provisioned_files.itervalues()),
+                             time.time() - start))
+        self.provisioned_files = {}
+        self.assertEqual([], failed, "Revert failed:\n{0}".format(
+            "\n".join("{0}: {1}".format(item.cmd, " ".join(item.output))
+                      for item in failed)))
+
+    def poll_plan(self):
+        """
+            Returns the plan status and task states from litp show_plan
+        """
+        stdout, _, _ = self.run_pooled_command(self.ms_node,
+                                               self.cli.get_show_plan_cmd())
+        return parse_show_plan(stdout)
+
+    def wait_for_plan(self, expected_plan_state, plan_timeout_mins=5):
+        """
+            Waits for the running plan to finish, returning as soon as it
+            does, and asserts it reached the expected state.
+
+            A plan expected to complete is only waited for until its first
+            task fails: the failed tasks and the puppet log of their nodes
+            are then collected while fresh, the plan is stopped and the
+            assertion fails with them. Other plans are waited for until
+            they finish, as the test carries on with them.
+
+            Args:
+                expected_plan_state (int): test_constants plan state
+                plan_timeout_mins (int): Minutes to wait for the plan
+            Returns:
+                (PlanWaitResult). Outcome and per-task timings of the plan
+        """
+        expect_complete = \
+            expected_plan_state == test_constants.PLAN_COMPLETE
+        result = PlanWaiter(self.poll_plan).wait(plan_timeout_mins * 60,
+                                                 fail_fast=expect_complete)
+        if result.status == "Successful":
+            self.model_pending = False
+        self.log("info", "Plan status {0}{1} after {2:.1f}s and {3} polls\n"
+                 "{4}".format(result.status,
+                              " with a failed task" if result.aborted
+                              else "", result.elapsed, result.polls,
+                              result.get_timing_report()))
+        diagnostics = ""
+        if expect_complete and result.get_failed_tasks():
+            diagnostics = "\n" + self.get_plan_diagnostics(result)
+        if result.aborted:
+            self.stop_plan(plan_timeout_mins)
+        self.assertEqual(self.plan_statuses[expected_plan_state],
+                         result.status,
+                         "Plan status was not as expected{0}".format(
+                             diagnostics))
+        return result
+
+    def get_puppet_log_tail(self, node):
+        """
+            Returns the last puppet lines of the system log of a node, read
+            as root as only root can read it. Errors, e.g. a log that cannot
+            be read, follow the log lines.
+        """
+        stdout, stderr, _ = self.run_command(
+            node, get_puppet_log_tail_cmd(), add_to_cleanup=False,
+            su_root=True)
+        return stdout + stderr
+
+    def get_failed_task_logs(self, result):
+        """
+            Returns the tail of the puppet log of each node a failed task of
+            a plan ran on, fetched with one command per node ran on all
+            nodes in parallel
+
+            Args:
+                result (PlanWaitResult): Outcome of the plan
+            Returns:
+                (dict). Log lines of each node, None if they could not be
+                fetched
+        """
+        owner_nodes = self.get_managed_file_owner_nodes()
+        nodes = set()
+        for timing in result.get_failed_tasks():
+            level = get_item_level(timing.url)
+            nodes.update(owner_nodes.get(level[1], []) if level
+                         else [self.ms_node])
+        logs = self.node_executor.run(self.get_puppet_log_tail,
+                                      sorted(nodes))
+        return dict((node, logs.results.get(node)) for node in nodes)
+
+    def get_plan_diagnostics(self, result):
+        """
+            Describes why a plan did not succeed: its failed tasks and the
+            tail of the puppet log of the nodes they ran on
+
+            Args:
+                result (PlanWaitResult): Outcome of the plan
+            Returns:
+                (str). Diagnostics to report
+        """
+        lines = ["Failed tasks:"]
+        lines.extend("    {0} {1}".format(timing.url, timing.description)
+                     for timing in result.get_failed_tasks())
+        logs = self.get_failed_task_logs(result)
+        for node in sorted(logs):
+            lines.append("Puppet log of {0}:".format(node))
+            lines.extend("    {0}".format(line)
+                         for line in logs[node] or ["(not available)"])
+        return "\n".join(lines)
+
+    def verify_failed_task_logs(self, result):
+        """
+            Asserts that the diagnostics of a failed plan hold puppet log
+            lines of every node a failed task ran on, rather than an error
+            reading the log
+
+            Args:
+                result (PlanWaitResult): Outcome of the failed plan
+        """
+        logs = self.get_failed_task_logs(result)
+        self.assertNotEqual({}, logs, "No node ran a failed task")
+        for node, lines in sorted(logs.iteritems()):
+            self.assertTrue(lines and all("puppet" in line for line in lines),
+                            "Puppet log of {0} not read: {1}".format(
+                                node, lines))
+
+    def stop_plan(self, plan_timeout_mins=5):
+        """
+            Stops the running plan and waits for it to finish, so that the
+            model can be changed and planned again
+        """
+        self.run_command(self.ms_node, self.cli.get_stop_plan_cmd(),
+                         add_to_cleanup=False)
+        result = PlanWaiter(self.poll_plan).wait(plan_timeout_mins * 60)
+        self.log("info", "Plan status {0} after stopping it".format(
+            result.status))
+
+    def run_plan_and_wait(self, expected_plan_state, plan_timeout_mins=5):
+        """
+            Creates and runs a plan and waits for it to finish, profiling
+            the nodes while it runs if FILEMANAGER_PROFILE is set
+
+            Args:
+                expected_plan_state (int): test_constants plan state
+                plan_timeout_mins (int): Minutes to wait for the plan
+            Returns:
+                (PlanWaitResult). Outcome and per-task timings of the plan
+        """
+        self.execute_cli_createplan_cmd(self.ms_node)
+        profiler = self.start_plan_profiler()
+        try:
+            self.execute_cli_runplan_cmd(self.ms_node)
+            result = self.wait_for_plan(expected_plan_state,
+                                        plan_timeout_mins)
+        finally:
+            profiles = self.stop_plan_profiler(profiler)
+        self.check_plan_profile(profiles)
+        return result
+
+    def find_cached(self, path, resource):
+        """
+            Returns the result of find() on the ms, walking the model only
+            the first time a path and resource are looked up in the class
+
+            Args:
+                path (str): Model path to search from
+                resource (str): Item type to find
+            Returns:
+                (list). Model paths of the items found
+        """
+        key = (self.ms_node, path, resource)
+        if key not in self.model_path_cache:
+            self.model_path_cache[key] = self.find(self.ms_node, path,
+                                                   resource)
+        return list(self.model_path_cache[key])
+
+    def run_on_nodes(self, func, nodes, *args, **kwargs):
+        """
+            Runs func(node, *args, **kwargs) on all nodes in parallel and
+            asserts it succeeded on every one of them
+
+            Args:
+                func (callable): Operation taking the node as first argument
+                nodes (list): Nodes to run the operation on
+            Returns:
+                (NodeResults). Value returned by func for each node
+        """
+        results = self.node_executor.run(func, nodes, *args, **kwargs)
+        self.assertEqual([], results.failed_nodes,
+                         "Operation {0} failed on nodes:\n{1}".format(
+                             func.__name__, results.get_error_summary()))
+        return results
+
+    def provision_files_on_node(self, node, files):
+        """
+            Creates several files on a node in a single remote call, or in
+            as few as the length of a command allows. The files are recorded
+            in provisioned_files and removed by revert_to_snapshot after the
+            test.
+
+            Args:
+                node (str): node the files will be created on
+                files (dict): List of content lines for each file path
+            Returns:
+                (dict). True for each path that was created, False otherwise
+        """
+        stdout = []
+        for cmd in get_bulk_create_files_cmds(files):
+            stdout.extend(self.run_pooled_command(node, cmd)[0])
+        created = parse_bulk_create_files_output(stdout, files.keys())
+        self.provisioned_files.setdefault(node, []).extend(files)
+        return created
+
+    def create_files_on_node(self, node, num):
+        """
+            Creates test files on a single node
+
+            Args:
+                node (str): node the files will be created on
+                num (int): Number of files to create
+        """
+        created = self.provision_files_on_node(
+            node, dict((self.file_path.format(i), ['test file content'])
+                       for i in xrange(num)))
+        not_created = sorted(file_path for file_path, success
+                             in created.iteritems() if not success)
+        self.assertEqual([], not_created,
+                         "Files not created on {0}: {1}".format(
+                             node, ", ".join(not_created)))
+
+    def create_files_in_deployment(self, num):
+        """
+            Creates test files in the deployment
+
+            Args:
+                num (int): Number of files to create
+        """
+        self.run_on_nodes(self.create_files_on_node, self.nodes_list, num)
+
+    def create_managed_file(self, file_name, file_path, mode, batch=None):
+        """
+            Creates a managed-file in the deployment
+
+            Args:
+                file_name (str): Name of managed-file in model
+                file_path (str): Path to file in the deployment to be managed
+                    by LITP
+                mode (str): File permissions of the managed-file
+                batch (ModelBatch): If given, the create is queued in the
+                    batch instead of being ran straight away
+        """
+        url = "{0}/{1}".format(self.infra_managed_file_path[0], file_name)
+        props = "path={0} mode={1}".format(file_path, mode)
+        self.expected_model.add_item(url, self.managed_file_type,
+                                     {"path": file_path, "mode": mode})
+        if batch is not None:
+            batch.create(url, self.managed_file_type, props)
+        else:
+            batch = ModelBatch(self.cli)
+            batch.create(url, self.managed_file_type, props)
+            self.flush_model_batch(batch)
+
+    def inherit_managed_file_to_node(self, url, file_name, batch=None):
+        """
+            Inherits managed-file to node
+
+            Args:
+                url (str): LITP path to create
+                file_name (str): Name of managed-file in model
+                batch (ModelBatch): If given, the inherit is queued in the
+                    batch instead of being ran straight away
+        """
+        url = "{0}/{1}".format(url, file_name)
+        source_path = "{0}/{1}".format(self.infra_managed_file_path[0],
+                                       file_name)
+        self.expected_model.add_inherit(url, source_path)
+        if batch is not None:
+            batch.inherit(url, source_path)
+        else:
+            batch = ModelBatch(self.cli)
+            batch.inherit(url, source_path)
+            self.flush_model_batch(batch)
+
+    def get_file_modes_on_node(self, node, file_paths):
+        """
+            Returns the mode of several files in deployment using a single
+            stat call on the node, or as few as the length of a command
+            allows
+
+            Args:
+                node (str): node cmd will be ran on
+                file_paths (list): Paths to files on node
+            Returns:
+                 (dict). mode of each file in deployment keyed by path, None
+                 for files that do not exist on the node
+        """
+        modes = dict((file_path, None) for file_path in file_paths)
+        if not file_paths:
+            return modes
+        for cmd in get_file_modes_cmds(file_paths):
+            stdout, _, _ = self.run_pooled_command(node, cmd)
+            parse_file_modes_output(stdout, modes)
+        return modes
+
+    def get_file_mode_on_node(self, node, file_path):
+        """
+            Returns the mode of a file in deployment
+
+            Args:
+                node (str): node cmd will be ran on
+                file_path (str): Path to file on node
+            Returns:
+                 (str). mode of file in deployment, None if the file does not
+                 exist
+
+        """
+        return self.get_file_modes_on_node(node, [file_path])[file_path]
+
+    def wait_for_file_modes(self, node, expected_modes, timeout_secs=600,
+                            interval_secs=2):
+        """
+            Polls the mode of the given files on a node until they all match
+            the expected modes, failing with the remaining differences on
+            timeout
+
+            Args:
+                node (str): node the files are on
+                expected_modes (dict): Expected mode of each file path
+                timeout_secs (int): Seconds to wait for the modes to match
+                interval_secs (int): Seconds between polls
+            Returns:
+                (float). Seconds waited
+        """
+        start = time.time()
+        while True:
+            diff = get_mode_diff(expected_modes, self.get_file_modes_on_node(
+                node, expected_modes.keys()))
+            elapsed = time.time() - start
+            if not diff or elapsed >= timeout_secs:
+                break
+            time.sleep(interval_secs)
+        self.assertEqual({}, diff,
+                         "Modes on {0} did not converge in {1}s. "
+                         "(expected, actual) per path: {2}".format(
+                             node, timeout_secs, diff))
+        return elapsed
+
+    def get_managed_file_index(self, *urls):
+        """
+            Returns the path and mode of every managed-file under the given
+            model paths, fetched with a single remote litp show -r
+
+            Args:
+                urls (str): Model paths to show recursively
+            Returns:
+                (dict). (path, mode) of each managed-file keyed by model path
+        """
+        return index_managed_files(self.show_model(*urls))
+
+    def get_model_managed_files(self):
+        """
+            Returns every managed-file inherited to the ms and peer nodes
+
+            Returns:
+                (list). (url, path, mode) of each managed-file
+        """
+        return [(url, path, mode) for url, (path, mode) in
+                self.get_managed_file_index("/ms", "/deployments").iteritems()]
+
+    def get_managed_file_owner_nodes(self):
+        """
+            Returns the nodes a managed-file applies to for each model path
+            it can be inherited under: the ms, each cluster and each node
+
+            Returns:
+                (dict). List of node filenames keyed by model path
+        """
+        owner_nodes = {"/ms": [self.ms_node]}
+        for node_url in self.find_cached("/deployments", "node"):
+            node = self.get_node_filename_from_url(self.ms_node, node_url)
+            owner_nodes[node_url] = [node]
+            owner_nodes.setdefault(node_url.rsplit("/nodes/", 1)[0],
+                                   []).append(node)
+        return owner_nodes
+
+    def reconcile_file_permissions(self, file_paths=None):
+        """
+            Resolves the managed-file that applies to each file on each node
+            from the model, collects the modes of those files from all nodes
+            and asserts that none differ from the model
+
+            Args:
+                file_paths (list): Only reconcile these file paths, by
+                    default every managed file is reconciled
+            Returns:
+                (EffectiveManagedFiles). Managed-file applied to each
+                (node, path)
+        """
+        items = self.get_model_managed_files()
+        if file_paths is not None:
+            file_paths = set(file_paths)
+            items = [item for item in items if item[1] in file_paths]
+        effective = EffectiveManagedFiles.build(
+            items, self.get_managed_file_owner_nodes())
+        self.assertEqual([], effective.conflicts,
+                         "Managed-files duplicated on a node in the model")
+
+        paths_by_node = effective.get_paths_by_node()
+
+        def get_node_modes(node):
+            """
+                Returns the mode of the files managed on a node
+            """
+            return self.get_file_modes_on_node(node, paths_by_node[node])
+
+        actual_modes = self.run_on_nodes(get_node_modes,
+                                         paths_by_node.keys()).results
+        report = reconcile(effective, actual_modes)
+        self.assertTrue(report, str(report))
+        return effective
+
+    def verify_expected_managed_files(self, file_paths):
+        """
+            Asserts that the managed-file applied to each of the given files
+            on each node, in the model and in the deployment, is the one the
+            model changes of the test should resolve to
+
+            Args:
+                file_paths (list): Paths of the files to verify
+            Returns:
+                (EffectiveManagedFiles). Managed-files found in the model
+        """
+        expected = self.expected_model.resolve(
+            self.get_managed_file_owner_nodes())
+        self.assertEqual([], expected.conflicts,
+                         "Managed-files duplicated on a node by the test")
+        expected_modes = expected.get_modes(file_paths)
+        self.assertNotEqual({}, expected_modes,
+                            "The test manages none of {0}".format(
+                                ", ".join(file_paths)))
+        effective = self.reconcile_file_permissions(file_paths)
+        self.assertEqual(expected_modes, effective.get_modes(file_paths),
+                         "Effective managed-files differ from those the "
+                         "test changes resolve to")
+        return effective
+
+    def verify_file_permissions_on_ms(self, file_path, managed_file_name):
+        """
+            Gets mode of managed-file in model, gets mode of file in deployment
+             and asserts that they are equal
+
+            Args:
+                file_path (str): Path to file on ms
+                managed_file_name (str): Name of managed-file in the model
+        """
+        mode = self.get_file_mode_on_node(self.ms_node, file_path)
+        _, mode_on_model = self.get_managed_file_index(
+            self.ms_managed_file_path[0])["{0}/{1}".format(
+                self.ms_managed_file_path[0], managed_file_name)]
+        self.assertEqual(mode_on_model, mode,
+                         "Difference between mode on the ms({0}) "
+                         "and model({1})".format(mode, mode_on_model))
+
+    def prepare_multiple_managed_files(self, batch):
+        """
+            Creates test files in the deployment and queues multiple
+            managed-files inherited to the ms and nodes
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+        """
+        self.log("info", "#1. Create test files in deployment")
+        self.create_files_in_deployment(MULTIPLE_FILES_COUNT)
+
+        self.log("info", "#2. Create multiple managed files in model and "
+                         "inherit to ms and nodes")
+        node_paths = [self.ms_managed_file_path[0],
+                      self.nodes_managed_file_path[1],
+                      self.nodes_managed_file_path[2]]
+        for i in xrange(MULTIPLE_FILES_COUNT):
+            self.create_managed_file(self.managed_file_name.format(i),
+                                     self.file_path.format(i),
+                                     MULTIPLE_FILES_MODE, batch)
+
+            for path in node_paths:
+                self.inherit_managed_file_to_node(path, self.managed_file_name
+                                                  .format(i), batch)
+
+    def verify_multiple_managed_files(self):
+        """
+            Verifies the modes set by prepare_multiple_managed_files
+        """
+        self.log("info", "#4. File permissions are the same between model and "
+                         "deployment")
+        file_paths = [self.file_path.format(i)
+                      for i in xrange(MULTIPLE_FILES_COUNT)]
+        effective = self.reconcile_file_permissions(file_paths)
+        for node in self.nodes_list:
+            for file_path in file_paths:
+                self.assertEqual(effective.get_mode(node, file_path),
+                                 MULTIPLE_FILES_MODE,
+                                 "Difference between mode in model and "
+                                 "deployment")
+
+    def prepare_mode_handles_3_digits(self, batch):
+        """
+            Creates test files in the deployment and queues 2 managed-files
+            with mode=755 and mode=0755 inherited to the ms
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+        """
+        self.log("info", "#1. Create test files in deployment")
+        self.create_files_in_deployment(2)
+
+        self.log("info", "#2. Create 2 managed files in model with mode=755 "
+                         "and mode=0755")
+        for file_no, filedetails in THREE_AND_FOUR_DIGIT_MODES.iteritems():
+            self.create_managed_file(
+                self.managed_file_name.format(filedetails[0]),
+                self.file_path.format(file_no), filedetails[1], batch)
+
+        for filedetails in THREE_AND_FOUR_DIGIT_MODES.itervalues():
+            self.inherit_managed_file_to_node(self.ms_managed_file_path[0],
+                                              self.managed_file_name.format
+                                              (filedetails[0]), batch)
+
+    def verify_mode_handles_3_digits(self):
+        """
+            Verifies the modes set by prepare_mode_handles_3_digits
+        """
+        self.log("info", "#4. verify that both files have the same "
+                         "permissions on the ms")
+        modes = self.get_file_modes_on_node(
+            self.ms_node, [self.file_path.format(0), self.file_path.format(1)])
+        self.assertEqual(modes[self.file_path.format(0)],
+                         modes[self.file_path.format(1)],
+                         "mode1 is not the same as mode2")
+        self.assertEqual(normalise_mode(THREE_AND_FOUR_DIGIT_MODES[0][1]),
+                         modes[self.file_path.format(0)],
+                         "mode1 is not the mode given by the mode oracle")
+
+    def prepare_node_supersedes_cluster(self, batch):
+        """
+            Creates a test file in the deployment and queues 2 managed-files
+            for it with different modes, inherited to the cluster and node1
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+        """
+        self.log("info", "#1. Create test file in deployment")
+        self.create_files_in_deployment(1)
+
+        self.log("info", "#2. Create 2 managed files in model with the same "
+                         "file path and different modes. Inherit file0 to "
+                         "cluster level and file1 to node1")
+        for filename, mode in CLUSTER_AND_NODE_MODES.iteritems():
+            self.create_managed_file(self.managed_file_name.format(filename),
+                                     self.file_path.format(0), mode, batch)
+
+        for i in CLUSTER_AND_NODE_MODES.iterkeys():
+            self.inherit_managed_file_to_node(self.nodes_managed_file_path[i],
+                                              self.managed_file_name.format(i),
+                                              batch)
+
+    def verify_node_supersedes_cluster(self):
+        """
+            Verifies the modes set by prepare_node_supersedes_cluster
+        """
+        self.log("info", "#4. Verify that the node file permissions supersede "
+                         "the cluster.")
+        effective = self.verify_expected_managed_files(
+            [self.file_path.format(0)])
+        self.assertEqual(effective.get_mode(self.mn_nodes[0],
+                                            self.file_path.format(0)),
+                         CLUSTER_AND_NODE_MODES[1],
+                         "Mode on node1 is not as expected (666)")
+        self.assertEqual(effective.get_mode(self.mn_nodes[1],
+                                            self.file_path.format(0)),
+                         CLUSTER_AND_NODE_MODES[0],
+                         "Mode on node2 is not as expected (755)")
+
+    def prepare_managed_file_list(self, batch):
+        """
+            Creates test files in the deployment and queues a
+            managed-file-list of 3 managed-files inherited to the ms, the
+            cluster and node1
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+        """
+        managed_list_type = "managed-file-list"
+        managed_file_list = "managed_file_list"
+
+        self.log("info", "#1. Create test files in deployment")
+        self.create_files_in_deployment(len(LIST_FILE_MODES))
+
+        self.log("info", "#2. Create a managed-file-list with 3 managed-files")
+        infra_managed_list_path = "{0}/{1}".format(
+            self.infra_managed_file_path[0], self.managed_list_name)
+        batch.create(infra_managed_list_path, managed_list_type)
+        self.expected_model.add_item(infra_managed_list_path,
+                                     managed_list_type)
+
+        url = "{0}/{1}/{2}".format(infra_managed_list_path,
+                                   managed_file_list, self.managed_file_name.
+                                   format("{0}"))
+        property_path = "path={0}".format(self.file_path.format("{0}"))
+        property_mode = "mode={0}"
+
+        for file_no, mode in LIST_FILE_MODES.iteritems():
+            batch.create(url.format(file_no), self.managed_file_type,
+                         "{0} {1}".format(property_path.format(file_no),
+                                          property_mode.format(mode)))
+            self.expected_model.add_item(
+                url.format(file_no), self.managed_file_type,
+                {"path": self.file_path.format(file_no), "mode": mode})
+
+        self.log("info", "#3. Inherit managed-list to ms, cluster and node1")
+        for node in self.ms_managed_file_path + self.nodes_managed_file_path:
+            self.inherit_managed_file_to_node(node, self.managed_list_name,
+                                              batch)
+
+    def verify_managed_file_list(self):
+        """
+            Verifies the modes set by prepare_managed_file_list
+        """
+        self.log("info", "#5. Verify permissions on ms and peer nodes")
+        effective = self.verify_expected_managed_files(
+            [self.file_path.format(i) for i in LIST_FILE_MODES])
+        for node in self.nodes_list:
+            for file_no, mode in LIST_FILE_MODES.iteritems():
+                self.assertEqual(effective.get_mode(
+                    node, self.file_path.format(file_no)), mode,
+                                 "Difference between mode in model and "
+                                 "deployment")
@@ -10,7 +10,7 @@ program(s) have been supplied.
 @author:    Monika Penkova
 @summary:   Dummy test to test pylint
 """
-from litp_generic_test import GenericTest
+from litp_backend import GenericTest
 
 
 class Dummy(GenericTest):
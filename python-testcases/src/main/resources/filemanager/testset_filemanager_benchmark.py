@@ -0,0 +1,370 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Scale benchmarks of the file plugin. Each test sweeps one of
+            the number of managed-files, the number of peer nodes and the
+            managed-file-list nesting depth, records create_plan latency,
+            plan and task durations, ms memory and manifest size in a JSON
+            results file and compares them against a baseline run. A stress
+            test checks that create_plan reports every duplicated path of
+            large models and that its time grows linearly with model size.
+            Selected with -a filemanager_benchmark. The sweeps are set by
+            the FILEMANAGER_BENCH_* environment variables.
+"""
+
+import os
+import time
+
+from litp_backend import attr, test_constants, SIMULATED
+from model_batch import ModelBatch
+from story302742_base import Story302742Base
+from managed_file_model import EffectiveManagedFiles, parse_duplicate_errors
+from benchmark_utils import BenchmarkResult, BenchmarkResults, \
+    compare_to_baseline, get_sweep_from_env, get_ms_memory_cmd, \
+    parse_ms_memory, get_manifest_size_cmd, get_task_metrics, \
+    get_scaling_exponent, RESULTS_PATH_ENV, BASELINE_PATH_ENV, TOLERANCE_ENV, \
+    DEFAULT_RESULTS_PATH, DEFAULT_TOLERANCE
+
+BENCHMARK_FILE_MODE = "640"
+# Above about 90 files the model batch of a point is split into several
+# remote scripts, each below the argument limit of the remote shell
+DEFAULT_FILE_COUNTS = [12, 100, 500]
+DEFAULT_SWEEP_FILE_COUNT = 100
+DEFAULT_NESTING_DEPTHS = [0, 1, 2]
+DEFAULT_PLAN_TIMEOUT_MINS = 60
+DEFAULT_DUPLICATE_FILE_COUNTS = [250, 500, 1000, 2000]
+DEFAULT_DUPLICATE_COUNT = 10
+# Largest exponent k of create_plan time = c * files ** k accepted
+DEFAULT_MAX_SCALING_EXPONENT = 1.5
+
+
+class FilemanagerBenchmark(Story302742Base):
+    """
+        Scale benchmarks of the file plugin
+    """
+
+    # The sweeps add to the same results file so they run in one worker
+    _multiprocess_shared_ = True
+    results = BenchmarkResults()
+
+    def setUp(self):
+        """
+            Runs before every single test
+        """
+        super(FilemanagerBenchmark, self).setUp()
+        self.memory_samples = None
+        self.plan_timeout_mins = int(os.environ.get(
+            "FILEMANAGER_BENCH_PLAN_TIMEOUT_MINS", DEFAULT_PLAN_TIMEOUT_MINS))
+        self.results_path = os.environ.get(RESULTS_PATH_ENV,
+                                           DEFAULT_RESULTS_PATH)
+
+    def poll_plan(self):
+        """
+            Returns the plan status and task states, sampling the memory
+            used on the ms while a benchmark plan runs
+        """
+        if self.memory_samples is not None:
+            stdout, _, _ = self.run_pooled_command(self.ms_node,
+                                                   get_ms_memory_cmd())
+            self.memory_samples.append(parse_ms_memory(stdout))
+        return super(FilemanagerBenchmark, self).poll_plan()
+
+    def get_node_managed_file_paths(self):
+        """
+            Returns the managed-file collection of each peer node
+
+            Returns:
+                (dict). Model path of the collection keyed by node filename
+        """
+        node_paths = {}
+        for node_url in self.find_cached("/deployments", "node"):
+            node = self.get_node_filename_from_url(self.ms_node, node_url)
+            for path in self.nodes_managed_file_path:
+                if path.startswith(node_url + "/"):
+                    node_paths[node] = path
+        return node_paths
+
+    def get_manifest_size(self):
+        """
+            Returns the total size in bytes of the puppet manifests on the ms
+        """
+        stdout, _, _ = self.run_pooled_command(self.ms_node,
+                                               get_manifest_size_cmd())
+        if stdout and stdout[0].strip().isdigit():
+            return int(stdout[0])
+        return 0
+
+    def queue_benchmark_model(self, batch, file_count, nodes, nesting):
+        """
+            Queues file_count managed-files, nested nesting managed-file-lists
+            deep, inherited to the ms and to each of the given nodes
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+                file_count (int): Number of managed-files
+                nodes (list): Peer nodes the managed-files are inherited to
+                nesting (int): Depth of managed-file-lists holding the
+                    managed-files, 0 for none
+        """
+        node_paths = self.get_node_managed_file_paths()
+        targets = [self.ms_managed_file_path[0]] + \
+            [node_paths[node] for node in nodes]
+
+        parent = self.infra_managed_file_path[0]
+        for level in xrange(nesting):
+            list_url = "{0}/{1}{2}".format(parent, self.managed_list_name,
+                                           level)
+            batch.create(list_url, "managed-file-list")
+            parent = "{0}/managed_file_list".format(list_url)
+        for i in xrange(file_count):
+            batch.create("{0}/{1}".format(parent,
+                                          self.managed_file_name.format(i)),
+                         self.managed_file_type,
+                         "path={0} mode={1}".format(self.file_path.format(i),
+                                                    BENCHMARK_FILE_MODE))
+
+        if nesting:
+            top_names = ["{0}0".format(self.managed_list_name)]
+        else:
+            top_names = [self.managed_file_name.format(i)
+                         for i in xrange(file_count)]
+        for target in targets:
+            for name in top_names:
+                self.inherit_managed_file_to_node(target, name, batch)
+
+    def run_benchmark_point(self, sweep, file_count, nodes, nesting):
+        """
+            Applies one benchmark model with a plan, records its metrics and
+            reverts the model and files. The metrics include the number of
+            remote scripts the model changes took and their time, and the
+            managed-files the plan applied per second.
+
+            Args:
+                sweep (str): Name of the sweep the point belongs to
+                file_count (int): Number of managed-files
+                nodes (list): Peer nodes the managed-files are inherited to
+                nesting (int): Depth of managed-file-lists
+            Returns:
+                (BenchmarkResult). Metrics of the point
+        """
+        params = {"files": file_count, "nodes": len(nodes),
+                  "nesting": nesting}
+        self.log("info", "Benchmark {0} {1}".format(sweep, params))
+        self.set_namespace("_bench")
+        self.run_on_nodes(self.create_files_on_node,
+                          [self.ms_node] + nodes, file_count)
+        batch = ModelBatch(self.cli)
+        self.queue_benchmark_model(batch, file_count, nodes, nesting)
+        model_cmds = len(batch.get_cmds())
+        with self.plan_session():
+            start = time.time()
+            self.flush_model_batch(batch)
+            model_secs = time.time() - start
+
+            start = time.time()
+            self.execute_cli_createplan_cmd(self.ms_node)
+            create_plan_secs = time.time() - start
+            self.execute_cli_runplan_cmd(self.ms_node)
+            self.memory_samples = []
+            try:
+                plan = self.wait_for_plan(test_constants.PLAN_COMPLETE,
+                                          self.plan_timeout_mins)
+            finally:
+                memory_samples = self.memory_samples
+                self.memory_samples = None
+
+        metrics = {"model_cmds": model_cmds, "model_secs": model_secs,
+                   "create_plan_secs": create_plan_secs,
+                   "plan_secs": plan.elapsed,
+                   "files_per_sec": round(
+                       file_count * (1 + len(nodes)) / max(plan.elapsed,
+                                                           0.001), 1),
+                   "ms_peak_rss_kb": max(memory_samples or [0]),
+                   "manifest_bytes": self.get_manifest_size()}
+        metrics.update(get_task_metrics(plan.task_timings))
+        result = BenchmarkResult(sweep, params, metrics)
+        self.results.add(result)
+        self.results.save(self.results_path)
+        self.log("info", "Benchmark {0}: {1}".format(result.key, metrics))
+
+        self.revert_to_snapshot()
+        return result
+
+    def check_baseline(self, results):
+        """
+            Asserts that no metric regressed against the baseline run named
+            by FILEMANAGER_BENCH_BASELINE, if any
+
+            Args:
+                results (list): BenchmarkResult of each point of the sweep
+        """
+        baseline_path = os.environ.get(BASELINE_PATH_ENV)
+        if not baseline_path:
+            return
+        tolerance = float(os.environ.get(TOLERANCE_ENV, DEFAULT_TOLERANCE))
+        regressions = compare_to_baseline(
+            results, BenchmarkResults.load(baseline_path), tolerance)
+        self.assertEqual([], regressions,
+                         "Benchmark regressed against {0}:\n{1}".format(
+                             baseline_path, "\n".join(regressions)))
+
+    @attr('benchmark', 'revert', 'filemanager_benchmark',
+          'filemanager_benchmark_files')
+    def test_01_b_file_count_sweep(self):
+        """
+            Measures the plan as the number of managed-files inherited to
+            the ms and every peer node grows. Sweep set by
+            FILEMANAGER_BENCH_FILES, e.g. 500,5000.
+        """
+        self.check_baseline([
+            self.run_benchmark_point("file_count", file_count,
+                                     self.mn_nodes, 0)
+            for file_count in get_sweep_from_env("FILEMANAGER_BENCH_FILES",
+                                                 DEFAULT_FILE_COUNTS)])
+
+    @attr('benchmark', 'revert', 'filemanager_benchmark',
+          'filemanager_benchmark_nodes')
+    def test_02_b_node_count_sweep(self):
+        """
+            Measures the plan as the managed-files are inherited to more
+            peer nodes. Sweep set by FILEMANAGER_BENCH_NODES, counts above
+            the number of peer nodes in the deployment are skipped.
+        """
+        file_count = get_sweep_from_env("FILEMANAGER_BENCH_SWEEP_FILES",
+                                        [DEFAULT_SWEEP_FILE_COUNT])[0]
+        results = []
+        for node_count in get_sweep_from_env(
+                "FILEMANAGER_BENCH_NODES", xrange(1, len(self.mn_nodes) + 1)):
+            if node_count > len(self.mn_nodes):
+                self.log("info", "Skipping {0} nodes, the deployment has "
+                                 "{1}".format(node_count, len(self.mn_nodes)))
+                continue
+            results.append(self.run_benchmark_point(
+                "node_count", file_count, self.mn_nodes[:node_count], 0))
+        self.check_baseline(results)
+
+    @attr('benchmark', 'revert', 'filemanager_benchmark',
+          'filemanager_benchmark_nesting')
+    def test_03_b_list_nesting_sweep(self):
+        """
+            Measures the plan as the managed-files are held by deeper
+            managed-file-lists. Sweep set by FILEMANAGER_BENCH_NESTING.
+        """
+        file_count = get_sweep_from_env("FILEMANAGER_BENCH_SWEEP_FILES",
+                                        [DEFAULT_SWEEP_FILE_COUNT])[0]
+        self.check_baseline([
+            self.run_benchmark_point("list_nesting", file_count,
+                                     self.mn_nodes, nesting)
+            for nesting in get_sweep_from_env("FILEMANAGER_BENCH_NESTING",
+                                              DEFAULT_NESTING_DEPTHS)])
+
+    def queue_duplicate_model(self, batch, file_count, duplicate_count):
+        """
+            Queues file_count managed-files inherited to the ms and the
+            first cluster, duplicate_count of which reuse the path of
+            another one
+
+            Args:
+                batch (ModelBatch): Batch the model changes are queued in
+                file_count (int): Number of managed-files
+                duplicate_count (int): Number of duplicated paths
+            Returns:
+                (list). (url, path, mode) of each inherited managed-file
+        """
+        unique_count = file_count - duplicate_count
+        targets = [self.ms_managed_file_path[0],
+                   self.nodes_managed_file_path[0]]
+        inherited = []
+        for i in xrange(file_count):
+            name = self.managed_file_name.format(i)
+            path = self.file_path.format(i if i < unique_count
+                                         else i - unique_count)
+            self.create_managed_file(name, path, BENCHMARK_FILE_MODE, batch)
+            for target in targets:
+                self.inherit_managed_file_to_node(target, name, batch)
+                inherited.append(("{0}/{1}".format(target, name), path,
+                                  BENCHMARK_FILE_MODE))
+        return inherited
+
+    def run_duplicate_validation_point(self, file_count, duplicate_count):
+        """
+            Creates a plan for a model with duplicated paths, asserts every
+            duplicate is reported and reverts the model
+
+            Args:
+                file_count (int): Number of managed-files
+                duplicate_count (int): Number of duplicated paths
+            Returns:
+                (BenchmarkResult). Metrics of the point
+        """
+        params = {"files": file_count, "duplicates": duplicate_count}
+        self.log("info", "Benchmark duplicate_validation {0}".format(params))
+        self.set_namespace("_dup")
+        batch = ModelBatch(self.cli)
+        inherited = self.queue_duplicate_model(batch, file_count,
+                                               duplicate_count)
+        expected = EffectiveManagedFiles.build(
+            inherited, self.get_managed_file_owner_nodes()).conflicts
+        with self.plan_session():
+            self.flush_model_batch(batch)
+            start = time.time()
+            _, stderr, _ = self.execute_cli_createplan_cmd(
+                self.ms_node, expect_positive=False)
+            create_plan_secs = time.time() - start
+        reported = parse_duplicate_errors(stderr)
+        self.assertEqual(sorted(set((node, path) for node, path, _, _
+                                    in expected)),
+                         sorted(reported),
+                         "Duplicated paths reported by create_plan were not "
+                         "as expected")
+
+        result = BenchmarkResult("duplicate_validation", params,
+                                 {"create_plan_secs": create_plan_secs,
+                                  "reported_duplicates": len(reported)})
+        self.results.add(result)
+        self.results.save(self.results_path)
+        self.log("info", "Benchmark {0}: {1}".format(result.key,
+                                                     result.metrics))
+
+        self.revert_to_snapshot()
+        return result
+
+    @attr('benchmark', 'revert', 'filemanager_benchmark',
+          'filemanager_benchmark_duplicates')
+    def test_04_b_duplicate_validation_scaling(self):
+        """
+            Creates plans for growing models with a fixed number of
+            duplicated paths, asserts every duplicate is reported on every
+            node and that create_plan time does not grow faster than
+            FILEMANAGER_BENCH_MAX_EXPONENT (1.5 by default) allows. Sweep set
+            by FILEMANAGER_BENCH_DUPLICATE_FILES and
+            FILEMANAGER_BENCH_DUPLICATES. The growth of the simulated
+            create_plan is only logged, it says nothing about the plugin.
+        """
+        duplicate_count = get_sweep_from_env("FILEMANAGER_BENCH_DUPLICATES",
+                                             [DEFAULT_DUPLICATE_COUNT])[0]
+        results = [self.run_duplicate_validation_point(file_count,
+                                                       duplicate_count)
+                   for file_count in get_sweep_from_env(
+                       "FILEMANAGER_BENCH_DUPLICATE_FILES",
+                       DEFAULT_DUPLICATE_FILE_COUNTS)]
+
+        exponent = get_scaling_exponent(
+            [(result.params["files"], result.metrics["create_plan_secs"])
+             for result in results])
+        max_exponent = float(os.environ.get("FILEMANAGER_BENCH_MAX_EXPONENT",
+                                            DEFAULT_MAX_SCALING_EXPONENT))
+        self.log("info", "create_plan time grows as files ** {0}".format(
+            exponent))
+        if exponent is not None and not SIMULATED:
+            self.assertTrue(exponent <= max_exponent,
+                            "create_plan time grows as files ** {0:.2f}, "
+                            "more than files ** {1}".format(exponent,
+                                                            max_exponent))
+        self.check_baseline(results)
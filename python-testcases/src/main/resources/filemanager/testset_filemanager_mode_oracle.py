@@ -0,0 +1,114 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Mode handling of the file plugin checked against the in-process
+            oracle of mode_oracle: the valid-mode rule of the plugin's
+            property type is read from the ms, thousands of generated modes
+            are checked in process against the requirements of the mode
+            property, then a sample of valid and invalid modes confirms the
+            rule on the deployment with one batch of model changes and one
+            plan. The number of generated modes and their seed are set by
+            FILEMANAGER_MODE_SAMPLES and FILEMANAGER_MODE_SEED.
+"""
+
+import os
+import random
+
+from litp_backend import attr, test_constants
+from model_batch import ModelBatch
+from story302742_base import Story302742Base
+from mode_oracle import generate_modes, check_mode_properties, \
+    get_mode_rule_cmd, parse_mode_rule, normalise_mode, \
+    DEPLOYMENT_SAMPLE_MODES, MODE_SAMPLES_ENV, MODE_SEED_ENV, \
+    DEFAULT_MODE_SAMPLES, MAX_REPORTED_VIOLATIONS
+
+
+class FilemanagerModeOracle(Story302742Base):
+    """
+        Mode handling of the file plugin checked against an oracle
+    """
+
+    @attr('all', 'revert', 'filemanager_mode_oracle')
+    def test_01_p_mode_oracle_sample_on_deployment(self):
+        """
+            @tms_description: The valid-mode rule of the plugin's property
+                type meets the requirements of the mode property for
+                generated modes, and a sample of modes is handled by the
+                plugin as the rule says: invalid modes are rejected with the
+                property type's error and valid ones are applied as chmod
+                applies them.
+            @tms_test_steps:
+             @step: Read the property type of the mode from the ms and
+                 check the generated modes against it
+             @result: No requirement is violated
+             @step: Create test files in deployment
+             @result: Test files are created
+             @step: Create managed-files with the sampled valid and invalid
+                 modes in one batch, inherit the valid ones to the ms
+             @result: The invalid modes are rejected with the expected
+                 error, the valid ones are created
+             @step: Create and run plan
+             @result: Plan ran successfully
+             @step: Verify the mode of each file on the ms
+             @result: Each file has the mode given by the oracle
+        """
+        count = int(os.environ.get(MODE_SAMPLES_ENV, DEFAULT_MODE_SAMPLES))
+        seed = int(os.environ.get(MODE_SEED_ENV,
+                                  random.randint(0, 2 ** 31)))
+        self.log("info", "#1. Check {0} generated modes against the "
+                         "property type, seed {1}".format(count, seed))
+        stdout, _, _ = self.run_command(self.ms_node, get_mode_rule_cmd(),
+                                        add_to_cleanup=False)
+        rule = parse_mode_rule(stdout)
+        self.log("info", "Mode rule {0}, validators not modelled: {1}".format(
+            rule, rule.validators))
+        violations = []
+        for mode in generate_modes(count, seed):
+            violations.extend(check_mode_properties(mode, rule))
+        self.assertEqual([], violations[:MAX_REPORTED_VIOLATIONS],
+                         "{0} requirements violated, rerun with {1}={2}"
+                         .format(len(violations), MODE_SEED_ENV, seed))
+
+        self.log("info", "#2. Create test files in deployment")
+        self.create_files_in_deployment(len(DEPLOYMENT_SAMPLE_MODES))
+
+        self.log("info", "#3. Create managed files with the sampled modes")
+        batch = ModelBatch(self.cli)
+        modes_by_url = {}
+        expected_modes = {}
+        for index, mode in enumerate(DEPLOYMENT_SAMPLE_MODES):
+            name = self.managed_file_name.format(index)
+            self.create_managed_file(name, self.file_path.format(index),
+                                     mode, batch)
+            modes_by_url["{0}/{1}".format(self.infra_managed_file_path[0],
+                                          name)] = mode
+            if rule.accepts(mode):
+                self.inherit_managed_file_to_node(
+                    self.ms_managed_file_path[0], name, batch)
+                expected_modes[self.file_path.format(index)] = \
+                    normalise_mode(mode)
+        unexpected = []
+        for item in batch.flush(self.run_batch_cmd, self.ms_node):
+            mode = modes_by_url.get(item.url)
+            accepted = mode is None or rule.accepts(mode)
+            output = " ".join(item.output)
+            if item.succeeded != accepted or not accepted and not all(
+                    part in output for part in rule.get_error_parts(mode)):
+                unexpected.append("{0}: rc {1}: {2}".format(
+                    item.cmd, item.rc, output))
+        self.assertEqual([], unexpected,
+                         "Model commands did not behave as the rule says")
+
+        self.log("info", "#4. Run plan successfully")
+        self.run_plan_and_wait(test_constants.PLAN_COMPLETE, 5)
+
+        self.log("info", "#5. Verify the modes on the ms are the oracle's")
+        self.assertEqual(expected_modes, self.get_file_modes_on_node(
+            self.ms_node, expected_modes.keys()),
+                         "Modes on the ms differ from the oracle")
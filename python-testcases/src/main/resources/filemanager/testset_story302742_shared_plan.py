@@ -0,0 +1,160 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   TORF-302742
+            Shared plan mode of the positive tests of Story302742. The model
+            changes of tc03, tc15, tc16 and tc18 are applied together by a
+            single plan, then each test verifies its own changes and passes
+            or fails on its own. Selected with -a story302742_shared_plan;
+            the negative tests keep running in Story302742 only.
+"""
+
+import traceback
+
+from litp_backend import attr, test_constants
+from model_batch import ModelBatch
+from story302742_base import Story302742Base
+
+
+class Story302742SharedPlan(Story302742Base):
+    """
+        Positive TORF-302742 tests validated by a single shared plan
+    """
+
+    # Every test depends on the shared plan so they run in one worker
+    _multiprocess_shared_ = True
+    # Namespace and prepare method of each test taking part in the plan
+    participants = (("_tc03", "prepare_multiple_managed_files"),
+                    ("_tc15", "prepare_mode_handles_3_digits"),
+                    ("_tc16", "prepare_node_supersedes_cluster"),
+                    ("_tc18", "prepare_managed_file_list"))
+    # The tests share the model changes of the plan, they are reverted once
+    # the last test has ran
+    revert_after_test = False
+    shared_plan_ran = False
+    shared_plan_error = None
+    shared_plan_snapshot = None
+    shared_plan_files = {}
+    shared_plan_expected_model = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+            Reverts the model items and files of the shared plan once every
+            test of the class has ran
+        """
+        if cls.shared_plan_snapshot is not None:
+            cleaner = cls("revert_shared_plan")
+            Story302742Base.setUp(cleaner)
+            try:
+                cleaner.revert_shared_plan()
+            finally:
+                Story302742Base.tearDown(cleaner)
+        cls.shared_plan_ran = False
+        cls.shared_plan_error = None
+        cls.shared_plan_expected_model = None
+        super(Story302742SharedPlan, cls).tearDownClass()
+
+    def revert_shared_plan(self):
+        """
+            Hands the snapshot and files of the shared plan to the revert
+            done by tearDown
+        """
+        self.revert_after_test = True
+        self.model_snapshot = self.shared_plan_snapshot
+        self.provisioned_files = self.shared_plan_files
+        Story302742SharedPlan.shared_plan_snapshot = None
+        Story302742SharedPlan.shared_plan_files = {}
+
+    def run_shared_plan(self):
+        """
+            Prepares the model changes of every participant in its own
+            namespace and validates them all with one plan
+        """
+        Story302742SharedPlan.shared_plan_snapshot = \
+            self.take_model_snapshot()
+        # Lets the plan_session revert the changes if the plan fails
+        self.model_snapshot = self.shared_plan_snapshot
+        batch = ModelBatch(self.cli)
+        try:
+            for namespace, prepare in self.participants:
+                self.log("info", "Prepare {0}".format(prepare))
+                self.set_namespace(namespace)
+                getattr(self, prepare)(batch)
+        finally:
+            Story302742SharedPlan.shared_plan_files = self.provisioned_files
+            Story302742SharedPlan.shared_plan_expected_model = \
+                self.expected_model
+            self.provisioned_files = {}
+
+        with self.plan_session():
+            self.flush_model_batch(batch)
+            self.log("info", "Run shared plan successfully")
+            self.run_plan_and_wait(test_constants.PLAN_COMPLETE, 10)
+
+    def use_shared_plan(self, namespace):
+        """
+            Runs the shared plan if no test has yet, then fails the test if
+            the shared plan failed
+
+            Args:
+                namespace (str): Namespace of the calling test
+        """
+        if not self.shared_plan_ran:
+            Story302742SharedPlan.shared_plan_ran = True
+            try:
+                self.run_shared_plan()
+            except Exception:  # pylint: disable=broad-except
+                Story302742SharedPlan.shared_plan_error = \
+                    traceback.format_exc()
+        if self.shared_plan_error is not None:
+            self.fail("Shared plan failed:\n{0}".format(
+                self.shared_plan_error))
+        self.expected_model = self.shared_plan_expected_model
+        self.set_namespace(namespace)
+
+    @attr('shared_plan', 'revert', 'story302742_shared_plan',
+          'story302742_tc03')
+    def test_01_p_multiple_managed_files(self):
+        """
+            Verifies torf_302742_tc03 after the shared plan
+            @tms_id: torf_302742_tc03
+        """
+        self.use_shared_plan("_tc03")
+        self.verify_multiple_managed_files()
+
+    @attr('shared_plan', 'revert', 'story302742_shared_plan',
+          'story302742_tc15')
+    def test_03_p_mode_handles_3_digits(self):
+        """
+            Verifies torf_302742_tc15 after the shared plan
+            @tms_id: torf_302742_tc15
+        """
+        self.use_shared_plan("_tc15")
+        self.verify_mode_handles_3_digits()
+
+    @attr('shared_plan', 'revert', 'story302742_shared_plan',
+          'story302742_tc16')
+    def test_06_p_node_supersedes_cluster(self):
+        """
+            Verifies torf_302742_tc16 after the shared plan
+            @tms_id: torf_302742_tc16
+        """
+        self.use_shared_plan("_tc16")
+        self.verify_node_supersedes_cluster()
+
+    @attr('shared_plan', 'revert', 'story302742_shared_plan',
+          'story302742_tc18')
+    def test_08_p_managed_file_list(self):
+        """
+            Verifies torf_302742_tc18 after the shared plan
+            @tms_id: torf_302742_tc18
+        """
+        self.use_shared_plan("_tc18")
+        self.verify_managed_file_list()
@@ -0,0 +1,67 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of the comparison of benchmark results against a
+            baseline run
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+from benchmark_utils import BenchmarkResult, BenchmarkResults, \
+    compare_to_baseline
+
+PARAMS = {"files": 500, "nodes": 2, "nesting": 0}
+
+
+def get_result(metrics):
+    """
+        Returns the result of the benchmark point with PARAMS
+    """
+    return BenchmarkResult("file_count", PARAMS, metrics)
+
+
+class CompareToBaselineUnit(unittest.TestCase):
+    """
+        Baseline comparison checked without a deployment
+    """
+
+    @attr('all', 'unit')
+    def test_01_regression_in_direction_of_metric(self):
+        """
+            A duration regresses when it grows, a throughput when it falls,
+            each by more than the tolerance
+        """
+        baseline = BenchmarkResults([get_result(
+            {"plan_secs": 100.0, "files_per_sec": 15.0})])
+        self.assertEqual([], compare_to_baseline(
+            [get_result({"plan_secs": 50.0, "files_per_sec": 30.0})],
+            baseline))
+        self.assertEqual([], compare_to_baseline(
+            [get_result({"plan_secs": 120.0, "files_per_sec": 12.0})],
+            baseline))
+        key = get_result({}).key
+        self.assertEqual(
+            ["{0} files_per_sec: 7.5 against 15.0 in baseline".format(key),
+             "{0} plan_secs: 200.0 against 100.0 in baseline".format(key)],
+            compare_to_baseline(
+                [get_result({"plan_secs": 200.0, "files_per_sec": 7.5})],
+                baseline))
+
+    @attr('all', 'unit')
+    def test_02_small_and_uncompared_changes_ignored(self):
+        """
+            A change below the minimum regression of the metric, and any
+            change of a metric not compared, is not a regression
+        """
+        baseline = BenchmarkResults([get_result(
+            {"model_secs": 0.1, "reported_duplicates": 10})])
+        self.assertEqual([], compare_to_baseline(
+            [get_result({"model_secs": 0.5, "reported_duplicates": 50})],
+            baseline))
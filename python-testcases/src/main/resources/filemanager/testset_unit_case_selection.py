@@ -0,0 +1,97 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of case_selection against testsets written to a
+            temporary directory
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from nose.plugins.attrib import attr
+from case_selection import get_selected_features, main, FEATURES_ENV, \
+    NOTHING_SELECTED_RC
+
+TESTSET = '''
+class Cases(object):
+    @attr('all', 'story302742_tc18')
+    def test_01_list(self):
+        """
+            @tms_id: torf_302742_tc18
+        """
+'''
+
+
+class CaseSelectionUnit(unittest.TestCase):
+    """
+        Test selection checked on a testset written for it
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="case_selection_unit_")
+        with open(os.path.join(self.tmp_dir, "testset_cases.py"),
+                  "w") as testset_file:
+            testset_file.write(TESTSET)
+        self.saved_stdout = sys.stdout
+        self.saved_stderr = sys.stderr
+        sys.stdout = StringIO()
+        sys.stderr = StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.saved_stdout
+        sys.stderr = self.saved_stderr
+        shutil.rmtree(self.tmp_dir)
+
+    def select(self, *args):
+        """
+            Runs main on the temporary directory
+
+            Returns:
+                (tuple). Exit status and printed test ids
+        """
+        sys.stdout = StringIO()
+        rc = main(list(args) + [
+            "--directory", self.tmp_dir,
+            "--index", os.path.join(self.tmp_dir, "index.json")])
+        return rc, sys.stdout.getvalue().strip()
+
+    @attr('all', 'unit')
+    def test_01_unknown_feature_rejected(self):
+        """
+            A misspelt feature is an error, not a selection of nothing
+        """
+        self.assertRaises(ValueError, get_selected_features,
+                          {FEATURES_ENV: "lists,mdoe"})
+        self.assertRaises(ValueError, get_selected_features,
+                          {FEATURES_ENV: ","})
+        self.assertEqual(set(["lists"]),
+                         get_selected_features({FEATURES_ENV: "lists"}))
+        try:
+            self.select("--features", "mdoe")
+        except SystemExit as err:
+            self.assertEqual(2, err.code)
+        else:
+            self.fail("Unknown feature accepted")
+
+    @attr('all', 'unit')
+    def test_02_nothing_selected_distinct_from_full_run(self):
+        """
+            Features covered by a test select it, features covered by none
+            exit with NOTHING_SELECTED_RC and print no id, a change that
+            cannot be mapped prints "." for a full run
+        """
+        self.assertEqual((0, "testset_cases.py:Cases.test_01_list"),
+                         self.select("--features", "lists"))
+        self.assertEqual((NOTHING_SELECTED_RC, ""),
+                         self.select("--features", "resume"))
+        self.assertEqual((0, "."), self.select("--changed", "README"))
@@ -0,0 +1,102 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of mode_oracle, without a deployment: the mode the
+            oracle expects on a node is checked against chmod on this host,
+            and the requirements of the mode property against the rule of
+            the LITP extensions installed here, if any. The number of
+            generated modes and their seed are set by FILEMANAGER_MODE_SAMPLES
+            and FILEMANAGER_MODE_SEED.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+from nose.plugins.skip import SkipTest
+from mode_oracle import generate_modes, check_mode_properties, \
+    normalise_mode, get_applied_mode, is_octal_mode, load_local_mode_rule, \
+    parse_mode_rule, ModeRule, MODE_SAMPLES_ENV, MODE_SEED_ENV, \
+    DEFAULT_MODE_SAMPLES, MAX_REPORTED_VIOLATIONS
+
+
+class ModeOracleUnit(unittest.TestCase):
+    """
+        Mode oracle checked without a deployment
+    """
+
+    def setUp(self):
+        """
+            Runs before every single test
+        """
+        self.count = int(os.environ.get(MODE_SAMPLES_ENV,
+                                        DEFAULT_MODE_SAMPLES))
+        self.seed = int(os.environ.get(MODE_SEED_ENV,
+                                       random.randint(0, 2 ** 31)))
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+            Runs after every single test
+        """
+        shutil.rmtree(self.tmp_dir)
+
+    @attr('all', 'unit')
+    def test_01_normalised_mode_is_applied_mode(self):
+        """
+            The mode the oracle expects stat to show is the one chmod
+            applies, for every generated mode chmod accepts
+        """
+        file_path = os.path.join(self.tmp_dir, "file")
+        open(file_path, "w").close()
+        differences = []
+        for mode in generate_modes(self.count, self.seed):
+            if is_octal_mode(mode) and len(mode) <= 4:
+                applied = get_applied_mode(file_path, mode)
+                if applied != normalise_mode(mode):
+                    differences.append("{0} applied as {1}".format(mode,
+                                                                   applied))
+        self.assertEqual([], differences[:MAX_REPORTED_VIOLATIONS],
+                         "{0} modes differ, rerun with {1}={2}".format(
+                             len(differences), MODE_SEED_ENV, self.seed))
+
+    @attr('all', 'unit')
+    def test_02_requirements_of_installed_rule(self):
+        """
+            The rule of the property type of the LITP extensions installed
+            on this host meets the requirements of the mode property
+        """
+        rule = load_local_mode_rule()
+        if rule is None:
+            raise SkipTest("LITP is not installed on this host")
+        violations = []
+        for mode in generate_modes(self.count, self.seed):
+            violations.extend(check_mode_properties(mode, rule))
+        self.assertEqual([], violations[:MAX_REPORTED_VIOLATIONS],
+                         "{0} requirements violated by {1}, rerun with "
+                         "{2}={3}".format(len(violations), rule,
+                                          MODE_SEED_ENV, self.seed))
+
+    @attr('all', 'unit')
+    def test_03_requirements_can_fail(self):
+        """
+            The requirements reject a rule which accepts a value chmod
+            cannot apply or rejects a 3 or 4 digit mode
+        """
+        self.assertEqual([], check_mode_properties(
+            "0755", ModeRule("file_mode", r"^[0-7]{3,4}$")))
+        self.assertEqual(1, len(check_mode_properties(
+            "758", ModeRule("any", r".*"))))
+        self.assertEqual(1, len(check_mode_properties(
+            "0755", ModeRule("three_digits", r"^[0-7]{3}$"))))
+        self.assertRaises(ValueError, parse_mode_rule,
+                          ['{"error": "ImportError: No module named litp"}'])
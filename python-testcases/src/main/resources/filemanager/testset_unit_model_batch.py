@@ -0,0 +1,165 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of model_batch and of the bulk file commands of
+            file_utils against a stub CLI and a fake node, which reject a
+            command longer than the remote shell accepts as Linux does
+"""
+
+import re
+import unittest
+
+from nose.plugins.attrib import attr
+from model_batch import ModelBatch, BATCH_MARKER
+from file_utils import get_bulk_create_files_cmds, get_remove_files_cmds, \
+    get_file_modes_cmds, parse_bulk_create_files_output, MAX_CMD_BYTES
+
+# Longest single argument execve accepts on Linux
+MAX_ARG_STRLEN = 128 * 1024
+ITEM_REGEX = re.compile(r'litp (\S+) -p (\S+).*? 2>&1; echo "{0} (\d+) \$\?"'
+                        .format(BATCH_MARKER))
+FILE_PATH = "/tmp/story302742_unit_testfile_{0}.txt"
+
+
+class StubCLI(object):
+    """
+        Builds litp commands like litp_cli_utils.CLIUtils
+    """
+
+    @staticmethod
+    def get_create_cmd(url, class_type, props=''):
+        """
+            Returns a litp create command
+        """
+        return "litp create -p {0} -t {1} -o {2}".format(url, class_type,
+                                                         props)
+
+    @staticmethod
+    def get_inherit_cmd(url, source_path, props=''):
+        """
+            Returns a litp inherit command
+        """
+        return "litp inherit -p {0} -s {1} {2}".format(url, source_path,
+                                                       props)
+
+
+class FakeNode(object):
+    """
+        Runs model batch scripts: every litp command whose path contains
+        "invalid" fails with a validation error, the others succeed
+    """
+
+    def __init__(self):
+        self.cmds = []
+
+    def run_command(self, node, cmd):
+        """
+            Returns the output a node gives for a batch script
+        """
+        self.cmds.append(cmd)
+        if len(cmd) >= MAX_ARG_STRLEN:
+            return [], ["/bin/sh: Argument list too long"], 126
+        stdout = []
+        for action, url, index in ITEM_REGEX.findall(cmd):
+            if "invalid" in url:
+                stdout.append("/{0}".format(url))
+                stdout.append("ValidationError    Invalid value.")
+                stdout.append("{0} {1} 1".format(BATCH_MARKER, index))
+            else:
+                stdout.append("{0} {1} 0".format(BATCH_MARKER, index))
+        return stdout, [], 0
+
+
+def get_batch(count, invalid=()):
+    """
+        Returns a batch creating count managed-files, the ones at the
+        indexes in invalid with a path the fake node rejects
+    """
+    batch = ModelBatch(StubCLI())
+    for index in xrange(count):
+        name = "{0}_file{1}".format("invalid" if index in invalid
+                                    else "story302742_unit", index)
+        batch.create("/infrastructure/items/{0}".format(name),
+                     "managed-file", "path={0} mode=0644".format(
+                         FILE_PATH.format(index)))
+    return batch
+
+
+class ModelBatchUnit(unittest.TestCase):
+    """
+        Model batches and bulk file commands checked without a deployment
+    """
+
+    @attr('all', 'unit')
+    def test_01_batch_output_attributed_to_items(self):
+        """
+            The output and return code of each command are attributed to
+            its item and the batch is emptied
+        """
+        node = FakeNode()
+        batch = get_batch(5, invalid=(1, 3))
+        items = batch.flush(node.run_command, "ms1")
+        self.assertEqual(1, len(node.cmds))
+        self.assertEqual(0, len(batch))
+        self.assertEqual([0, 1, 0, 1, 0], [item.rc for item in items])
+        self.assertEqual([], items[0].output)
+        self.assertEqual(2, len(items[1].output))
+        self.assertTrue(items[1].output[0].endswith("invalid_file1"))
+
+    @attr('all', 'unit')
+    def test_02_batch_larger_than_argument_limit(self):
+        """
+            A batch whose single script would exceed the argument limit is
+            run as several scripts below it, each item once and in order
+        """
+        batch = get_batch(2000, invalid=(1999,))
+        self.assertTrue(len("; ".join(batch.get_cmds(10 ** 9))) >
+                        MAX_ARG_STRLEN)
+        node = FakeNode()
+        items = batch.flush(node.run_command, "ms1")
+        self.assertTrue(len(node.cmds) > 1)
+        self.assertEqual([], [len(cmd) for cmd in node.cmds
+                              if len(cmd) > MAX_CMD_BYTES])
+        self.assertEqual([0] * 1999 + [1], [item.rc for item in items])
+        indexes = [int(index) for cmd in node.cmds
+                   for _, _, index in ITEM_REGEX.findall(cmd)]
+        self.assertEqual(range(2000), indexes)
+
+    @attr('all', 'unit')
+    def test_03_unsplit_batch_fails_on_argument_limit(self):
+        """
+            The fake node rejects a script over the argument limit, so its
+            items never run
+        """
+        items = get_batch(2000).flush(FakeNode().run_command, "ms1",
+                                      max_bytes=10 ** 9)
+        self.assertEqual(set([None]), set(item.rc for item in items))
+
+    @attr('all', 'unit')
+    def test_04_bulk_file_commands_below_argument_limit(self):
+        """
+            Creating, stating and removing thousands of files takes several
+            commands, each below the limit and covering every file once
+        """
+        files = dict((FILE_PATH.format(index), ["line {0}".format(index % 3)])
+                     for index in xrange(5000))
+        for cmds in (get_bulk_create_files_cmds(files),
+                     get_file_modes_cmds(sorted(files)),
+                     get_remove_files_cmds(files)):
+            self.assertTrue(len(cmds) > 1)
+            self.assertEqual([], [len(cmd) for cmd in cmds
+                                  if len(cmd) > MAX_CMD_BYTES])
+            words = " ".join(cmds).split()
+            self.assertEqual([], [path for path in files
+                                  if path not in words])
+        created = parse_bulk_create_files_output(
+            ["CREATED {0}".format(path) for path in sorted(files)],
+            files.keys())
+        self.assertTrue(all(created.values()))
+        self.assertEqual(1, len(get_file_modes_cmds(["/tmp/a", "/tmp/b"])))
@@ -0,0 +1,149 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of node_executor against a fake run_command with the
+            latency of a remote command, and against a fake GenericTest
+            whose run_command breaks when two threads enter it
+"""
+
+import threading
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+from node_executor import NodeExecutor, SerialCommandMixin
+
+NODES = ["ms1", "node1", "node2", "node3", "node4", "node5"]
+LATENCY_SECS = 0.2
+
+
+class LatentNodes(object):
+    """
+        Fake run_command taking LATENCY_SECS per call, which counts how
+        many calls overlap
+    """
+
+    def __init__(self, failing=()):
+        self.failing = failing
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run_command(self, node, cmd):
+        """
+            Returns the output of a command on a node, raising on the
+            failing nodes
+        """
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(LATENCY_SECS)
+            if node in self.failing:
+                raise IOError("Connection to {0} lost".format(node))
+            return ["{0}: {1}".format(node, cmd)], [], 0
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class SharedConnectionTest(object):
+    """
+        Fake GenericTest keeping the connection of its run_command in shared
+        state, which a second thread entering it takes over
+    """
+
+    def __init__(self):
+        self.connected_node = None
+        self.crossed = []
+
+    def run_command(self, node, cmd):
+        """
+            Connects to the node and returns the output of the command from
+            the node still connected once it finished
+        """
+        self.connected_node = node
+        time.sleep(LATENCY_SECS / 4)
+        if self.connected_node != node:
+            self.crossed.append(node)
+        return ["{0}: {1}".format(self.connected_node, cmd)], [], 0
+
+
+class SerialSharedConnectionTest(SerialCommandMixin, SharedConnectionTest):
+    """
+        Fake GenericTest whose run_command is serialised between threads
+    """
+
+
+class NodeExecutorUnit(unittest.TestCase):
+    """
+        Node fan-out checked without a deployment
+    """
+
+    @attr('all', 'unit')
+    def test_01_nodes_run_concurrently(self):
+        """
+            Commands on several nodes overlap, bounded by max_workers, so
+            the run takes about the latency of the slowest batch of nodes
+        """
+        nodes = LatentNodes()
+        start = time.time()
+        results = NodeExecutor(max_workers=3).run(nodes.run_command, NODES,
+                                                  "hostname")
+        elapsed = time.time() - start
+        self.assertEqual(3, nodes.peak)
+        self.assertTrue(elapsed < LATENCY_SECS * len(NODES) / 2, elapsed)
+        self.assertEqual([], results.failed_nodes)
+        self.assertEqual((["node2: hostname"], [], 0), results["node2"])
+
+    @attr('all', 'unit')
+    def test_02_node_errors_recorded(self):
+        """
+            A node raising does not stop the others, its error is recorded
+            against it
+        """
+        results = NodeExecutor().run(
+            LatentNodes(failing=("node3", "node1")).run_command, NODES,
+            "hostname")
+        self.assertEqual(["node1", "node3"], results.failed_nodes)
+        self.assertEqual(sorted(set(NODES) - set(["node1", "node3"])),
+                         sorted(results.results))
+        self.assertTrue(isinstance(results.errors["node1"][0], IOError))
+        self.assertEqual("node1: IOError: Connection to node1 lost\n"
+                         "node3: IOError: Connection to node3 lost",
+                         results.get_error_summary())
+
+    @attr('all', 'unit')
+    def test_03_single_worker_runs_in_turn(self):
+        """
+            With one worker the nodes run one at a time, and at least one
+            worker is required
+        """
+        nodes = LatentNodes()
+        results = NodeExecutor(max_workers=1).run(nodes.run_command,
+                                                  NODES[:2], "hostname")
+        self.assertEqual(1, nodes.peak)
+        self.assertEqual(NODES[:2], sorted(results.results))
+        self.assertRaises(ValueError, NodeExecutor, 0)
+
+    @attr('all', 'unit')
+    def test_04_serialised_run_command_safe_on_threads(self):
+        """
+            A run_command sharing its connection between threads returns the
+            output of other nodes when ran on several threads at once, and
+            the right output of every node once serialised
+        """
+        shared = SharedConnectionTest()
+        NodeExecutor().run(shared.run_command, NODES, "hostname")
+        self.assertNotEqual([], shared.crossed)
+        serial = SerialSharedConnectionTest()
+        results = NodeExecutor().run(serial.run_command, NODES, "hostname")
+        self.assertEqual([], serial.crossed)
+        self.assertEqual(["{0}: hostname".format(node) for node in NODES],
+                         [results[node][0][0] for node in NODES])
@@ -0,0 +1,70 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of the plan lock, held by this process against a
+            second process trying to take it
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from nose.plugins.attrib import attr
+from parallel_utils import PlanLock
+
+# Exits 1 if the lock file given as argument is held by another process
+TRY_LOCK_SCRIPT = """
+import fcntl, sys
+try:
+    fcntl.flock(open(sys.argv[1], "a"), fcntl.LOCK_EX | fcntl.LOCK_NB)
+except IOError:
+    sys.exit(1)
+"""
+
+
+class PlanLockUnit(unittest.TestCase):
+    """
+        Plan lock checked against another process
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="parallel_utils_unit_")
+        self.lock_path = os.path.join(self.tmp_dir, "plan.lock")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def is_free_for_other_process(self):
+        """
+            Returns True if another process can take the lock
+        """
+        return 0 == subprocess.call([sys.executable, "-c", TRY_LOCK_SCRIPT,
+                                     self.lock_path])
+
+    @attr('all', 'unit')
+    def test_01_nested_holds_release_once_all_released(self):
+        """
+            The lock taken again while held stays held until released as
+            many times, other processes then take it
+        """
+        lock = PlanLock(self.lock_path)
+        with lock:
+            lock.acquire()
+            self.assertFalse(self.is_free_for_other_process())
+            lock.release()
+            self.assertTrue(lock.held)
+            self.assertFalse(self.is_free_for_other_process())
+        self.assertFalse(lock.held)
+        self.assertTrue(self.is_free_for_other_process())
+        self.assertTrue(lock.held_secs > 0)
+        lock.release()
+        self.assertFalse(lock.held)
@@ -0,0 +1,129 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of plan_waiter against a scripted plan and a fake
+            clock, so the poll intervals are checked without waiting
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+from plan_waiter import PlanWaiter
+
+TASK_A = ("/ms/items/file_a", "Create file_a")
+TASK_B = ("/ms/items/file_b", "Create file_b")
+
+
+class FakeClock(object):
+    """
+        Clock that only moves when slept on
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        """
+            Returns the current time
+        """
+        return self.now
+
+    def sleep(self, secs):
+        """
+            Moves the clock forward
+        """
+        self.sleeps.append(secs)
+        self.now += secs
+
+
+class ScriptedPlan(object):
+    """
+        Returns one scripted (status, task states) per poll, repeating the
+        last one
+    """
+
+    def __init__(self, polls):
+        self.polls = list(polls)
+
+    def poll(self):
+        """
+            Returns the plan state of the next poll
+        """
+        if len(self.polls) > 1:
+            return self.polls.pop(0)
+        return self.polls[0]
+
+
+def get_waiter(polls, clock):
+    """
+        Returns a PlanWaiter polling the scripted plan on the fake clock
+    """
+    return PlanWaiter(ScriptedPlan(polls).poll, initial_interval=1.0,
+                      max_interval=4.0, backoff=2.0, clock=clock.time,
+                      sleep=clock.sleep)
+
+
+class PlanWaiterUnit(unittest.TestCase):
+    """
+        Plan polling checked without a deployment
+    """
+
+    @attr('all', 'unit')
+    def test_01_interval_backs_off_and_resets(self):
+        """
+            The interval grows while nothing changes, up to the maximum,
+            and drops back once a task changes state. Task timings come
+            from the polls that saw them change.
+        """
+        running = ("Running", {TASK_A: "Running", TASK_B: "Initial"})
+        polls = [running] * 5 + [
+            ("Running", {TASK_A: "Success", TASK_B: "Running"}),
+            ("Successful", {TASK_A: "Success", TASK_B: "Success"})]
+        clock = FakeClock()
+        result = get_waiter(polls, clock).wait(60)
+        self.assertEqual([1.0, 2.0, 4.0, 4.0, 4.0, 1.0], clock.sleeps)
+        self.assertEqual(("Successful", 7, 16.0, False),
+                         (result.status, result.polls, result.elapsed,
+                          result.timed_out))
+        self.assertEqual(15.0, result.task_timings[TASK_A].duration)
+        self.assertEqual(1.0, result.task_timings[TASK_B].duration)
+
+    @attr('all', 'unit')
+    def test_02_fail_fast_stops_at_first_failed_task(self):
+        """
+            With fail_fast the wait ends as soon as a task fails, without
+            it the plan is waited for until it finishes
+        """
+        polls = [("Running", {TASK_A: "Running", TASK_B: "Initial"}),
+                 ("Running", {TASK_A: "Failed", TASK_B: "Running"}),
+                 ("Running", {TASK_A: "Failed", TASK_B: "Running"}),
+                 ("Failed", {TASK_A: "Failed", TASK_B: "Success"})]
+        result = get_waiter(polls, FakeClock()).wait(60, fail_fast=True)
+        self.assertEqual(("Running", 2, True, False),
+                         (result.status, result.polls, result.aborted,
+                          result.timed_out))
+        self.assertEqual([TASK_A[0]], [timing.url for timing in
+                                       result.get_failed_tasks()])
+        result = get_waiter(polls, FakeClock()).wait(60)
+        self.assertEqual(("Failed", 4, False),
+                         (result.status, result.polls, result.aborted))
+
+    @attr('all', 'unit')
+    def test_03_timeout(self):
+        """
+            A plan that does not finish is waited for until the timeout,
+            the last sleep is cut short to end on it
+        """
+        clock = FakeClock()
+        result = get_waiter([("Running", {TASK_A: "Running"})],
+                            clock).wait(10)
+        self.assertTrue(result.timed_out)
+        self.assertEqual(10.0, result.elapsed)
+        self.assertEqual([1.0, 2.0, 4.0, 3.0], clock.sleeps)
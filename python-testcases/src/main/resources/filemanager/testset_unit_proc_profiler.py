@@ -0,0 +1,62 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of proc_profiler against /proc samples as a node
+            prints them for root and for another user
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+from proc_profiler import ProcProfile, parse_proc_sample
+
+
+def get_sample(busy, litpd_ticks, litpd_io):
+    """
+        Returns the output of the sample command with a litpd process, its
+        I/O left empty when litpd_io is None
+    """
+    io_bytes = "" if litpd_io is None else "{0} 0 ".format(litpd_io)
+    return ["clk_tck 100",
+            "cpu  {0} 0 0 800 0 0 0 0 0 0".format(busy),
+            "litpd {0} 0 : 2048 : {1}".format(litpd_ticks, io_bytes)]
+
+
+class ProcProfileUnit(unittest.TestCase):
+    """
+        /proc samples checked without a node
+    """
+
+    @attr('all', 'unit')
+    def test_01_io_of_processes_readable(self):
+        """
+            The CPU, memory and I/O of a process are summed between samples
+        """
+        profile = ProcProfile("ms1", ("litpd",))
+        profile.add(10.0, parse_proc_sample(get_sample(100, 50, 4096)))
+        profile.add(12.0, parse_proc_sample(get_sample(300, 250, 6144)))
+        self.assertEqual({"host_cpu_busy_secs": 2.0, "litpd_cpu_secs": 2.0,
+                          "litpd_rss_peak_kb": 2048,
+                          "litpd_io_bytes": 2048}, profile.get_metrics())
+
+    @attr('all', 'unit')
+    def test_02_io_unreadable_without_root(self):
+        """
+            A sample taken by a user that cannot read the I/O of a process
+            is kept, with the I/O left out rather than failing the sample
+        """
+        sample = parse_proc_sample(get_sample(100, 50, None))
+        self.assertEqual([50, 2048, None, 1], sample["litpd"])
+        profile = ProcProfile("ms1", ("litpd",))
+        profile.add(10.0, sample)
+        profile.add(12.0, parse_proc_sample(get_sample(300, 250, 6144)))
+        self.assertEqual([[2.0, 100.0, 100.0, 2048, None]],
+                         profile.get_rows())
+        self.assertEqual({"host_cpu_busy_secs": 2.0, "litpd_cpu_secs": 2.0,
+                          "litpd_rss_peak_kb": 2048}, profile.get_metrics())
@@ -0,0 +1,221 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unit tests of ssh_pool against a fake transport whose channels
+            deliver the output of a command in the order a remote shell
+            writes it
+"""
+
+import unittest
+
+from nose.plugins.attrib import attr
+from ssh_pool import SSHConnectionPool, RECV_BYTES, get_known_host_key
+
+
+class FakeChannel(object):
+    """
+        Channel delivering a scripted sequence of ("out" | "err", data)
+        chunks. Like a channel whose window is full, it holds back every
+        later chunk until the one at the front has been read.
+    """
+
+    def __init__(self, chunks, rc):
+        self.chunks = list(chunks)
+        self.rc = rc
+        self.cmd = None
+        self.closed = False
+
+    def exec_command(self, cmd):
+        """
+            Starts the command
+        """
+        self.cmd = cmd
+
+    def _next_chunk(self, stream):
+        """
+            Returns the chunk at the front if it is of stream, else None
+        """
+        if self.chunks and self.chunks[0][0] == stream:
+            return self.chunks[0]
+        return None
+
+    def _recv(self, stream, nbytes):
+        """
+            Reads at most nbytes of the chunk at the front
+        """
+        data = self._next_chunk(stream)[1]
+        if len(data) > nbytes:
+            self.chunks[0] = (stream, data[nbytes:])
+        else:
+            self.chunks.pop(0)
+        return data[:nbytes]
+
+    def recv_ready(self):
+        """
+            Returns True if stdout data can be read
+        """
+        return self._next_chunk("out") is not None
+
+    def recv_stderr_ready(self):
+        """
+            Returns True if stderr data can be read
+        """
+        return self._next_chunk("err") is not None
+
+    def recv(self, nbytes):
+        """
+            Reads stdout data
+        """
+        return self._recv("out", nbytes)
+
+    def recv_stderr(self, nbytes):
+        """
+            Reads stderr data
+        """
+        return self._recv("err", nbytes)
+
+    def exit_status_ready(self):
+        """
+            Returns True once every chunk has been read
+        """
+        return not self.chunks
+
+    def recv_exit_status(self):
+        """
+            Returns the return code of the command
+        """
+        assert not self.chunks, "Command has not exited"
+        return self.rc
+
+    def close(self):
+        """
+            Closes the channel
+        """
+        self.closed = True
+
+
+class FakeTransport(object):
+    """
+        Transport opening the channels it was given in turn
+    """
+
+    def __init__(self, channels):
+        self.channels = list(channels)
+        self.active = True
+
+    def is_active(self):
+        """
+            Returns False once the transport was dropped
+        """
+        return self.active
+
+    def open_session(self):
+        """
+            Returns the next channel
+        """
+        return self.channels.pop(0)
+
+    def close(self):
+        """
+            Closes the transport
+        """
+        self.active = False
+
+
+class FakeHostKeys(object):
+    """
+        known_hosts entries keyed by host name, like paramiko.HostKeys
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def lookup(self, name):
+        """
+            Returns the keys of a host keyed by key type, None if unknown
+        """
+        return self.entries.get(name)
+
+
+class SSHConnectionPoolUnit(unittest.TestCase):
+    """
+        SSH connection pool checked without a deployment
+    """
+
+    @attr('all', 'unit')
+    def test_01_stdout_and_stderr_read_as_they_arrive(self):
+        """
+            Output interleaved on stdout and stderr, with stderr first and
+            larger than one read, is all returned in order with the return
+            code, and the channel is closed
+        """
+        big_err = "e" * (RECV_BYTES * 2 + 5)
+        channel = FakeChannel([("err", big_err + "\n"), ("out", "line 1\n"),
+                               ("err", "warning\n"), ("out", "line 2")], 3)
+        pool = SSHConnectionPool(lambda node: FakeTransport([channel]))
+        stdout, stderr, rc = pool.run_command("node1", "some command")
+        self.assertEqual("some command", channel.cmd)
+        self.assertEqual(["line 1", "line 2"], stdout)
+        self.assertEqual([big_err, "warning"], stderr)
+        self.assertEqual(3, rc)
+        self.assertTrue(channel.closed)
+
+    @attr('all', 'unit')
+    def test_02_command_without_output(self):
+        """
+            A command printing nothing returns empty output
+        """
+        pool = SSHConnectionPool(
+            lambda node: FakeTransport([FakeChannel([], 0)]))
+        self.assertEqual(([], [], 0), pool.run_command("node1", "true"))
+
+    @attr('all', 'unit')
+    def test_03_transport_reused_until_dropped(self):
+        """
+            The transport of a node is reused while active, reopened once
+            dropped, and every transport is closed with the pool
+        """
+        transports = []
+
+        def connect(node):
+            """
+                Opens a transport with channels for two commands
+            """
+            transports.append(FakeTransport(
+                [FakeChannel([("out", node)], 0) for _ in xrange(2)]))
+            return transports[-1]
+
+        pool = SSHConnectionPool(connect)
+        self.assertEqual(["node1"], pool.run_command("node1", "hostname")[0])
+        self.assertEqual(["node1"], pool.run_command("node1", "hostname")[0])
+        transports[0].close()
+        self.assertEqual(["node1"], pool.run_command("node1", "hostname")[0])
+        self.assertEqual(["node2"], pool.run_command("node2", "hostname")[0])
+        self.assertEqual({"opened": 3, "reused": 1}, pool.get_stats())
+        pool.close()
+        self.assertEqual([False] * 3,
+                         [transport.is_active() for transport in transports])
+
+    @attr('all', 'unit')
+    def test_04_host_key_from_known_hosts(self):
+        """
+            The key a node must present is the one known_hosts holds for
+            its address, under [address]:port for another port than 22,
+            and a node missing from known_hosts has none
+        """
+        host_keys = FakeHostKeys({
+            "10.0.0.1": {"ssh-rsa": "rsa key", "ecdsa-sha2-nistp256":
+                         "ecdsa key"},
+            "[10.0.0.2]:2222": {"ssh-rsa": "port key"}})
+        self.assertEqual("ecdsa key", get_known_host_key(host_keys,
+                                                         "10.0.0.1", 22))
+        self.assertEqual("port key", get_known_host_key(host_keys,
+                                                        "10.0.0.2", "2222"))
+        self.assertEqual(None, get_known_host_key(host_keys, "10.0.0.2"))
+        self.assertEqual(None, get_known_host_key(host_keys, "10.0.0.3"))